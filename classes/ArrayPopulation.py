@@ -0,0 +1,485 @@
+from typing import List, Optional, Tuple
+from classes.Entity import Entity
+from classes.Selection import SelectionStrategy, TournamentSelection, select_with_elite
+import random
+import numpy as np
+
+
+class ArrayPopulation:
+    """
+    Structure-of-arrays population backend.
+
+    All genomes are stored as rows of one 2-D int matrix with parallel
+    arrays for fitness and weight, so selection, crossover, mutation and
+    validity checks work on row indices and genome batches instead of
+    Entity objects. Entity instances are only built on demand as snapshots
+    of a row for the list-based API (``get_entities``, migration, best
+    entity tracking).
+
+    Args:
+        genomes (np.array): Matrix of shape (population, items) with the item counts.
+        min_value (np.array): The minimum value constraints for every item.
+        max_weight (int): The maximum allowable weight of a knapsack.
+        weights (np.array): An array representing the weights of the items.
+        costs (np.array): An array representing the costs of the items.
+        mutation_probability (float): The mutation probability (same semantics as Entity.mutate).
+        desired_amount (int): Size of the population after selection.
+        tournament_size (int): Number of contestants in one tournament.
+        fitness (np.array, optional): Precomputed fitness of the rows.
+        weight (np.array, optional): Precomputed weight of the rows.
+        rng (np.random.Generator, optional): Random generator, derived from ``random`` if omitted.
+        distance_cache (bool): Keep a pairwise squared-distance matrix for outbreeding.
+        distances (np.array, optional): Precomputed distance matrix of the rows (enables the cache).
+        capacity (int, optional): Number of rows to preallocate.
+    """
+
+    def __init__(self,
+                 genomes: np.ndarray,
+                 min_value: np.ndarray,
+                 max_weight: int,
+                 weights: np.ndarray,
+                 costs: np.ndarray,
+                 mutation_probability: float,
+                 desired_amount: int,
+                 tournament_size: int,
+                 fitness: Optional[np.ndarray] = None,
+                 weight: Optional[np.ndarray] = None,
+                 rng: Optional[np.random.Generator] = None,
+                 distance_cache: bool = False,
+                 distances: Optional[np.ndarray] = None,
+                 capacity: Optional[int] = None):
+        self.min_value = np.asarray(min_value)
+        self.max_weight = max_weight
+        self.weights = np.asarray(weights)
+        self.costs = np.asarray(costs)
+        self.mutation_probability = mutation_probability
+        self.desired_amount = desired_amount
+        self.tournament_size = tournament_size
+        # Привязываем numpy-генератор к модулю random, чтобы random.seed управлял обоими
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+        genomes = np.asarray(genomes, dtype=np.int64).reshape(-1, self.weights.size)
+        if fitness is None or weight is None:
+            fitness, weight = self.evaluate(genomes)
+
+        self.size = 0
+        # Лучшая строка (индекс, fitness), поддерживается при добавлении и удалении строк
+        self._best_index = None
+        self._best_fitness = None
+        self._genomes = np.empty((0, self.weights.size), dtype=np.int64)
+        self._fitness = np.empty(0, dtype=np.result_type(np.int64, self.costs.dtype))
+        self._weight = np.empty(0, dtype=np.result_type(np.int64, self.weights.dtype))
+
+        # Матрица квадратов расстояний между строками, поддерживается инкрементально
+        self.distance_cache = distance_cache or distances is not None
+        self._distances = np.empty((0, 0), dtype=np.float64)
+        # float64-копия геномов и их квадраты норм для BLAS-обновлений матрицы
+        self._points = np.empty((0, self.weights.size), dtype=np.float64)
+        self._norms = np.empty(0, dtype=np.float64)
+
+        self._reserve(max(len(genomes), capacity or 0))
+        self._append(genomes, fitness, weight)
+        if self.distance_cache:
+            self._update_distances(0, distances)
+
+    @classmethod
+    def from_entities(cls, entities: List[Entity], desired_amount: int, tournament_size: int, distance_cache: bool = False) -> 'ArrayPopulation':
+        first = entities[0]
+        return cls(
+            genomes=np.array([entity.current_state for entity in entities]),
+            min_value=first.min_value,
+            max_weight=first.max_weight,
+            weights=first.weights,
+            costs=first.costs,
+            mutation_probability=first.mutation_probability,
+            desired_amount=desired_amount,
+            tournament_size=tournament_size,
+            distance_cache=distance_cache
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def genomes(self) -> np.ndarray:
+        return self._genomes[:self.size]
+
+    @property
+    def fitness(self) -> np.ndarray:
+        return self._fitness[:self.size]
+
+    @property
+    def weight(self) -> np.ndarray:
+        return self._weight[:self.size]
+
+    def evaluate(self, genomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute fitness and weight of a batch of genomes with two mat-vec products.
+        """
+        return genomes @ self.costs, genomes @ self.weights
+
+    def _reserve(self, capacity: int):
+        if capacity <= self._genomes.shape[0]:
+            return
+        capacity = max(capacity, 2 * self._genomes.shape[0])
+        genomes = np.empty((capacity, self.weights.size), dtype=np.int64)
+        fitness = np.empty(capacity, dtype=self._fitness.dtype)
+        weight = np.empty(capacity, dtype=self._weight.dtype)
+        genomes[:self.size] = self.genomes
+        fitness[:self.size] = self.fitness
+        weight[:self.size] = self.weight
+        self._genomes, self._fitness, self._weight = genomes, fitness, weight
+
+        if self.distance_cache:
+            distances = np.empty((capacity, capacity), dtype=np.float64)
+            points = np.empty((capacity, self.weights.size), dtype=np.float64)
+            norms = np.empty(capacity, dtype=np.float64)
+            distances[:self.size, :self.size] = self._distances[:self.size, :self.size]
+            points[:self.size] = self._points[:self.size]
+            norms[:self.size] = self._norms[:self.size]
+            self._distances, self._points, self._norms = distances, points, norms
+
+    def _append(self, genomes: np.ndarray, fitness: np.ndarray, weight: np.ndarray):
+        count = len(genomes)
+        self._reserve(self.size + count)
+        self._genomes[self.size:self.size + count] = genomes
+        self._fitness[self.size:self.size + count] = fitness
+        self._weight[self.size:self.size + count] = weight
+        self._update_best(self.size, self.size + count)
+        self.size += count
+
+    def _update_best(self, start: int, stop: int):
+        """
+        Take rows ``start:stop`` into account in the running best row.
+        """
+        if stop <= start:
+            return
+        index = start + int(np.argmax(self._fitness[start:stop]))
+        if self._best_index is None or self._fitness[index] > self._best_fitness:
+            self._best_index = index
+            self._best_fitness = self._fitness[index]
+
+    def _update_distances(self, start: int, distances: Optional[np.ndarray] = None):
+        """
+        Fill distance matrix rows and columns of the rows appended from ``start`` on.
+
+        Only the new block is computed (norms-plus-Gram of the new rows
+        against the whole population), the rest of the matrix is left
+        untouched. ``distances`` replaces the computation when the block is
+        already known (e.g. gathered from a parent population).
+        """
+        # float64 включает BLAS; для количеств предметов значения остаются точными
+        points = self._points[start:self.size]
+        points[:] = self._genomes[start:self.size]
+        self._norms[start:self.size] = np.einsum('ij,ij->i', points, points)
+
+        if distances is None:
+            norms = self._norms[:self.size]
+            distances = norms[start:, None] + norms[None, :] - 2 * (points @ self._points[:self.size].T)
+        self._distances[start:self.size, :self.size] = distances
+        if start > 0:
+            self._distances[:start, start:self.size] = distances[:, :start].T
+
+    def add_genomes(self, genomes: np.ndarray, fitness: Optional[np.ndarray] = None, weight: Optional[np.ndarray] = None):
+        """
+        Append a batch of genome rows to the population.
+        """
+        count = len(genomes)
+        if count == 0:
+            return
+        if fitness is None or weight is None:
+            fitness, weight = self.evaluate(genomes)
+        start = self.size
+        self._append(genomes, fitness, weight)
+        if self.distance_cache:
+            self._update_distances(start)
+
+    def take(self, indices: np.ndarray) -> 'ArrayPopulation':
+        """
+        Build a new population from the given rows (duplicates allowed).
+
+        The new population keeps the current buffer capacity, so refilling it
+        back to the same size does not reallocate the arrays.
+        """
+        return ArrayPopulation(
+            genomes=self.genomes[indices],
+            min_value=self.min_value,
+            max_weight=self.max_weight,
+            weights=self.weights,
+            costs=self.costs,
+            mutation_probability=self.mutation_probability,
+            desired_amount=self.desired_amount,
+            tournament_size=self.tournament_size,
+            fitness=self.fitness[indices],
+            weight=self.weight[indices],
+            rng=self.rng,
+            distances=self._distances[np.ix_(indices, indices)] if self.distance_cache else None,
+            capacity=self._genomes.shape[0]
+        )
+
+    def get_distances(self, index: int) -> np.ndarray:
+        if self.distance_cache:
+            return self._distances[index, :self.size].copy()
+        return np.sum((self.genomes - self.genomes[index]) ** 2, axis=1)
+
+    def outbreeding(self) -> Tuple[int, int]:
+        random_index = random.randrange(self.size)
+        distances = self.get_distances(random_index)
+        distances[random_index] = -1
+        return random_index, int(np.argmax(distances))
+
+    def run_outbreeding_k_times(self, k: int) -> List[Tuple[int, int]]:
+        return [self.outbreeding() for _ in range(k)]
+
+    def outbreeding_batch(self, k: int) -> np.ndarray:
+        """
+        Pick ``k`` (random row, furthest row) pairs at once.
+
+        Squared distances from the chosen rows to the whole population are
+        read from the distance cache or taken from the norms-plus-Gram
+        identity, so the search is at most one matrix product and one argmax
+        along axis 1.
+
+        Returns:
+            np.array: Matrix of shape (k, 2) with parent row indices.
+        """
+        first = self.rng.integers(0, self.size, size=k)
+        if self.distance_cache:
+            distances = self._distances[first, :self.size]
+        else:
+            genomes = self.genomes.astype(np.float64)
+            norms = np.einsum('ij,ij->i', genomes, genomes)
+            distances = norms[first][:, None] + norms[None, :] - 2 * (genomes[first] @ genomes.T)
+        distances[np.arange(k), first] = -1
+        return np.column_stack((first, np.argmax(distances, axis=1)))
+
+    def two_point_crossover(self, index1: int, index2: int) -> np.ndarray:
+        """
+        Cross two rows and return the two children as a (2, items) matrix.
+        """
+        length = self.weights.size
+        point1, point2 = sorted(random.sample(range(length), 2))
+
+        children = self.genomes[[index1, index2]]
+        children[0, point1:point2] = self.genomes[index2, point1:point2]
+        children[1, point1:point2] = self.genomes[index1, point1:point2]
+        return children
+
+    def two_point_crossover_batch(self, pairs: np.ndarray) -> np.ndarray:
+        """
+        Cross every (parent1, parent2) pair with its own pair of cut points.
+
+        Returns:
+            np.array: Children matrix of shape (2 * len(pairs), items); rows
+            ``2i`` and ``2i + 1`` are the children of ``pairs[i]``.
+        """
+        count = len(pairs)
+        length = self.weights.size
+
+        # Две различные точки разреза для каждой пары, как sorted(random.sample(range(length), 2))
+        point1 = self.rng.integers(0, length, size=count)
+        point2 = self.rng.integers(0, length - 1, size=count)
+        point2 += point2 >= point1
+        point1, point2 = np.minimum(point1, point2), np.maximum(point1, point2)
+
+        positions = np.arange(length)
+        swap = (positions >= point1[:, None]) & (positions < point2[:, None])
+
+        parents1 = self.genomes[pairs[:, 0]]
+        parents2 = self.genomes[pairs[:, 1]]
+        children = np.empty((2 * count, length), dtype=np.int64)
+        children[0::2] = np.where(swap, parents2, parents1)
+        children[1::2] = np.where(swap, parents1, parents2)
+        return children
+
+    def generate_offspring(self, amount: int, repair_operator=None, max_attempts: Optional[int] = None) -> dict:
+        """
+        Add ``amount`` valid children to the population in batched rounds.
+
+        Every round draws all parent pairs, cut points and mutation moves for
+        the missing children as array operations, evaluates them with one
+        mat-vec product and keeps the feasible ones. Overweight children are
+        fixed by ``repair_operator`` (a RepairOperator) if one is given.
+        Rounds are repeated only while infeasible children leave the
+        population short; the next round is oversized by the observed
+        acceptance rate. At most ``max_attempts`` parent pairs are drawn in
+        total, so the population may stay short when the budget runs out.
+
+        Returns:
+            dict: counters ``attempts`` (parent pairs), ``children``, ``feasible``,
+            ``repaired`` and ``accepted`` (children added to the population).
+        """
+        stats = {'attempts': 0, 'children': 0, 'feasible': 0, 'repaired': 0, 'accepted': 0}
+        acceptance_rate = 1.0
+        while amount > 0:
+            count = int(np.ceil(amount / (2 * acceptance_rate)))
+            if max_attempts is not None:
+                count = min(count, max_attempts - stats['attempts'])
+                if count <= 0:
+                    break
+            pairs = self.outbreeding_batch(count)
+            children = self.two_point_crossover_batch(pairs)
+            fitness, weight = self.evaluate(children)
+            self.mutate(children, fitness, weight)
+            if repair_operator is not None:
+                stats['repaired'] += int(repair_operator.repair(children, fitness, weight).sum())
+            valid = np.flatnonzero(self.check_validity(children, weight))
+            acceptance_rate = max(len(valid) / len(children), 0.125)
+            stats['attempts'] += len(pairs)
+            stats['children'] += len(children)
+            stats['feasible'] += len(valid)
+
+            valid = valid[:amount]
+            self.add_genomes(children[valid], fitness[valid], weight[valid])
+            stats['accepted'] += len(valid)
+            amount -= len(valid)
+        return stats
+
+    def mutate(self, genomes: np.ndarray, fitness: np.ndarray, weight: np.ndarray):
+        """
+        Mutate a batch of genomes in place, keeping fitness and weight in sync.
+
+        Every row follows Entity.mutate: it is skipped with probability
+        ``mutation_probability``, otherwise up to ``items`` random (gene, ±1)
+        candidates are drawn and the first one that respects ``min_value``
+        and ``max_weight`` is applied.
+        """
+        count, length = genomes.shape
+        if count == 0:
+            return
+
+        genes = self.rng.integers(0, length, size=(count, length))
+        deltas = self.rng.choice(np.array([-1, 1]), size=(count, length))
+        rows = np.arange(count)[:, None]
+
+        can_decrease = (deltas < 0) & (genomes[rows, genes] - 1 >= self.min_value[genes])
+        can_increase = (deltas > 0) & (weight[:, None] + self.weights[genes] <= self.max_weight)
+        feasible = can_decrease | can_increase
+
+        mutated = (self.rng.random(count) >= self.mutation_probability) & feasible.any(axis=1)
+        rows = np.flatnonzero(mutated)
+        first = np.argmax(feasible[rows], axis=1)
+        gene = genes[rows, first]
+        delta = deltas[rows, first]
+
+        genomes[rows, gene] += delta
+        fitness[rows] += delta * self.costs[gene]
+        weight[rows] += delta * self.weights[gene]
+
+    def check_validity(self, genomes: np.ndarray, weight: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Return a boolean mask of the genomes that satisfy the weight and minimum constraints.
+        """
+        if weight is None:
+            weight = genomes @ self.weights
+        return (weight <= self.max_weight) & np.all(genomes >= self.min_value, axis=1)
+
+    def tournament_population(self) -> 'ArrayPopulation':
+        return self.select_population(TournamentSelection(self.tournament_size, self.rng))
+
+    def select_population(self, strategy: SelectionStrategy, offspring_start: int = 0, elite: int = 0) -> 'ArrayPopulation':
+        """
+        Build the next population from ``desired_amount`` rows chosen by a selection strategy.
+
+        Args:
+            strategy (SelectionStrategy): Selection strategy working on the fitness array.
+            offspring_start (int): Index of the first child of the current generation.
+            elite (int): Number of best rows carried over without selection.
+        """
+        if self.desired_amount > self.size:
+            raise ValueError("desired_amount cannot be greater than the population size.")
+
+        return self.take(select_with_elite(strategy, self.fitness, self.desired_amount, offspring_start, elite))
+
+    def get_entity(self, index: int) -> Entity:
+        """
+        Build an Entity snapshot of one row with fitness and weight already cached.
+        """
+        return Entity(
+            min_value=self.min_value,
+            max_weight=self.max_weight,
+            weights=self.weights,
+            costs=self.costs,
+            current_state=self.genomes[index].copy(),
+            mutation_probability=self.mutation_probability,
+            fitness=self.fitness[index],
+            current_weight=self.weight[index]
+        )
+
+    def get_population_fitness(self) -> Tuple[Entity, int]:
+        if self._best_index is None:
+            raise ValueError("Population is empty.")
+        return self.get_entity(self._best_index), self._best_fitness
+
+    def get_entities(self) -> List[Entity]:
+        return [self.get_entity(i) for i in range(self.size)]
+
+    def get_fitness_array(self) -> np.ndarray:
+        return self.fitness
+
+    def get_genomes(self) -> np.ndarray:
+        return self.genomes
+
+    def add_entities(self, entities: List[Entity]):
+        if not entities:
+            return
+        self.add_genomes(np.array([entity.current_state for entity in entities]))
+
+    def remove_entities(self, indeces: List[int]):
+        keep = np.ones(self.size, dtype=bool)
+        keep[np.asarray(indeces, dtype=np.int64)] = False
+        remaining = int(keep.sum())
+
+        self._genomes[:remaining] = self.genomes[keep]
+        self._fitness[:remaining] = self.fitness[keep]
+        self._weight[:remaining] = self.weight[keep]
+        if self.distance_cache:
+            self._distances[:remaining, :remaining] = self._distances[:self.size, :self.size][np.ix_(keep, keep)]
+            self._points[:remaining] = self._points[:self.size][keep]
+            self._norms[:remaining] = self._norms[:self.size][keep]
+
+        if self._best_index is not None and keep[self._best_index]:
+            self._best_index = int(keep[:self._best_index].sum())
+        else:
+            self._best_index = None
+            self._update_best(0, remaining)
+        self.size = remaining
+
+    def pop_genomes(self, indices) -> np.ndarray:
+        """
+        Remove the given rows and return a copy of their genomes.
+
+        Swap-remove: the freed slots below the new size are refilled with the
+        surviving rows from the tail in one fancy-indexing move, so only
+        ``len(indices)`` rows (and the matching distance-matrix rows and
+        columns) are touched instead of compacting the whole buffer. The
+        order of the remaining rows changes.
+        """
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        genomes = self._genomes[indices]
+        remaining = self.size - indices.size
+
+        # Tail rows that survive move into the holes left below ``remaining``
+        holes = indices[indices < remaining]
+        in_tail = np.ones(self.size - remaining, dtype=bool)
+        in_tail[indices[indices >= remaining] - remaining] = False
+        movers = remaining + np.flatnonzero(in_tail)
+
+        self._genomes[holes] = self._genomes[movers]
+        self._fitness[holes] = self._fitness[movers]
+        self._weight[holes] = self._weight[movers]
+        if self.distance_cache:
+            self._distances[holes, :self.size] = self._distances[movers, :self.size]
+            self._distances[:self.size, holes] = self._distances[:self.size, movers]
+            self._points[holes] = self._points[movers]
+            self._norms[holes] = self._norms[movers]
+
+        self.size = remaining
+        if self._best_index is not None and self._best_index >= remaining:
+            moved = np.flatnonzero(movers == self._best_index)
+            self._best_index = int(holes[moved[0]]) if moved.size else None
+        elif self._best_index is not None and np.any(holes == self._best_index):
+            self._best_index = None
+        if self._best_index is None:
+            self._update_best(0, remaining)
+        return genomes
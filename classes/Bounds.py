@@ -0,0 +1,101 @@
+import numpy as np
+
+
+class KnapsackBounds:
+    """
+    Быстрые оценки оптимума задачи о рюкзаке с минимальными количествами
+    предметов за O(n log n), без таблицы DP размера max_weight.
+
+    Нижняя оценка - жадное решение (допустимое), верхняя - оптимум
+    линейной релаксации (предметы можно брать дробными количествами).
+    Оптимум задачи всегда лежит между ними.
+
+    Args:
+        constraints: минимальные количества предметов
+        weights: веса предметов
+        costs: стоимости предметов
+        max_weight: вместимость рюкзака
+        max_counts: максимальные количества предметов, None - не ограничены
+    """
+
+    def __init__(self, constraints, weights, costs, max_weight, max_counts=None):
+        self.constraints = np.asarray(constraints, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.costs = np.asarray(costs, dtype=np.int64)
+        self.max_weight = max_weight
+        self.max_counts = None if max_counts is None else np.asarray(max_counts, dtype=np.int64)
+
+        if self.constraints.size != self.weights.size or self.costs.size != self.weights.size:
+            raise ValueError("Длины списков constraints, weights и costs должны совпадать. Недопустимая конфигурация")
+        if self.constraints @ self.weights > max_weight:
+            raise ValueError("Минимальные количества предметов превышают максимальный вес рюкзака. Недопустимая конфигурация.")
+        if self.max_counts is not None and np.any(self.max_counts < self.constraints):
+            raise ValueError("max_counts не может быть меньше минимальных количеств")
+
+        # Предметы в порядке убывания cost/weight
+        self.order = np.argsort(-(self.costs / self.weights), kind='stable')
+
+    def _free_capacity(self):
+        return self.max_weight - int(self.constraints @ self.weights)
+
+    def _extra_limit(self, item):
+        # Сколько единиц предмета можно взять сверх минимума
+        if self.max_counts is None:
+            return None
+        return int(self.max_counts[item] - self.constraints[item])
+
+    def greedy_solution(self):
+        """
+        Жадное решение: после минимальных количеств вместимость заполняется
+        предметами в порядке убывания cost/weight.
+
+        :return: tuple, (fitness, quantities) - как у DPSolver.solve()
+        """
+        quantities = self.constraints.copy()
+        remaining = self._free_capacity()
+        for item in self.order:
+            added = remaining // int(self.weights[item])
+            limit = self._extra_limit(item)
+            if limit is not None:
+                added = min(added, limit)
+            quantities[item] += added
+            remaining -= added * int(self.weights[item])
+        return int(quantities @ self.costs), quantities.tolist()
+
+    def upper_bound(self) -> int:
+        """
+        Верхняя оценка: оптимум линейной релаксации (дробный рюкзак по
+        убыванию cost/weight). Стоимости целые, поэтому оценка округляется вниз.
+
+        :return: int, не меньше оптимума задачи
+        """
+        bound = int(self.constraints @ self.costs)
+        remaining = self._free_capacity()
+        for item in self.order:
+            if remaining <= 0:
+                break
+            weight = int(self.weights[item])
+            limit = self._extra_limit(item)
+            if limit is not None and limit * weight < remaining:
+                bound += limit * int(self.costs[item])
+                remaining -= limit * weight
+                continue
+            # Предмет заполняет остаток вместимости (дробно)
+            return bound + (remaining * int(self.costs[item])) // weight
+        return bound
+
+    def bounds(self):
+        """
+        :return: tuple, (нижняя оценка - fitness жадного решения, верхняя оценка)
+        """
+        return self.greedy_solution()[0], self.upper_bound()
+
+
+def optimality_gap(fitness, upper_bound) -> float:
+    """
+    Относительный разрыв до верхней оценки: (upper_bound - fitness) / upper_bound.
+    Верхняя оценка не меньше оптимума, поэтому разрыв до оптимума не больше этого значения.
+    """
+    if upper_bound <= 0:
+        return 0.0
+    return (upper_bound - fitness) / upper_bound
@@ -0,0 +1,95 @@
+import time
+from typing import List, Optional
+
+
+class ConvergenceMonitor:
+    """
+    Критерии остановки островной модели.
+
+    Следит за улучшениями лучшего fitness каждого острова и всей модели.
+    Остров, не улучшавшийся island_window поколений, выводится из работы
+    (retired), модель останавливается при глобальной стагнации, исчерпании
+    времени, достижении известного оптимума или когда выведены все острова.
+
+    Улучшением считается рост fitness больше чем на epsilon.
+
+    Args:
+        num_islands: количество островов
+        island_window: число поколений без улучшения, после которого остров выводится (None - никогда)
+        global_window: число поколений без улучшения лучшего решения модели до остановки (None - без ограничения)
+        epsilon: минимальный прирост fitness, считающийся улучшением
+        time_limit: ограничение времени работы в секундах (None - без ограничения)
+        target: известный оптимум или верхняя оценка; достигнув его, модель останавливается
+    """
+    REASONS = ('max_iterations', 'target', 'time_limit', 'stagnation', 'islands_retired')
+
+    def __init__(self, num_islands: int, island_window: Optional[int] = None, global_window: Optional[int] = None,
+                 epsilon: float = 0, time_limit: Optional[float] = None, target: Optional[float] = None):
+        for name, window in (('island_window', island_window), ('global_window', global_window)):
+            if window is not None and window < 1:
+                raise ValueError(f"{name} должен быть положительным")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("time_limit должен быть положительным")
+
+        self.num_islands = num_islands
+        self.island_window = island_window
+        self.global_window = global_window
+        self.epsilon = epsilon
+        self.time_limit = time_limit
+        self.target = target
+
+        self.start_time = None
+        self.island_best: List[Optional[float]] = [None] * num_islands
+        self.island_improved = [0] * num_islands
+        self.retired = set()
+        self.best_fitness = None
+        self.improved_iteration = 0
+
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def _improves(self, previous: Optional[float], fitness: float) -> bool:
+        return previous is None or fitness - previous > self.epsilon
+
+    def is_active(self, island_id: int) -> bool:
+        return island_id not in self.retired
+
+    def update_island(self, island_id: int, iteration: int, best_fitness: float) -> bool:
+        """
+        Учесть лучший fitness острова после iteration его поколений.
+
+        :return: True, если остров только что выведен из работы
+        """
+        if island_id in self.retired:
+            return False
+        if self._improves(self.island_best[island_id], best_fitness):
+            self.island_best[island_id] = best_fitness
+            self.island_improved[island_id] = iteration
+            return False
+        if self.island_window is not None and iteration - self.island_improved[island_id] >= self.island_window:
+            self.retired.add(island_id)
+            return True
+        return False
+
+    def update_global(self, iteration: int, best_fitness: float) -> Optional[str]:
+        """
+        Учесть лучший fitness модели после iteration поколений.
+
+        :return: причина остановки из REASONS или None, если работу нужно продолжать
+        """
+        if self._improves(self.best_fitness, best_fitness):
+            self.best_fitness = best_fitness
+            self.improved_iteration = iteration
+
+        if self.target is not None and best_fitness >= self.target:
+            return 'target'
+        if self.time_limit is not None and self.elapsed() >= self.time_limit:
+            return 'time_limit'
+        if self.global_window is not None and iteration - self.improved_iteration >= self.global_window:
+            return 'stagnation'
+        if len(self.retired) == self.num_islands:
+            return 'islands_retired'
+        return None
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+from classes.DPSolver import DPSolver
+
+# Через сколько секунд временный файл, оставшийся от прерванной записи, считается брошенным
+_STALE_TMP_SECONDS = 3600
+
+
+class DPCache:
+    """
+    Дисковый кэш точных решений DPSolver.
+
+    Результат хранится в отдельном JSON файле, имя которого - хэш условий
+    задачи (min_vals, weights, costs, max_weight и max_counts). Когда суммарный
+    размер файлов превышает max_size_bytes, удаляются давно не читавшиеся записи.
+
+    Args:
+        directory: каталог кэша
+        max_size_bytes: максимальный суммарный размер файлов кэша
+        engine: движок DPSolver для промахов кэша
+    """
+
+    def __init__(self, directory: str = 'results/dp_cache', max_size_bytes: int = 64 * 1024 * 1024, engine: str = 'numpy'):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        self.engine = engine
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(min_vals, weights, costs, max_weight, max_counts=None) -> str:
+        """
+        Хэш условий задачи.
+
+        :return: str, sha256 от канонического JSON представления условий
+        """
+        key = {
+            'min_vals': [int(v) for v in min_vals],
+            'weights': [int(v) for v in weights],
+            'costs': [int(v) for v in costs],
+            'max_weight': int(max_weight),
+            'max_counts': None if max_counts is None else [int(v) for v in max_counts]
+        }
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Optional[Tuple[int, List[int]]]:
+        """
+        Найти результат по ключу.
+
+        :return: tuple (fitness, quantities) или None, если записи нет или она повреждена
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            fitness, quantities = int(entry['fitness']), [int(q) for q in entry['quantities']]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError):
+            # Поврежденный или чужой файл: удаляем, чтобы решение пересчиталось и записалось заново
+            self._remove(path)
+            return None
+
+        # Обновляем время доступа для вытеснения давно не используемых записей.
+        # Запись могли вытеснить после чтения - она уже прочитана, это все равно попадание
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return fitness, quantities
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def put(self, key: str, fitness: int, quantities: List[int]):
+        """
+        Сохранить результат и при необходимости освободить место.
+        """
+        entry = {'fitness': int(fitness), 'quantities': [int(q) for q in quantities]}
+
+        # Пишем во временный файл и атомарно переименовываем, чтобы параллельные
+        # процессы не прочитали недописанную запись
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.tmp'):
+                # Временные файлы процессов, упавших во время записи; свежие могут еще дописываться
+                try:
+                    if now - os.stat(path).st_mtime > _STALE_TMP_SECONDS:
+                        self._remove(path)
+                except FileNotFoundError:
+                    pass
+                continue
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            self._remove(path)
+            total_size -= size
+
+    def solve(self, min_vals, weights, costs, max_weight, max_counts=None) -> Tuple[int, List[int]]:
+        """
+        Вернуть точное решение из кэша или посчитать и сохранить его.
+
+        :return: tuple (fitness, quantities), как DPSolver.solve()
+        """
+        key = self.fingerprint(min_vals, weights, costs, max_weight, max_counts)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        fitness, quantities = DPSolver(
+            constraints=min_vals,
+            weights=weights,
+            costs=costs,
+            max_weight=max_weight,
+            engine=self.engine,
+            max_counts=max_counts
+        ).solve()
+        self.put(key, fitness, quantities)
+        return fitness, quantities
+
+    def solve_condition(self, condition: dict) -> Tuple[int, List[int]]:
+        """
+        То же, что solve(), для словаря условий из test_conditions.
+        """
+        return self.solve(
+            min_vals=condition['min_vals'],
+            weights=condition['weights'],
+            costs=condition['costs'],
+            max_weight=condition['max_weight'],
+            max_counts=condition.get('max_counts')
+        )
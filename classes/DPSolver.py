@@ -1,16 +1,84 @@
+import tracemalloc
+import numpy as np
 
 
 class DPSolver:
-    def __init__(self, constraints, weights, costs, max_weight):
+    """
+    Точное решение задачи о рюкзаке с минимальными количествами предметов.
+
+    Args:
+        constraints: минимальные количества предметов
+        weights: веса предметов
+        costs: стоимости предметов
+        max_weight: вместимость рюкзака
+        engine: 'python' - исходный двойной цикл по W x n,
+                'numpy' - векторное обновление массива dp по каждому предмету,
+                'compact' - O(W) памяти, восстановление решения делением пополам (Хиршберг)
+        max_counts: максимальные количества предметов (ограниченный рюкзак),
+                    None - количества не ограничены. Поддерживается engine='numpy' и 'compact'
+        track_memory: измерять пиковую память solve() через tracemalloc (self.peak_memory, байты)
+    """
+    ENGINES = ('python', 'numpy', 'compact')
+
+    def __init__(self, constraints, weights, costs, max_weight, engine='python', max_counts=None, track_memory=False):
         self.constraints = constraints
         self.weights = weights
         self.costs = costs
         self.max_weight = max_weight
+        self.engine = engine
+        self.max_counts = max_counts
+        self.track_memory = track_memory
+        self.peak_memory = None
 
     def solve(self):
+        if self.engine not in self.ENGINES:
+            raise ValueError(f"Неизвестный engine: {self.engine}")
+        if self.engine == 'python' and self.max_counts is not None:
+            raise ValueError("Ограниченный рюкзак (max_counts) не поддерживается engine='python'")
+
+        if not self.track_memory:
+            return self._solve()
+
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            return self._solve()
+        finally:
+            self.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+            if started:
+                tracemalloc.stop()
+
+    def _solve(self):
+        if self.engine == 'numpy':
+            return self._solve_numpy()
+        if self.engine == 'compact':
+            return self._solve_compact()
+        return self._solve_python()
+
+    def estimate_memory(self, engine=None):
+        """
+        Оценка пиковой памяти (в байтах) без запуска решения.
+
+        :param engine: str, движок для оценки, по умолчанию self.engine
+        :return: int, оценка числа байт под таблицы DP
+        """
+        engine = engine or self.engine
+        W, items, multiplicities = self._split_items()
+        if engine == 'python':
+            # список ссылок + объекты int
+            return (W + 1) * (8 + 32)
+        if engine == 'numpy':
+            return 8 * (W + 1) + len(items) * ((W + 8) // 8 + 1) + 2 * 8 * (W + 1)
+        # две строки dp и временные массивы сравнения
+        return 4 * self._row_dtype(items, multiplicities).itemsize * (W + 1)
+
+    def _solve_python(self):
         n = len(self.weights)
         occupied_weight = sum([self.weights[i] * self.constraints[i] for i in range(n)])
-        
+
         W = self.max_weight - occupied_weight
 
         # dp[w] = максимальная стоимость для веса w
@@ -41,4 +109,138 @@ class DPSolver:
             quantities[best_item] += 1
             w -= self.weights[best_item]
 
-        return dp[W] + sum(self.constraints[i] * self.costs[i] for i in range(n)), [quantities[i] + self.constraints[i] for i in range(n)]
\ No newline at end of file
+        return dp[W] + sum(self.constraints[i] * self.costs[i] for i in range(n)), [quantities[i] + self.constraints[i] for i in range(n)]
+
+    def _split_items(self):
+        """
+        Бинарное разбиение количеств предметов сверх минимума.
+
+        Предмет, который можно добавить не более b раз, заменяется 0/1-предметами
+        с кратностями 1, 2, 4, ..., остаток - любое количество от 0 до b
+        набирается их подмножеством. Для неограниченного рюкзака b = W // weight.
+
+        Returns:
+            (W, items, multiplicities): остаточная вместимость, индексы исходных
+            предметов и кратности 0/1-предметов
+        """
+        constraints = np.asarray(self.constraints, dtype=np.int64)
+        weights = np.asarray(self.weights, dtype=np.int64)
+
+        if np.any(weights <= 0):
+            raise ValueError("Веса предметов должны быть положительными")
+
+        W = int(self.max_weight - constraints @ weights)
+        if W < 0:
+            raise ValueError("Минимальные количества предметов превышают максимальный вес рюкзака")
+
+        bounds = W // weights
+        if self.max_counts is not None:
+            bounds = np.minimum(bounds, np.maximum(np.asarray(self.max_counts, dtype=np.int64) - constraints, 0))
+
+        items, multiplicities = [], []
+        for i, bound in enumerate(bounds):
+            multiplicity = 1
+            while bound > 0:
+                take = min(multiplicity, bound)
+                items.append(i)
+                multiplicities.append(take)
+                bound -= take
+                multiplicity *= 2
+
+        return W, np.array(items, dtype=np.int64), np.array(multiplicities, dtype=np.int64)
+
+    def _solve_numpy(self):
+        """
+        0/1-рюкзак по бинарно разбитым предметам с векторным обновлением dp.
+
+        Для каждого 0/1-предмета весь массив dp обновляется одной операцией
+        (правая часть вычисляется по старым значениям). Решения хранятся
+        упакованными битами (W / 8 байт на 0/1-предмет) и восстанавливаются
+        обратным проходом.
+        """
+        constraints = np.asarray(self.constraints, dtype=np.int64)
+        weights = np.asarray(self.weights, dtype=np.int64)
+        costs = np.asarray(self.costs, dtype=np.int64)
+
+        W, items, multiplicities = self._split_items()
+
+        dp = np.zeros(W + 1, dtype=np.int64)
+        decisions = []
+        for item, multiplicity in zip(items, multiplicities):
+            item_weight = int(weights[item] * multiplicity)
+            candidate = dp[:W + 1 - item_weight] + costs[item] * multiplicity
+            better = candidate > dp[item_weight:]
+            dp[item_weight:][better] = candidate[better]
+            decisions.append(np.packbits(better))
+
+        quantities = constraints.copy()
+        w = W
+        for k in range(len(items) - 1, -1, -1):
+            item_weight = int(weights[items[k]] * multiplicities[k])
+            position = w - item_weight
+            if position >= 0 and (decisions[k][position >> 3] >> (7 - (position & 7))) & 1:
+                quantities[items[k]] += multiplicities[k]
+                w -= item_weight
+
+        return int(dp[W] + constraints @ costs), [int(q) for q in quantities]
+
+    def _row_dtype(self, items, multiplicities):
+        """
+        Наименьший целый тип, в который помещается любое значение строки dp.
+        """
+        costs = np.asarray(self.costs, dtype=np.int64)
+        bound = int(np.sum(costs[items] * multiplicities))
+        # запас в 2 раза: при поиске точки деления складываются две строки
+        return np.dtype(np.int32) if 2 * bound < np.iinfo(np.int32).max else np.dtype(np.int64)
+
+    def _dp_row(self, item_weights, item_costs, capacity, dtype):
+        """
+        Строка dp[0..capacity] для набора 0/1-предметов (без хранения решений).
+        """
+        dp = np.zeros(capacity + 1, dtype=dtype)
+        for item_weight, item_cost in zip(item_weights, item_costs):
+            if item_weight > capacity:
+                continue
+            np.maximum(dp[item_weight:], dp[:capacity + 1 - item_weight] + item_cost, out=dp[item_weight:])
+        return dp
+
+    def _solve_compact(self):
+        """
+        0/1-рюкзак по бинарно разбитым предметам с памятью O(W).
+
+        Хранится только строка dp компактного целого типа. Решение
+        восстанавливается делением набора предметов пополам: для каждой
+        половины строится строка dp, вместимость делится в точке максимума
+        f_left[c] + f_right[C - c], и половины решаются рекурсивно.
+        """
+        constraints = np.asarray(self.constraints, dtype=np.int64)
+        weights = np.asarray(self.weights, dtype=np.int64)
+        costs = np.asarray(self.costs, dtype=np.int64)
+
+        W, items, multiplicities = self._split_items()
+        item_weights = weights[items] * multiplicities
+        item_costs = costs[items] * multiplicities
+        dtype = self._row_dtype(items, multiplicities)
+
+        taken = np.zeros(len(items), dtype=bool)
+        stack = [(0, len(items), W)]
+        while stack:
+            start, stop, capacity = stack.pop()
+            if stop - start == 1:
+                taken[start] = item_weights[start] <= capacity and item_costs[start] > 0
+                continue
+            if stop == start or capacity == 0:
+                continue
+
+            middle = (start + stop) // 2
+            left = self._dp_row(item_weights[start:middle], item_costs[start:middle], capacity, dtype)
+            right = self._dp_row(item_weights[middle:stop], item_costs[middle:stop], capacity, dtype)
+            split = int(np.argmax(left + right[::-1]))
+            del left, right
+
+            stack.append((start, middle, split))
+            stack.append((middle, stop, capacity - split))
+
+        quantities = constraints.copy()
+        np.add.at(quantities, items[taken], multiplicities[taken])
+        return int(item_costs[taken].sum() + constraints @ costs), [int(q) for q in quantities]
@@ -12,16 +12,19 @@ class Entity:
         costs (np.array): An array representing the costs of the items.
         current_state (np.array): The current state of the entity.
         mutation_probability (float): The probability of mutation for the entity.
+        fitness (float, optional): Precomputed fitness of current_state.
+        current_weight (float, optional): Precomputed weight of current_state.
     """
-    def __init__(self, min_value: np.array, max_weight: int, weights: np.array, costs: np.array, current_state: np.array, mutation_probability: float):
+    def __init__(self, min_value: np.array, max_weight: int, weights: np.array, costs: np.array, current_state: np.array, mutation_probability: float, fitness=None, current_weight=None):
         self.min_value = min_value
         self.max_weight = max_weight
         self.weights = weights
         self.costs = costs
         self.current_state = current_state
         self.mutation_probability = mutation_probability
-        self._fitness = None
-        self._current_weight = None
+        self._fitness = fitness
+        self._current_weight = current_weight
+        self._prefix_sums = None
 
     def get_fitness(self):
         """
@@ -41,6 +44,42 @@ class Entity:
         self.current_state = new_state
         self._fitness = None  # Invalidate cache
         self._current_weight = None  # Invalidate cache
+        self._prefix_sums = None
+
+    def update_gene(self, index: int, delta: int):
+        """
+        Change one gene by delta and update the cached fitness and weight in O(1).
+
+        Args:
+            index (int): Index of the gene.
+            delta (int): Value added to the gene.
+        """
+        self.current_state[index] += delta
+        if self._fitness is not None:
+            self._fitness += self.costs[index] * delta
+        if self._current_weight is not None:
+            self._current_weight += self.weights[index] * delta
+        self._prefix_sums = None
+
+    def get_prefix_sums(self):
+        """
+        Cumulative costs and weights of the current state.
+
+        Both arrays start with 0, so the cost of the segment [i, j) is
+        costs[j] - costs[i]. Used by crossover to evaluate children without
+        recomputing full dot products.
+
+        Returns:
+            tuple: (cumulative costs, cumulative weights), each of length n + 1.
+        """
+        if self._prefix_sums is None:
+            state = np.asarray(self.current_state)
+            cumulative_costs = np.zeros(state.size + 1, dtype=np.int64)
+            cumulative_weights = np.zeros(state.size + 1, dtype=np.int64)
+            np.cumsum(state * np.asarray(self.costs), out=cumulative_costs[1:])
+            np.cumsum(state * np.asarray(self.weights), out=cumulative_weights[1:])
+            self._prefix_sums = (cumulative_costs, cumulative_weights)
+        return self._prefix_sums
 
     def check_validity(self) -> bool:
         """
@@ -54,8 +93,7 @@ class Entity:
         Returns:
             bool: True if the current state is valid, False otherwise.
         """
-        total_weight = np.dot(self.current_state, self.weights)
-        if total_weight > self.max_weight:
+        if self.get_current_weight() > self.max_weight:
             return False
         
         return np.all(self.current_state >= self.min_value) # Вернет True, если все значения в массиве current_state больше или значениям в min_value
@@ -78,16 +116,12 @@ class Entity:
 
             # Decrease the value if it doesn't violate the minimum constraint
             if delta < 0 and self.current_state[index] + delta >= self.min_value[index]:
-                tmp = self.current_state # тут чекни что все норм
-                tmp[index] += delta
-                self.update_state(tmp)
+                self.update_gene(index, delta)
                 break
 
             # Increase the value if it doesn't exceed the maximum weight
             if delta > 0 and cur_total_weight + self.weights[index] * delta <= self.max_weight:
-                tmp = self.current_state # тут чекни что все норм
-                tmp[index] += delta
-                self.update_state(tmp)
+                self.update_gene(index, delta)
                 break
 
     def get_current_weight(self):
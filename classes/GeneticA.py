@@ -1,7 +1,14 @@
-from typing import List
+from typing import Iterator, List, NamedTuple
 from classes.Entity import Entity
 from classes.Population import Population
+from classes.ArrayPopulation import ArrayPopulation
+from classes.RepairOperator import make_repair_operator
+from classes.Selection import make_selection_strategy
+from classes.Initializer import PopulationInitializer
+from classes.DPCache import DPCache
+from classes.Bounds import KnapsackBounds
 import random
+import time
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import numpy as np
@@ -20,7 +27,31 @@ class GeneticCharacteristics:
                  size_to_generate: int,
                  mutation_probability: float,
                  tournament_size: int,
-                 desired_population_size: int):
+                 desired_population_size: int,
+                 population_backend: str = 'entity',
+                 offspring_mode: str = 'sequential',
+                 outbreeding_mode: str = 'scan',
+                 repair: str = 'discard',
+                 refill_budget: int = None,
+                 refill_fallback: str = 'random',
+                 selection: str = 'tournament',
+                 selection_params: dict = None,
+                 elitism: int = 0,
+                 initialization: str = 'sequential',
+                 seed_solution: str = None,
+                 stop_at_bound: bool = False,
+                 time_limit: float = None,
+                 max_evaluations: int = None,
+                 dp_cache: DPCache = None):
+        if population_backend not in ('entity', 'array'):
+            raise ValueError(f"Неизвестный population_backend: {population_backend}")
+        if offspring_mode not in ('sequential', 'batch'):
+            raise ValueError(f"Неизвестный offspring_mode: {offspring_mode}")
+        if outbreeding_mode not in ('scan', 'cached'):
+            raise ValueError(f"Неизвестный outbreeding_mode: {outbreeding_mode}")
+        if population_backend == 'entity' and (offspring_mode == 'batch' or outbreeding_mode == 'cached'):
+            raise ValueError("offspring_mode='batch' и outbreeding_mode='cached' поддерживаются только для population_backend='array'")
+
         # Характеристики рюкзака
         self.min_vals = np.array(min_vals, dtype=int)
         self.weights = np.array(weights, dtype=int)
@@ -36,6 +67,60 @@ class GeneticCharacteristics:
         self.mutation_probability = mutation_probability
         self.tournament_size = tournament_size
         self.desired_population_size = desired_population_size
+        # 'entity' - список объектов Entity, 'array' - матрица геномов (ArrayPopulation)
+        self.population_backend = population_backend
+        # 'sequential' - потомки по одной паре, 'batch' - все потомки поколения сразу (только для 'array')
+        self.offspring_mode = offspring_mode
+        # 'scan' - расстояния считаются при каждом поиске, 'cached' - матрица расстояний популяции (только для 'array')
+        self.outbreeding_mode = outbreeding_mode
+        # 'discard' - недопустимые потомки отбрасываются, 'greedy' - восстанавливаются GreedyRepair
+        self.repair = repair
+        # Максимум скрещиваний за поколение при пополнении популяции (None - без ограничения)
+        self.refill_budget = refill_budget
+        # Чем дополнить популяцию, если бюджет исчерпан: 'random' - случайными особями,
+        # 'repair' - потомками, восстановленными GreedyRepair
+        self.refill_fallback = refill_fallback
+        # Стратегия отбора: 'tournament', 'sus', 'rank', 'truncation', 'plus' - (μ+λ), 'comma' - (μ,λ)
+        self.selection = selection
+        # Параметры стратегии отбора, например {'pressure': 1.8} для 'rank' или {'proportion': 0.3} для 'truncation'
+        self.selection_params = selection_params
+        # Число лучших особей, переносимых в следующее поколение без отбора
+        self.elitism = elitism
+        # 'sequential' - generate_state для каждой особи, 'multinomial' или 'greedy' - пакетно (PopulationInitializer)
+        self.initialization = initialization
+        # Особь, добавляемая в начальную популяцию: None, 'greedy' - жадное решение, 'dp' - точное решение (через dp_cache)
+        self.seed_solution = seed_solution
+        # Остановиться, как только лучшая особь достигнет верхней оценки (линейная релаксация, KnapsackBounds)
+        self.stop_at_bound = stop_at_bound
+        # Бюджеты start_algorithm: время работы в секундах и число вычислений fitness (None - без ограничения).
+        # Проверяются между поколениями, последнее поколение может немного превысить бюджет
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        # Кэш точных решений для seed_solution='dp' (None - DPCache() в каталоге по умолчанию)
+        self.dp_cache = dp_cache
+
+class Improvement(NamedTuple):
+    """
+    Событие улучшения лучшей особи, которое выдает GeneticAlgorithm.iter_improvements.
+    """
+    # Число выполненных поколений (с 1)
+    iteration: int
+    fitness: int
+    # Копия генома лучшей особи
+    genome: np.ndarray
+    # Секунды с начала iter_improvements
+    elapsed: float
+
+
+class AlgorithmResult(NamedTuple):
+    """
+    Результат GeneticAlgorithm.start_algorithm.
+    """
+    fitness: int
+    best_entity: Entity
+    # Израсходованный бюджет, см. GeneticAlgorithm.get_budget_usage
+    budget_usage: dict
+
 
 class GeneticAlgorithm:
     def __init__(self, genetic_characteristics: GeneticCharacteristics):
@@ -45,11 +130,52 @@ class GeneticAlgorithm:
         self.current_iteration = 0
         self.prev_fitness = 0
         self.best_entity = None
+        self.repair_operator = make_repair_operator(
+            genetic_characteristics.repair,
+            genetic_characteristics.min_vals,
+            genetic_characteristics.weights,
+            genetic_characteristics.costs,
+            genetic_characteristics.max_weight
+        )
+        if genetic_characteristics.refill_fallback not in ('random', 'repair'):
+            raise ValueError(f"Неизвестный refill_fallback: {genetic_characteristics.refill_fallback}")
+        self.fallback_repair_operator = self.repair_operator or make_repair_operator(
+            'greedy',
+            genetic_characteristics.min_vals,
+            genetic_characteristics.weights,
+            genetic_characteristics.costs,
+            genetic_characteristics.max_weight
+        )
+        self.selection_strategy = make_selection_strategy(
+            genetic_characteristics.selection,
+            genetic_characteristics.tournament_size,
+            genetic_characteristics.selection_params
+        )
+        # Индекс первого потомка текущего поколения (особи до него - родители)
+        self.offspring_start = 0
+        # Счетчики пополнения популяции: последнего поколения и по всем поколениям
+        self.refill_stats = None
+        self.refill_history = []
+        # Верхняя оценка оптимума (только при stop_at_bound): достигнув ее, лучше решения не найти
+        self.upper_bound = None
+        if genetic_characteristics.stop_at_bound:
+            self.upper_bound = KnapsackBounds(
+                genetic_characteristics.min_vals,
+                genetic_characteristics.weights,
+                genetic_characteristics.costs,
+                genetic_characteristics.max_weight
+            ).upper_bound()
         self.population = self.generate_population()
+        # Число вычислений fitness: начальная популяция и все созданные потомки
+        self.evaluations = genetic_characteristics.size_to_generate
+        # Время запуска start_algorithm (для time_limit) и причина остановки
+        self.start_time = None
+        self.stop_reason = None
+        self.budget_usage = None
         
         self.fitness_history = []
 
-    def generate_individual(self) -> Entity:
+    def generate_state(self) -> np.ndarray:
         if self.genetic_characteristics.min_vals.size != self.genetic_characteristics.weights.size:
             raise ValueError("Длины списков min_vals и weights должны совпадать. Недопустимая конфигурация")
 
@@ -74,21 +200,85 @@ class GeneticAlgorithm:
 
             attempts += 1
 
+        return individual
+
+    def generate_individual(self) -> Entity:
+        return self.make_entity(self.generate_state())
+
+    def make_entity(self, state: np.ndarray) -> Entity:
         return Entity(
             min_value=self.genetic_characteristics.min_vals,
             max_weight=self.genetic_characteristics.max_weight,
             weights=self.genetic_characteristics.weights,
             costs=self.genetic_characteristics.costs,
-            current_state=individual,
+            current_state=state,
             mutation_probability=self.genetic_characteristics.mutation_probability
         )
 
-    def generate_population(self) -> Population:
-        population = []
-        for _ in range(self.genetic_characteristics.size_to_generate):
-            population.append(self.generate_individual())
+    def generate_states(self, count: int) -> np.ndarray:
+        """
+        Геномы начальной популяции, строки матрицы (count, items).
+        """
+        characteristics = self.genetic_characteristics
+        if characteristics.initialization == 'sequential':
+            genomes = np.array([self.generate_state() for _ in range(count)]).reshape(count, characteristics.min_vals.size)
+        else:
+            genomes = self._initializer().generate(count)
+
+        if characteristics.seed_solution is not None and count > 0:
+            genomes[0] = self._seed_state()
+        return genomes
+
+    def _initializer(self) -> PopulationInitializer:
+        characteristics = self.genetic_characteristics
+        return PopulationInitializer(
+            min_vals=characteristics.min_vals,
+            weights=characteristics.weights,
+            costs=characteristics.costs,
+            max_weight=characteristics.max_weight,
+            method=characteristics.initialization,
+            max_rounds=characteristics.max_attempts
+        )
+
+    def _seed_state(self) -> np.ndarray:
+        characteristics = self.genetic_characteristics
+        if characteristics.seed_solution == 'greedy':
+            _, quantities = KnapsackBounds(
+                characteristics.min_vals,
+                characteristics.weights,
+                characteristics.costs,
+                characteristics.max_weight
+            ).greedy_solution()
+            return np.array(quantities)
+        if characteristics.seed_solution == 'dp':
+            dp_cache = characteristics.dp_cache if characteristics.dp_cache is not None else DPCache()
+            _, quantities = dp_cache.solve(
+                min_vals=characteristics.min_vals,
+                weights=characteristics.weights,
+                costs=characteristics.costs,
+                max_weight=characteristics.max_weight
+            )
+            return np.array(quantities)
+        raise ValueError(f"Неизвестный seed_solution: {characteristics.seed_solution}")
+
+    def generate_population(self):
+        genomes = self.generate_states(self.genetic_characteristics.size_to_generate)
+
+        if self.genetic_characteristics.population_backend == 'array':
+            return ArrayPopulation(
+                genomes=genomes,
+                min_value=self.genetic_characteristics.min_vals,
+                max_weight=self.genetic_characteristics.max_weight,
+                weights=self.genetic_characteristics.weights,
+                costs=self.genetic_characteristics.costs,
+                mutation_probability=self.genetic_characteristics.mutation_probability,
+                desired_amount=self.genetic_characteristics.desired_population_size,
+                tournament_size=self.genetic_characteristics.tournament_size,
+                distance_cache=self.genetic_characteristics.outbreeding_mode == 'cached'
+            )
+
         return Population(
-            entities=population,
+            entities=[self.make_entity(genome) for genome in genomes],
             desired_amount=self.genetic_characteristics.desired_population_size,
             tournament_size=self.genetic_characteristics.tournament_size
         )
@@ -98,67 +288,240 @@ class GeneticAlgorithm:
             return False
 
         if self.current_iteration >= self.genetic_characteristics.max_iterations:
+            self.stop_reason = 'max_iterations'
             return True
 
-        current_fitness = self.population.get_popultion_fitness()[1]
+        if self.best_entity is not None and self._budget_exhausted():
+            return True
+
+        if (self.upper_bound is not None and self.best_entity is not None and
+            self.best_entity.get_fitness() >= self.upper_bound):
+            self.stop_reason = 'bound'
+            return True
+
+        current_fitness = self.population.get_population_fitness()[1]
 
         if (self.prev_fitness is not None and
             current_fitness is not None):
             if (abs(self.prev_fitness -
                    current_fitness) <
                 self.genetic_characteristics.epsilon):
+                self.stop_reason = 'epsilon'
                 return True
 
         return False
 
-    def start_algorithm(self, show_progression_type=None, goal=None):
-        while not self.stopping_criterion():
-            if self.current_iteration != 0:
-                self.prev_fitness = self.population.get_population_fitness()[1]
-
-            while len(self.population.entities) < self.genetic_characteristics.population_size + 5:
-                parent1, parent2 = self.population.outbreeding()
-                child1, child2 = self.population.two_point_crossover(parent1, parent2)
-                child1.mutate()
-                child2.mutate()
-                if child1.check_validity():
-                    self.population.entities.append(child1)
-                if child2.check_validity():
-                    self.population.entities.append(child2)
-
-            self.population = self.population.tournament_population()
-
-            # Обновляем лучшую особь
-            population_fitness =self.population.get_population_fitness()
-            current_best_entity = population_fitness[0]
-            if self.current_iteration % 100 == 0:
-                self.fitness_history.append(population_fitness[1])
-            
-            if self.best_entity is None or current_best_entity.get_fitness() > self.best_entity.get_fitness():
-                self.best_entity = current_best_entity
+    def _budget_exhausted(self) -> bool:
+        """
+        Проверка бюджетов time_limit и max_evaluations: одно сравнение счетчика
+        и один вызов perf_counter на поколение.
+        """
+        characteristics = self.genetic_characteristics
+        if characteristics.max_evaluations is not None and self.evaluations >= characteristics.max_evaluations:
+            self.stop_reason = 'max_evaluations'
+            return True
+        if (characteristics.time_limit is not None and self.start_time is not None and
+            time.perf_counter() - self.start_time >= characteristics.time_limit):
+            self.stop_reason = 'time_limit'
+            return True
+        return False
 
-            self.current_iteration += 1
+    def get_budget_usage(self) -> dict:
+        """
+        Израсходованный бюджет: iterations, evaluations, elapsed (секунды с запуска
+        start_algorithm), stop_reason и заданные ограничения time_limit, max_evaluations.
+        """
+        return {
+            'iterations': self.current_iteration,
+            'evaluations': self.evaluations,
+            'elapsed': time.perf_counter() - self.start_time if self.start_time is not None else 0.0,
+            'stop_reason': self.stop_reason,
+            'time_limit': self.genetic_characteristics.time_limit,
+            'max_evaluations': self.genetic_characteristics.max_evaluations
+        }
+
+    def iter_improvements(self) -> Iterator[Improvement]:
+        """
+        Запуск алгоритма как генератора: после каждого поколения, улучшившего
+        лучшую особь, выдается Improvement(iteration, fitness, genome, elapsed).
+
+        Работа идет до критерия остановки (stopping_criterion). Потребитель
+        может прекратить ее раньше, закрыв генератор (например, break в цикле),
+        когда решение достаточно хорошее: тогда stop_reason = 'cancelled'.
+        В обоих случаях израсходованный бюджет сохраняется в self.budget_usage.
+        """
+        self.start_time = time.perf_counter()
+        self.stop_reason = None
+        try:
+            while not self.stopping_criterion():
+                if self.current_iteration != 0:
+                    self.prev_fitness = self.population.get_population_fitness()[1]
+
+                previous_best = self.best_entity
+                self.next_iteration()
+
+                if self.best_entity is not previous_best:
+                    yield Improvement(
+                        iteration=self.current_iteration,
+                        fitness=self.best_entity.get_fitness(),
+                        genome=np.array(self.best_entity.current_state, copy=True),
+                        elapsed=time.perf_counter() - self.start_time
+                    )
+        finally:
+            if self.stop_reason is None:
+                self.stop_reason = 'cancelled'
+            self.budget_usage = self.get_budget_usage()
+
+    def start_algorithm(self, show_progression_type=None, goal=None) -> AlgorithmResult:
+        """
+        Запуск алгоритма до критерия остановки или исчерпания бюджета.
+
+        :return: AlgorithmResult(fitness, best_entity, budget_usage)
+        """
+        # Бюджет фиксируется генератором до визуализации, чтобы она не учитывалась во времени
+        for _ in self.iter_improvements():
+            pass
 
         if show_progression_type == 'animate':
             self.animate_progression(goal=goal)
         elif show_progression_type == 'plot':
             self.plot_progression(goal=goal)
         
-        return self.best_entity.get_fitness(), self.best_entity
+        return AlgorithmResult(self.best_entity.get_fitness(), self.best_entity, self.budget_usage)
 
-    def next_iteration(self):
+    def _refill_population(self):
+        """
+        Дополняет популяцию потомками до population_size + 5 особей.
+
+        Число скрещиваний ограничено refill_budget; если его не хватило,
+        недостающие особи добавляются по стратегии refill_fallback.
+
+        Счетчики поколения сохраняются в self.refill_stats: attempts - число
+        скрещиваний, children - число потомков, feasible - допустимые потомки
+        (после восстановления), invalid - отброшенные потомки, repaired -
+        восстановленные потомки, accepted - добавленные потомки, fallback -
+        особи, добавленные стратегией refill_fallback, acceptance_rate - доля
+        допустимых потомков, evaluations - вычисления fitness, time - время пополнения в секундах.
+        """
+        started = time.perf_counter()
+        self.offspring_start = len(self.population)
+        target_size = self.genetic_characteristics.population_size + 5
+        budget = self.genetic_characteristics.refill_budget
+        stats = {'attempts': 0, 'children': 0, 'feasible': 0, 'repaired': 0, 'accepted': 0, 'fallback': 0}
+
+        self._refill(target_size, stats, self.repair_operator, budget)
+        if len(self.population) < target_size:
+            size = len(self.population)
+            self._refill_fallback(target_size, stats)
+            stats['fallback'] = len(self.population) - size
+
+        stats['invalid'] = stats['children'] - stats['feasible']
+        # Вычисления fitness: все потомки и случайные особи fallback (восстановленные уже среди потомков)
+        stats['evaluations'] = stats['children'] + (stats['fallback'] if self.genetic_characteristics.refill_fallback == 'random' else 0)
+        self.evaluations += stats['evaluations']
+        stats['acceptance_rate'] = stats['feasible'] / stats['children'] if stats['children'] else 1.0
+        stats['time'] = time.perf_counter() - started
+        self.refill_stats = stats
+        self.refill_history.append(stats)
+
+    def _refill(self, target_size: int, stats: dict, repair_operator, budget):
+        if isinstance(self.population, ArrayPopulation):
+            self._refill_array(target_size, stats, repair_operator, budget)
+        else:
+            self._refill_entities(target_size, stats, repair_operator, budget)
+
+    def _refill_fallback(self, target_size: int, stats: dict):
+        if self.genetic_characteristics.refill_fallback == 'repair':
+            # Восстановленные потомки всегда допустимы, поэтому цикл без бюджета конечен.
+            # Добавленные потомки учитываются в 'fallback', а не в 'accepted'
+            fallback_stats = dict.fromkeys(stats, 0)
+            self._refill(target_size, fallback_stats, self.fallback_repair_operator, None)
+            for key in ('attempts', 'children', 'feasible', 'repaired'):
+                stats[key] += fallback_stats[key]
+            return
+
+        missing = target_size - len(self.population)
+        if isinstance(self.population, ArrayPopulation):
+            self.population.add_genomes(np.array([self.generate_state() for _ in range(missing)]))
+        else:
+            self.population.add_entities([self.generate_individual() for _ in range(missing)])
+
+    def _refill_array(self, target_size: int, stats: dict, repair_operator, budget):
+        if self.genetic_characteristics.offspring_mode == 'batch':
+            batch_stats = self.population.generate_offspring(target_size - len(self.population), repair_operator, budget)
+            for key, value in batch_stats.items():
+                stats[key] += value
+            return
 
-        while len(self.population.entities) < self.genetic_characteristics.population_size + 5:
+        while len(self.population) < target_size and (budget is None or stats['attempts'] < budget):
+            parent1, parent2 = self.population.outbreeding()
+            children = self.population.two_point_crossover(parent1, parent2)
+            fitness, weight = self.population.evaluate(children)
+            self.population.mutate(children, fitness, weight)
+            if repair_operator is not None:
+                stats['repaired'] += int(repair_operator.repair(children, fitness, weight).sum())
+            valid = self.population.check_validity(children, weight)
+            self.population.add_genomes(children[valid], fitness[valid], weight[valid])
+
+            stats['attempts'] += 1
+            stats['children'] += len(children)
+            stats['feasible'] += int(valid.sum())
+            stats['accepted'] += int(valid.sum())
+
+    def _refill_entities(self, target_size: int, stats: dict, repair_operator, budget):
+        while len(self.population.entities) < target_size and (budget is None or stats['attempts'] < budget):
             parent1, parent2 = self.population.outbreeding()
-            child1, child2 = self.population.two_point_crossover(parent1, parent2)
-            child1.mutate()
-            child2.mutate()
-            if child1.check_validity():
-                self.population.entities.append(child1)
-            if child2.check_validity():
-                self.population.entities.append(child2)
+            stats['attempts'] += 1
+            stats['children'] += 2
+
+            if repair_operator is None:
+                # Недопустимые по весу потомки отбрасываются до создания геномов,
+                # а мутация допустимость не нарушает
+                children = self.population.feasible_crossover(parent1, parent2)
+                for child in children:
+                    child.mutate()
+            else:
+                children = self._repair_entities(self.population.two_point_crossover(parent1, parent2), stats, repair_operator)
+
+            self.population.add_entities(children)
+            stats['feasible'] += len(children)
+            stats['accepted'] += len(children)
+
+    def _repair_entities(self, children: List[Entity], stats: dict, repair_operator) -> List[Entity]:
+        """
+        Мутирует потомков и восстанавливает перегруженных одним вызовом оператора восстановления.
+        """
+        for child in children:
+            child.mutate()
+        genomes = np.array([child.current_state for child in children], dtype=np.int64)
+        fitness = np.array([child.get_fitness() for child in children], dtype=np.int64)
+        weight = np.array([child.get_current_weight() for child in children], dtype=np.int64)
+
+        repaired = repair_operator.repair(genomes, fitness, weight)
+        stats['repaired'] += int(repaired.sum())
+
+        valid = []
+        for i, child in enumerate(children):
+            if repaired[i]:
+                child = Entity(
+                    min_value=child.min_value,
+                    max_weight=child.max_weight,
+                    weights=child.weights,
+                    costs=child.costs,
+                    current_state=genomes[i],
+                    mutation_probability=child.mutation_probability,
+                    fitness=fitness[i],
+                    current_weight=weight[i]
+                )
+            if child.check_validity():
+                valid.append(child)
+        return valid
+
+    def next_iteration(self):
 
-        self.population = self.population.tournament_population()
+        self._refill_population()
+
+        self.population = self.population.select_population(self.selection_strategy, self.offspring_start, self.genetic_characteristics.elitism)
 
         population_fitness =self.population.get_population_fitness()
         current_best_entity = population_fitness[0]
@@ -177,8 +540,47 @@ class GeneticAlgorithm:
     def extend_population(self, entities):
         self.population.add_entities(entities)
         
+    def extend_population_genomes(self, genomes: np.ndarray):
+        """
+        Добавляет в популяцию особей, заданных строками геномов (например, мигрантов из другого процесса).
+        """
+        if isinstance(self.population, ArrayPopulation):
+            self.population.add_genomes(np.asarray(genomes, dtype=np.int64).reshape(-1, self.genetic_characteristics.min_vals.size))
+        else:
+            self.population.add_entities([self.make_entity(np.array(genome, dtype=int)) for genome in genomes])
+
     def remove_from_population(self, entities_indeces):
         self.population.remove_entities(entities_indeces)
+
+    def take_emigrants(self, indices) -> np.ndarray:
+        """
+        Удаляет из популяции особей indices (перестановкой с конца, O(len(indices)))
+        и возвращает их геномы строками матрицы.
+        """
+        if isinstance(self.population, ArrayPopulation):
+            return self.population.pop_genomes(indices)
+        entities = self.population.pop_entities(indices)
+        genomes = np.array([entity.current_state for entity in entities], dtype=np.int64)
+        return genomes.reshape(-1, self.genetic_characteristics.min_vals.size)
+
+    def discard_individuals(self, indices):
+        """
+        Удаляет особей indices перестановкой с конца, O(len(indices)).
+        """
+        if isinstance(self.population, ArrayPopulation):
+            self.population.pop_genomes(indices)
+        else:
+            self.population.pop_entities(indices)
+
+    def move_emigrants(self, indices, target: 'GeneticAlgorithm'):
+        """
+        Переносит особей indices в популяцию target: объекты Entity передаются
+        без пересоздания, строки ArrayPopulation - одной операцией над массивами.
+        """
+        if isinstance(self.population, Population) and isinstance(target.population, Population):
+            target.population.add_entities(self.population.pop_entities(indices))
+        else:
+            target.extend_population_genomes(self.take_emigrants(indices))
     
     def get_best_entity(self):
         return self.best_entity, self.best_entity.get_fitness()
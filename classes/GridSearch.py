@@ -1,21 +1,174 @@
+import json
+import os
 import time
+import random
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
 from classes.GeneticA import GeneticCharacteristics, GeneticAlgorithm
 from classes.DPSolver import DPSolver
-from math import sqrt
+from classes.DPCache import DPCache
+from classes.Bounds import KnapsackBounds, optimality_gap
+from functions.utils import iter_logs_from_jsonl
+from math import ceil, sqrt
+import numpy as np
 import pandas as pd
 
+
+def evaluate_condition(combination, condition, dp_cache=None, seed=None, reference='dp'):
+    """
+    Один прогон ГА и точного DP для комбинации параметров на одном условии.
+
+    :param combination: dict, комбинация параметров
+    :param condition: dict, условия задачи
+    :param dp_cache: DPCache, опциональный кэш точных решений
+    :param seed: int, seed для random и numpy (None - не менять состояние генераторов)
+    :param reference: str, с чем сравнивается ГА: 'dp' - точное решение DPSolver,
+                      'bound' - верхняя оценка KnapsackBounds (DP не запускается,
+                      для условий, где таблица DP слишком велика)
+    :return: dict с ключами dp_fitness, ga_fitness, dp_time, ga_time, ga_iterations,
+             ga_evaluations, upper_bound, optimality_gap
+    """
+    if reference not in ('dp', 'bound'):
+        raise ValueError(f"Неизвестный reference: {reference}")
+
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed % 2 ** 32)
+
+    genetic_characteristics = GeneticCharacteristics(
+        population_size=combination['population_size'],
+        min_vals=condition['min_vals'],
+        weights=condition['weights'],
+        costs=condition['costs'],
+        max_weight=condition['max_weight'],
+        max_iterations=combination['max_iterations'],
+        epsilon=combination['epsilon'],
+        max_attempts=combination['max_attempts'],
+        size_to_generate=combination['size_to_generate'],
+        mutation_probability=combination['change_to_mutation'],
+        tournament_size=combination['tournament_size'],
+        desired_population_size=combination['desired_population_size']
+    )
+
+    upper_bound = KnapsackBounds(condition['min_vals'], condition['weights'], condition['costs'], condition['max_weight']).upper_bound()
+
+    # Замер времени выполнения dpsolver.solve() (или поиска в кэше)
+    start_time_dp = time.time()
+    if reference == 'bound':
+        result_fitness_dp = upper_bound
+    elif dp_cache is not None:
+        result_fitness_dp, result_dp = dp_cache.solve_condition(condition)
+    else:
+        dpsolver = DPSolver(constraints=condition['min_vals'],weights=condition['weights'],costs=condition['costs'],max_weight=condition['max_weight'],engine='numpy')
+        result_fitness_dp, result_dp = dpsolver.solve()
+    end_time_dp = time.time()
+
+    genetic_algorithm = GeneticAlgorithm(genetic_characteristics)
+
+    start_time_ga = time.time()
+    result_fitness_ga, result_ga, budget_usage = genetic_algorithm.start_algorithm()
+    end_time_ga = time.time()
+
+    return {
+        'dp_fitness': result_fitness_dp,
+        'ga_fitness': result_fitness_ga,
+        'dp_time': end_time_dp - start_time_dp,
+        'ga_time': end_time_ga - start_time_ga,
+        'ga_iterations': budget_usage['iterations'],
+        'ga_evaluations': budget_usage['evaluations'],
+        'upper_bound': upper_bound,
+        'optimality_gap': optimality_gap(result_fitness_ga, upper_bound)
+    }
+
+
+def _evaluate_task(task):
+    # Функция верхнего уровня, чтобы ProcessPoolExecutor мог передать ее в процесс
+    return evaluate_condition(*task)
+
+
 class GridSearch:
-    def __init__(self, task_conditions, param_grid):
+    def __init__(self, task_conditions, param_grid, dp_cache=None, n_workers=1, seed=None, log_file=None, resume=False, reference='dp'):
         """
         Инициализация класса GridSearch.
 
         :param task_conditions: dict, условия задачи (например, характеристики рюкзака)
         :param param_grid: dict, возможные значения параметров для перебора
+        :param dp_cache: DPCache, дисковый кэш точных решений; None - DPCache() в каталоге по умолчанию,
+                         False - без кэша (DP считается заново для каждой пары комбинация-условие)
+        :param n_workers: int, число процессов для параллельного перебора (1 - последовательно)
+        :param seed: int, главный seed; из него выводятся seed каждой пары (комбинация, условие)
+        :param log_file: str, JSON Lines файл, в который каждая запись лога дописывается сразу после оценки
+        :param resume: bool, загрузить записи из log_file и не пересчитывать уже оцененные комбинации
+        :param reference: str, эталон для сравнения с ГА: 'dp' - точное решение,
+                          'bound' - верхняя оценка линейной релаксации (без DP)
         """
+        if reference not in ('dp', 'bound'):
+            raise ValueError(f"Неизвестный reference: {reference}")
         self.task_conditions = task_conditions
         self.param_grid = param_grid
+        if dp_cache is None:
+            dp_cache = DPCache()
+        # Точное решение каждого условия считается один раз и переиспользуется всеми комбинациями
+        self.dp_cache = dp_cache if dp_cache is not False else None
+        self.n_workers = n_workers
+        self.seed = seed
         self.logs = []
+        self.search_report = None
+        self.log_file = log_file
+        self.resume = resume
+        self.reference = reference
+        # Уже оцененные комбинации (только при resume): ключ (параметры, число условий) -> запись лога
+        self._completed = {}
+
+        if log_file is not None:
+            self._prepare_log_file(resume)
+
+    @staticmethod
+    def _log_key(parameters, num_conditions):
+        return json.dumps(parameters, sort_keys=True), num_conditions
+
+    @staticmethod
+    def _log_entry_score(log_entry):
+        differences = [value for key, value in log_entry.items() if key.startswith('test case')]
+        return sum(differences) / len(differences)
+
+    def _prepare_log_file(self, resume):
+        """
+        Подготовка JSON Lines лога: при resume загружает записи прошлых запусков,
+        иначе очищает файл.
+
+        Оборванная при падении последняя строка пропускается, а файл
+        дополняется переводом строки, чтобы новые записи не склеились с ней.
+        """
+        directory = os.path.dirname(self.log_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        if not resume:
+            # Новый поиск начинается с пустого лога
+            open(self.log_file, 'w', encoding='utf-8').close()
+            return
+
+        if not os.path.exists(self.log_file):
+            return
+
+        with open(self.log_file, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    f.write(b'\n')
+
+        for log_entry in iter_logs_from_jsonl(self.log_file):
+            self.logs.append(log_entry)
+            num_conditions = sum(1 for key in log_entry if key.startswith('test case'))
+            self._completed[self._log_key(log_entry['parameters'], num_conditions)] = log_entry
+
+    def _append_log_line(self, log_entry):
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
 
     def generate_combinations(self):
         """
@@ -28,14 +181,49 @@ class GridSearch:
         for combination in product(*values):
             yield dict(zip(keys, combination))
 
-    def evaluate_combination(self, combination):
+    def task_seed(self, combination_index, condition_index):
+        """
+        Детерминированный seed задачи (комбинация, условие), выведенный из self.seed.
+
+        Не зависит от числа процессов и порядка выполнения задач.
+
+        :return: int или None, если self.seed не задан
+        """
+        if self.seed is None:
+            return None
+        sequence = np.random.SeedSequence(self.seed, spawn_key=(combination_index, condition_index))
+        return int(sequence.generate_state(1, dtype=np.uint64)[0])
+
+    def evaluate_combination(self, combination, combination_index=0, conditions=None):
         """
         Оценка комбинации параметров.
 
         :param combination: dict, комбинация параметров
+        :param combination_index: int, номер комбинации (для seed задач)
+        :param conditions: list, подмножество условий (по умолчанию все self.task_conditions)
+        :return: float, значение метрики для данной комбинации
+        """
+        conditions = self.task_conditions if conditions is None else conditions
+        results = []
+        for i, condition in enumerate(conditions):
+            
+            print(f'test case: {i+1}')
+
+            result = evaluate_condition(combination, condition, self.dp_cache, self.task_seed(combination_index, i), self.reference)
+            results.append(result)
+
+            print(f'Result fitness DP: {result["dp_fitness"]}, Result fitness GA: {result["ga_fitness"]}')
+
+        return self._record_combination(combination, results)
+
+    def _record_combination(self, combination, results):
+        """
+        Добавление записи лога по результатам всех условий для комбинации.
+
+        :param combination: dict, комбинация параметров
+        :param results: list, результаты evaluate_condition в порядке условий
         :return: float, значение метрики для данной комбинации
         """
-        
         optimization_function = 0
         
         # Создаем запись для логов с параметрами комбинации
@@ -45,71 +233,54 @@ class GridSearch:
         
         ga_time = 0
         dp_time = 0
+        ga_iterations = 0
+        gaps = []
         
-        for i, condition in enumerate(self.task_conditions):
-            
-            print(f'test case: {i+1}')
-            
-            genetic_characteristics = GeneticCharacteristics(
-                population_size=combination['population_size'],
-                min_vals=condition['min_vals'],
-                weights=condition['weights'],
-                costs=condition['costs'],
-                max_weight=condition['max_weight'],
-                max_iterations=combination['max_iterations'],
-                epsilon=combination['epsilon'],
-                max_attempts=combination['max_attempts'],
-                size_to_generate=combination['size_to_generate'],
-                change_to_mutation=combination['change_to_mutation'],
-                tournament_size=combination['tournament_size'],
-                desired_population_size=combination['desired_population_size']
-            )
-            
-            dpsolver = DPSolver(constraints=condition['min_vals'],weights=condition['weights'],costs=condition['costs'],max_weight=condition['max_weight'])
-            
-            # Замер времени выполнения dpsolver.solve()
-            start_time_dp = time.time()
-            result_fitness_dp, result_dp = dpsolver.solve()
-            end_time_dp = time.time()
-            
-            genetic_algorithm = GeneticAlgorithm(genetic_characteristics)
-            
-            start_time_ga = time.time()
-            result_fitness_ga, result_ga = genetic_algorithm.start_algorithm()
-            end_time_ga = time.time()
-            
-            ga_time += (end_time_ga - start_time_ga)
-            dp_time += (end_time_dp - start_time_dp)
+        for i, result in enumerate(results):
+            ga_time += result['ga_time']
+            dp_time += result['dp_time']
+            ga_iterations += result['ga_iterations']
+            if 'optimality_gap' in result:
+                gaps.append(result['optimality_gap'])
 
-            log_entry[f'test case {i+1}'] = result_fitness_dp - result_fitness_ga
-            
-            print(f'Result fitness DP: {result_fitness_dp}, Result fitness GA: {result_fitness_ga}')
+            # float: fitness ГА и DP могут быть numpy-скалярами, которые не сериализуются в JSON
+            difference = float(result['dp_fitness'] - result['ga_fitness'])
+            log_entry[f'test case {i+1}'] = difference
             
-            optimization_function += (result_fitness_dp - result_fitness_ga)
+            optimization_function += difference
         
         # Добавляем итоговую метрику в запись лога
         log_entry['ga_time'] = log_entry.get('ga_time', 0) + ga_time
         log_entry['dp_time'] = log_entry.get('dp_time', 0) + dp_time
+        log_entry['ga_iterations'] = ga_iterations
+        if gaps:
+            # Средний относительный разрыв до верхней оценки по условиям
+            log_entry['optimality_gap'] = sum(gaps) / len(gaps)
         log_entry['final_optimization_score'] = sqrt(optimization_function)
         
         # Сохраняем запись в логи
         self.logs.append(log_entry)
+        if self.log_file is not None:
+            self._append_log_line(log_entry)
+        if self.resume:
+            self._completed[self._log_key(log_entry['parameters'], len(results))] = log_entry
             
-        return optimization_function / len(self.task_conditions)
+        return optimization_function / len(results)
 
     def find_best_parameters(self, filename=None):
         """
         Поиск наилучшей комбинации параметров.
 
+        При n_workers > 1 пары (комбинация, условие) выполняются параллельно
+        в пуле процессов, логи добавляются в порядке комбинаций.
+
         :param filename: str, опциональный параметр - имя файла для сохранения лучшей конфигурации
         :return: tuple, (лучший счет, наилучшая комбинация параметров)
         """
         best_combination = None
         best_score = float('inf')
 
-        for combination in self.generate_combinations():
-            print("Evaluating combination:", combination)
-            score = self.evaluate_combination(combination)
+        for combination, score in self._evaluate(enumerate(self.generate_combinations())):
             if score < best_score:
                 best_score = score
                 best_combination = combination
@@ -121,6 +292,139 @@ class GridSearch:
 
         return best_score, best_combination
 
+    def _evaluate(self, indexed_combinations, conditions=None):
+        """
+        Оценка комбинаций последовательно или в пуле процессов (n_workers > 1).
+
+        :param indexed_combinations: iterable, пары (номер комбинации, комбинация)
+        :param conditions: list, подмножество условий (по умолчанию все)
+        :return: iterable, пары (комбинация, значение метрики) в исходном порядке
+        """
+        if self.n_workers > 1:
+            return self._evaluate_parallel(list(indexed_combinations), conditions)
+        return self._evaluate_serial(indexed_combinations, conditions)
+
+    def _find_completed(self, combination, conditions):
+        num_conditions = len(self.task_conditions if conditions is None else conditions)
+        return self._completed.get(self._log_key(combination, num_conditions))
+
+    def _evaluate_serial(self, indexed_combinations, conditions=None):
+        for combination_index, combination in indexed_combinations:
+            completed = self._find_completed(combination, conditions)
+            if completed is not None:
+                print("Skipping evaluated combination:", combination)
+                yield combination, self._log_entry_score(completed)
+                continue
+            print("Evaluating combination:", combination)
+            yield combination, self.evaluate_combination(combination, combination_index, conditions)
+
+    def _evaluate_parallel(self, indexed_combinations, conditions=None):
+        """
+        Параллельная оценка комбинаций в ProcessPoolExecutor.
+
+        Результаты executor.map читаются по мере готовности: комбинация
+        записывается в лог, как только завершены все ее условия, поэтому
+        при падении теряются только незавершенные комбинации.
+
+        :param indexed_combinations: list, пары (номер комбинации, комбинация)
+        :param conditions: list, подмножество условий (по умолчанию все)
+        :return: generator, пары (комбинация, значение метрики) в исходном порядке
+        """
+        completed = [self._find_completed(combination, conditions) for _, combination in indexed_combinations]
+        conditions = self.task_conditions if conditions is None else conditions
+        tasks = [
+            (combination, condition, self.dp_cache, self.task_seed(combination_index, condition_index), self.reference)
+            for (combination_index, combination), log_entry in zip(indexed_combinations, completed)
+            if log_entry is None
+            for condition_index, condition in enumerate(conditions)
+        ]
+        if not tasks:
+            for (_, combination), log_entry in zip(indexed_combinations, completed):
+                yield combination, self._log_entry_score(log_entry)
+            return
+
+        chunksize = max(1, len(tasks) // (4 * self.n_workers))
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            # map сохраняет порядок задач, поэтому логи не зависят от порядка завершения
+            results = executor.map(_evaluate_task, tasks, chunksize=chunksize)
+            for (_, combination), log_entry in zip(indexed_combinations, completed):
+                if log_entry is not None:
+                    print("Skipping evaluated combination:", combination)
+                    yield combination, self._log_entry_score(log_entry)
+                    continue
+                combination_results = [next(results) for _ in conditions]
+                print("Evaluated combination:", combination)
+                yield combination, self._record_combination(combination, combination_results)
+
+    def successive_halving(self, eta=3, resource='iterations', min_iterations=1, filename=None):
+        """
+        Поиск наилучшей комбинации методом последовательного деления (successive halving).
+
+        Все комбинации оцениваются на малом бюджете, после каждого раунда
+        остается лучшая 1/eta часть, и бюджет выживших увеличивается в eta раз.
+        В последнем раунде оставшиеся комбинации получают полный бюджет.
+        Отчет о выделенных и выполненных итерациях ГА сохраняется в self.search_report.
+
+        :param eta: int, во сколько раз сокращается число кандидатов за раунд
+        :param resource: str, 'iterations' - бюджет задается долей max_iterations,
+                         'conditions' - долей условий задачи (первые условия списка)
+        :param min_iterations: int, минимальное число итераций ГА в раунде
+        :param filename: str, опциональный параметр - имя файла для сохранения лучшей конфигурации
+        :return: tuple, (лучший счет, наилучшая комбинация параметров)
+        """
+        if resource not in ('iterations', 'conditions'):
+            raise ValueError(f"Неизвестный resource: {resource}")
+
+        candidates = list(enumerate(self.generate_combinations()))
+        exhaustive_iterations = sum(combination['max_iterations'] for _, combination in candidates) * len(self.task_conditions)
+        first_log = len(self.logs)
+        # Число раундов - наименьшее r с eta ** r >= len(candidates), в целых числах без ошибок округления log
+        num_rungs = 0
+        while eta ** num_rungs < len(candidates):
+            num_rungs += 1
+        budget_iterations = 0
+        rungs = []
+
+        best_score, best_combination = float('inf'), None
+        for rung in range(num_rungs + 1):
+            fraction = eta ** (rung - num_rungs)
+            conditions = self.task_conditions
+            rung_candidates = candidates
+            if resource == 'iterations':
+                rung_candidates = [
+                    (index, {**combination, 'max_iterations': max(min_iterations, int(combination['max_iterations'] * fraction))})
+                    for index, combination in candidates
+                ]
+            else:
+                conditions = self.task_conditions[:max(1, ceil(len(self.task_conditions) * fraction))]
+
+            budget_iterations += sum(combination['max_iterations'] for _, combination in rung_candidates) * len(conditions)
+
+            print(f'Rung {rung}: {len(candidates)} candidates, budget fraction {fraction:.4f}')
+            scores = [score for _, score in self._evaluate(rung_candidates, conditions)]
+            order = sorted(range(len(candidates)), key=lambda k: scores[k])
+            rungs.append({'candidates': len(candidates), 'budget_fraction': fraction, 'conditions': len(conditions)})
+
+            best_score, best_combination = scores[order[0]], candidates[order[0]][1]
+            candidates = [candidates[k] for k in order[:max(1, len(candidates) // eta)]]
+
+        spent_iterations = sum(log_entry['ga_iterations'] for log_entry in self.logs[first_log:])
+        # Полный перебор известен только по бюджету max_iterations, поэтому экономия
+        # считается по выделенным итерациям, а не по фактически выполненным (ГА может остановиться раньше)
+        self.search_report = {
+            'ga_iterations': spent_iterations,
+            'ga_iteration_budget': budget_iterations,
+            'exhaustive_ga_iterations': exhaustive_iterations,
+            'savings': exhaustive_iterations / budget_iterations if budget_iterations else float('inf'),
+            'rungs': rungs
+        }
+        print(f'GA iteration budget: {budget_iterations} (exhaustive search: {exhaustive_iterations}), iterations run: {spent_iterations}')
+
+        if filename is not None and best_combination is not None:
+            self._save_best_configuration(best_combination, filename)
+
+        return best_score, best_combination
+
     def _save_best_configuration(self, best_combination, filename):
         """
         Сохраняет лучшую конфигурацию в JSON файл.
@@ -0,0 +1,116 @@
+import random
+from typing import Optional
+import numpy as np
+
+
+class PopulationInitializer:
+    """
+    Пакетная генерация начальной популяции.
+
+    Все особи заполняются одновременно операциями numpy над матрицей
+    (count, items), вместо посчетного цикла generate_state по каждой особи.
+
+    Args:
+        min_vals: минимальные количества предметов
+        weights: веса предметов
+        costs: стоимости предметов
+        max_weight: вместимость рюкзака
+        method: 'multinomial' - количества предметов сверх минимума выбираются
+                полиномиальным распределением со случайными вероятностями,
+                'greedy' - жадное заполнение по случайно возмущенному
+                отношению cost/weight со случайной долей каждого предмета
+        max_rounds: максимум проходов заполнения остатка вместимости
+        rng: генератор numpy, по умолчанию выводится из модуля random
+    """
+    METHODS = ('multinomial', 'greedy')
+
+    def __init__(self, min_vals, weights, costs, max_weight, method: str = 'multinomial', max_rounds: int = 1000, rng: Optional[np.random.Generator] = None):
+        if method not in self.METHODS:
+            raise ValueError(f"Неизвестный способ инициализации: {method}")
+
+        self.min_vals = np.asarray(min_vals, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.costs = np.asarray(costs, dtype=np.int64)
+        self.max_weight = max_weight
+        self.method = method
+        self.max_rounds = max_rounds
+        # Привязываем numpy-генератор к модулю random, чтобы random.seed управлял обоими
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+        if self.min_vals.size != self.weights.size:
+            raise ValueError("Длины списков min_vals и weights должны совпадать. Недопустимая конфигурация")
+        if self.min_vals @ self.weights > max_weight:
+            raise ValueError("Минимальные количества предметов превышают максимальный вес рюкзака. Недопустимая конфигурация.")
+
+    def generate(self, count: int) -> np.ndarray:
+        """
+        Сгенерировать count допустимых особей.
+
+        :return: np.ndarray формы (count, items)
+        """
+        genomes = np.tile(self.min_vals, (count, 1))
+        remaining = np.full(count, self.max_weight - self.min_vals @ self.weights, dtype=np.int64)
+        if count == 0:
+            return genomes
+
+        if self.method == 'greedy':
+            self._fill_greedy(genomes, remaining)
+        else:
+            self._fill_multinomial(genomes, remaining)
+        self._fill_random(genomes, remaining)
+        return genomes
+
+    def _fill_multinomial(self, genomes: np.ndarray, remaining: np.ndarray):
+        """
+        Проходы полиномиального заполнения.
+
+        За проход строка получает N = remaining // max(weights) предметов,
+        распределенных по своему вектору вероятностей (Дирихле), поэтому
+        проход никогда не превышает вместимость. Проходы повторяются, пока
+        в какую-либо строку помещается хотя бы самый тяжелый предмет.
+        """
+        count, items = genomes.shape
+        probabilities = self.rng.dirichlet(np.ones(items), size=count)
+        heaviest = self.weights.max()
+
+        for _ in range(self.max_rounds):
+            amounts = remaining // heaviest
+            if not np.any(amounts):
+                break
+            added = self.rng.multinomial(amounts, probabilities)
+            genomes += added
+            remaining -= added @ self.weights
+
+    def _fill_greedy(self, genomes: np.ndarray, remaining: np.ndarray):
+        """
+        Жадно-случайное заполнение: предметы перебираются в порядке
+        отношения cost/weight, умноженного на случайный шум своего для каждой
+        строки, и каждый получает случайную долю помещающегося количества.
+        """
+        count, items = genomes.shape
+        ratios = (self.costs / self.weights) * self.rng.uniform(0.5, 1.5, size=(count, items))
+        order = np.argsort(-ratios, axis=1)
+        rows = np.arange(count)
+
+        for position in range(items):
+            item = order[:, position]
+            fits = remaining // self.weights[item]
+            added = self.rng.integers(0, fits + 1)
+            genomes[rows, item] += added
+            remaining -= added * self.weights[item]
+
+    def _fill_random(self, genomes: np.ndarray, remaining: np.ndarray):
+        """
+        Дозаполнение остатка: за раунд каждая строка получает один случайный
+        предмет из помещающихся, пока не поместится ни один.
+        """
+        count, items = genomes.shape
+        for _ in range(self.max_rounds):
+            fits = self.weights[None, :] <= remaining[:, None]
+            active = np.flatnonzero(fits.any(axis=1))
+            if active.size == 0:
+                break
+            keys = np.where(fits[active], self.rng.random((active.size, items)), -1.0)
+            item = np.argmax(keys, axis=1)
+            genomes[active, item] += 1
+            remaining[active] -= self.weights[item]
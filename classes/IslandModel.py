@@ -22,16 +22,185 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import List, Optional
+import multiprocessing
+import pickle
+import queue
+import random
+import traceback
+from typing import Dict, Iterable, List, Optional, Union
+import numpy as np
 from classes.GeneticA import GeneticCharacteristics, GeneticAlgorithm
 from classes.Entity import Entity
 from classes.Population import Population
 from classes.MigrationManager import MigrationManager
-from classes.DPSolver import DPSolver
+from classes.DPCache import DPCache
+from classes.Bounds import KnapsackBounds, optimality_gap
+from classes.Convergence import ConvergenceMonitor
 # from interfaces.migration_interface import MigrationManager
 import matplotlib.pyplot as plt
 
 
+def _run_epoch(island: GeneticAlgorithm, generations: int):
+    """
+    Выполнить generations поколений острова.
+
+    :return: (история лучшего fitness по поколениям, лучший геном, его fitness)
+    """
+    history = []
+    for _ in range(generations):
+        island.next_iteration()
+        history.append(island.get_best_entity()[1])
+    best_entity, best_fitness = island.get_best_entity()
+    return history, np.asarray(best_entity.current_state), best_fitness
+
+
+def _select_emigrants(island: GeneticAlgorithm, migration_manager: MigrationManager) -> np.ndarray:
+    """
+    Индексы мигрантов острова по политике emigrant_policy (по массиву fitness).
+    """
+    population = island.population
+    genomes = population.get_genomes() if migration_manager.emigrant_policy == 'diversity' else None
+    return migration_manager.select_emigrant_indices(population.get_fitness_array(), genomes)
+
+
+def _take_emigrants(island: GeneticAlgorithm, migration_manager: MigrationManager) -> np.ndarray:
+    """
+    Выбрать мигрантов, удалить их с острова и вернуть массив их геномов.
+    """
+    return island.take_emigrants(_select_emigrants(island, migration_manager))
+
+
+def _make_room(island: GeneticAlgorithm, migration_manager: MigrationManager, num_immigrants: int):
+    """
+    Удалить особей, которых по политике immigrant_policy заменят num_immigrants мигрантов.
+    """
+    island.discard_individuals(migration_manager.select_replaced_indices(island.population.get_fitness_array(), num_immigrants))
+
+
+def _receive_immigrants(island: GeneticAlgorithm, migration_manager: MigrationManager, genomes: np.ndarray):
+    """
+    Принять мигрантов, заданных массивом геномов, с учетом immigrant_policy.
+    """
+    _make_room(island, migration_manager, len(genomes))
+    island.extend_population_genomes(genomes)
+
+
+def _island_worker(island_id, genetic_characteristics, migration_manager, seed, commands, results):
+    """
+    Процесс одного острова в режиме execution='process', migration='sync'.
+
+    Остров создается внутри процесса и выполняет команды из очереди commands,
+    ответы отправляются в общую очередь results в виде (island_id, ответ).
+    Мигранты передаются массивами геномов, а не объектами Entity.
+
+    Команды:
+        ('run', n) - выполнить n поколений, ответ: (история лучшего fitness, лучший геном, его fitness)
+        ('emigrate', None) - выбрать и удалить мигрантов, ответ: массив их геномов
+        ('immigrate', genomes) - принять мигрантов по immigrant_policy, без ответа
+        ('stop', None) - завершить процесс
+    """
+    random.seed(seed)
+    np.random.seed(seed % 2 ** 32)
+    island = GeneticAlgorithm(genetic_characteristics)
+
+    while True:
+        command, payload = commands.get()
+        if command == 'run':
+            results.put((island_id, _run_epoch(island, payload)))
+        elif command == 'emigrate':
+            results.put((island_id, _take_emigrants(island, migration_manager)))
+        elif command == 'immigrate':
+            _receive_immigrants(island, migration_manager, payload)
+        elif command == 'stop':
+            break
+
+
+def _async_island_worker(island_id, genetic_characteristics, migration_manager, seed, max_iterations, epoch_length, inboxes, results):
+    """
+    Процесс одного острова в режиме migration='async'.
+
+    Остров сам выполняет max_iterations поколений эпохами по epoch_length.
+    После эпохи он с вероятностью migration_chance кладет мигрантов в очередь
+    соседа по топологии и забирает все, что накопилось в его собственной
+    очереди inboxes[island_id], не дожидаясь остальных островов.
+
+    В results отправляется (island_id, результат эпохи) после каждой эпохи
+    и (island_id, None) по завершении. None во входящей очереди - команда
+    завершиться досрочно (остров выведен или модель остановлена).
+    """
+    random.seed(seed)
+    np.random.seed(seed % 2 ** 32)
+    island = GeneticAlgorithm(genetic_characteristics)
+
+    # Мигранты, которых получатель не успел забрать до своего завершения, не нужны:
+    # процесс не должен ждать их записи в очередь при выходе
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+    iteration = 0
+    while iteration < max_iterations:
+        epoch = min(epoch_length, max_iterations - iteration)
+        results.put((island_id, _run_epoch(island, epoch)))
+        iteration += epoch
+        if iteration >= max_iterations:
+            break
+
+        if migration_manager.should_migrate():
+            inboxes[migration_manager.choose_target(island_id)].put(_take_emigrants(island, migration_manager))
+
+        stop = False
+        while True:
+            try:
+                genomes = inboxes[island_id].get_nowait()
+            except queue.Empty:
+                break
+            if genomes is None:
+                stop = True
+                break
+            _receive_immigrants(island, migration_manager, genomes)
+        if stop:
+            break
+
+    results.put((island_id, None))
+
+
+class _IslandFailure:
+    """
+    Исключение, возникшее в процессе острова, вместе с текстом его traceback.
+
+    Отправляется в очередь results вместо ответа, главный процесс поднимает его заново.
+    """
+
+    def __init__(self, error: Exception):
+        self.traceback = traceback.format_exc()
+        try:
+            pickle.dumps(error)
+        except Exception:
+            # Непереносимое между процессами исключение заменяется описанием
+            error = RuntimeError(repr(error))
+        self.error = error
+
+    def reraise(self, island_id: int):
+        raise self.error from RuntimeError(f"Ошибка в процессе острова {island_id}:\n{self.traceback}")
+
+
+def _island_process(worker, *args):
+    """
+    Точка входа процесса острова: запускает worker(*args), а исключение
+    отправляет в очередь results (последний аргумент), чтобы главный процесс
+    не ждал ответа от упавшего острова.
+    """
+    island_id, results = args[0], args[-1]
+    try:
+        worker(*args)
+    except Exception as error:
+        results.put((island_id, _IslandFailure(error)))
+
+
+# Как часто (в секундах) главный процесс проверяет, живы ли процессы островов, ожидая ответа
+_RESULT_POLL_INTERVAL = 0.5
+
+
 class IslandModel:
     """
     Управляет несколькими независимыми популяциями (островами).
@@ -43,7 +212,20 @@ class IslandModel:
         genetic_characteristics: GeneticCharacteristics,
         migration_chance: float,
         migrants_percent: float,
-        migration_pairs: int
+        migration_pairs: int,
+        execution: str = 'serial',
+        epoch_length: int = 1,
+        seed: Optional[int] = None,
+        migration: str = 'sync',
+        topology: str = 'random',
+        emigrant_policy: str = 'random',
+        immigrant_policy: str = 'append',
+        migration_tournament_size: int = 2,
+        island_stagnation: Optional[int] = None,
+        global_stagnation: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        target: Optional[Union[float, str]] = None,
+        dp_cache: Optional[DPCache] = None
     ):
         """
         Инициализация островной модели.
@@ -53,14 +235,55 @@ class IslandModel:
             genetic_characteristics: Характеристики для генетического алгоритма
             migration_strategy: Стратегия миграции (реализует MigrationStrategyProtocol)
                                Если None, миграция не используется
+            execution: 'serial' - острова по очереди в текущем процессе,
+                       'process' - каждый остров в своем процессе, главный процесс только
+                       раздает эпохи и пересылает мигрантов (self.islands при этом пуст)
+            epoch_length: число поколений между возможными миграциями (эпоха)
+            seed: seed для процессов островов и решений о миграции в режиме 'process'
+                  (None - выводится из текущего состояния random)
+            migration: 'sync' - миграция между эпохами, все острова идут в ногу,
+                       'async' - каждый остров после своей эпохи сам отправляет мигрантов соседу
+                       и забирает пришедших, не ожидая остальных (только для execution='process')
+            topology: топология миграции MigrationManager ('random', 'ring', 'torus', 'star', 'full')
+            emigrant_policy: кого отправлять ('random', 'best', 'tournament', 'diversity'), см. MigrationManager
+            immigrant_policy: как принимать мигрантов ('append', 'worst' - заменить худших,
+                              'random' - заменить случайных)
+            migration_tournament_size: размер турнира для emigrant_policy='tournament'
+            island_stagnation: число поколений без улучшения острова (больше чем на
+                               genetic_characteristics.epsilon), после которого остров выводится
+                               из работы и больше не выполняет поколений (None - острова не выводятся)
+            global_stagnation: число поколений без улучшения лучшего решения до остановки модели
+            time_limit: ограничение времени работы в секундах
+            target: известный оптимум, при достижении которого модель останавливается:
+                    число, 'dp' - точный оптимум (через dp_cache), 'bound' - верхняя оценка self.upper_bound
+            dp_cache: кэш точных решений для target='dp' (None - DPCache() в каталоге по умолчанию)
         """
+        if execution not in ('serial', 'process'):
+            raise ValueError(f"Неизвестный execution: {execution}")
+        if epoch_length < 1:
+            raise ValueError("epoch_length должен быть положительным")
+        if migration not in ('sync', 'async'):
+            raise ValueError(f"Неизвестный migration: {migration}")
+        if migration == 'async' and execution != 'process':
+            raise ValueError("migration='async' поддерживается только для execution='process'")
+        if isinstance(target, str) and target not in ('dp', 'bound'):
+            raise ValueError(f"Неизвестный target: {target}")
+
         self.num_islands = num_islands
+        self.execution = execution
+        self.epoch_length = epoch_length
+        self.seed = seed
+        self.migration = migration
         self.genetic_characteristics = genetic_characteristics
         self.migration_manager = MigrationManager(
             migration_chance=migration_chance, 
             migrants_percent=migrants_percent, 
             migration_pairs=migration_pairs, 
-            num_islands=num_islands
+            num_islands=num_islands,
+            topology=topology,
+            emigrant_policy=emigrant_policy,
+            immigrant_policy=immigrant_policy,
+            tournament_size=migration_tournament_size
         )
         
 
@@ -69,8 +292,68 @@ class IslandModel:
         self.best_entity_overall: Optional[Entity] = None
         self.best_fitness_history: List[float] = []  # История лучшего fitness по всем островам
         self.island_fitness_history: List[List[float]] = [[] for _ in range(num_islands)]  # История для каждого острова
+        # Верхняя оценка оптимума (линейная релаксация) для оценки качества без DP
+        self.upper_bound = KnapsackBounds(
+            genetic_characteristics.min_vals,
+            genetic_characteristics.weights,
+            genetic_characteristics.costs,
+            genetic_characteristics.max_weight
+        ).upper_bound()
+
+        # Критерии остановки; монитор создается заново при каждом запуске
+        self.island_stagnation = island_stagnation
+        self.global_stagnation = global_stagnation
+        self.time_limit = time_limit
+        self.dp_cache = dp_cache
+        self.target = self._resolve_target(target)
+        self.convergence = self._make_convergence_monitor()
+        self.stop_reason: Optional[str] = None
+        self.wall_time: Optional[float] = None
         
         self._initialize_islands()
+
+    def _resolve_target(self, target: Optional[Union[float, str]]) -> Optional[float]:
+        """
+        Числовое значение target: 'bound' - верхняя оценка, 'dp' - точный оптимум.
+        """
+        if target == 'bound':
+            return self.upper_bound
+        if target == 'dp':
+            characteristics = self.genetic_characteristics
+            dp_cache = self.dp_cache if self.dp_cache is not None else DPCache()
+            return dp_cache.solve(
+                min_vals=characteristics.min_vals,
+                weights=characteristics.weights,
+                costs=characteristics.costs,
+                max_weight=characteristics.max_weight
+            )[0]
+        return target
+
+    def _make_convergence_monitor(self) -> ConvergenceMonitor:
+        return ConvergenceMonitor(
+            num_islands=self.num_islands,
+            island_window=self.island_stagnation,
+            global_window=self.global_stagnation,
+            epsilon=self.genetic_characteristics.epsilon,
+            time_limit=self.time_limit,
+            target=self.target
+        )
+
+    def _check_convergence(self, iteration: int) -> bool:
+        """
+        Обновить монитор после iteration поколений (все острова идут в ногу).
+
+        Returns:
+            True, если модель нужно остановить (причина - в self.stop_reason)
+        """
+        for island_id, history in enumerate(self.island_fitness_history):
+            self.convergence.update_island(island_id, iteration, history[-1])
+        self.stop_reason = self.convergence.update_global(iteration, self.best_fitness_history[-1])
+        return self.stop_reason is not None
+
+    def _is_migration_pair(self, source: int, target: int) -> bool:
+        # Выведенные острова не отправляют и не принимают мигрантов
+        return self.convergence.is_active(source) and self.convergence.is_active(target)
     
     def _initialize_islands(self):
         """
@@ -79,6 +362,9 @@ class IslandModel:
         - Каждый остров получает копию genetic_characteristics
         - Инициализировать self.island_fitness_history для каждого острова
         """
+        if self.execution == 'process':
+            # Острова создаются внутри процессов при запуске алгоритма
+            return
         self.islands = [GeneticAlgorithm(self.genetic_characteristics) for _ in range(self.num_islands)]
         
     
@@ -135,19 +421,16 @@ class IslandModel:
         if not self.migration_manager.should_migrate():
             return
 
-        migration_pairs = self.migration_manager.get_random_migration_pairs()
+        migration_pairs = self.migration_manager.get_migration_pairs()
 
         for source, target in migration_pairs:
-            source_entities = self.get_island_entities(source)
-            migrants = self.migration_manager.select_migrants(source_entities)
-            migrant_entities = [migrant[1] for migrant in migrants]
-            migrant_indeces = [migrant[0] for migrant in migrants]
-
-            # Add migrants to the target island
-            self.add_migrants_to_island(island_id=target, migrants=migrant_entities)
-
-            # Remove migrants from the source island
-            self.remove_enitites_from_island(island_id=source, migrants_indeces=migrant_indeces)
+            if not self._is_migration_pair(source, target):
+                continue
+            # Мигранты выбираются по индексам и переносятся без копирования популяции источника
+            source_island, target_island = self.islands[source], self.islands[target]
+            migrant_indeces = _select_emigrants(source_island, self.migration_manager)
+            _make_room(target_island, self.migration_manager, len(migrant_indeces))
+            source_island.move_emigrants(migrant_indeces, target_island)
         
         
 
@@ -234,13 +517,26 @@ class IslandModel:
     
 
         max_iterations = self.genetic_characteristics.max_iterations
+        self.convergence = self._make_convergence_monitor()
+        self.stop_reason = None
+        self.convergence.start()
+
+        if self.execution == 'process':
+            self._run_processes(max_iterations)
+            self._finish_run()
+            if show_progression_type == 'plot':
+                self.plot_progression(goal=goal)
+            return
+
         for iteration in range(max_iterations):
-            # Выполнить одну итерацию эволюции на каждом острове
-            for island in self.islands:
-                island.next_iteration()
+            # Выполнить одну итерацию эволюции на каждом активном острове
+            for island_id, island in enumerate(self.islands):
+                if self.convergence.is_active(island_id):
+                    island.next_iteration()
 
-            # Выполнить миграцию
-            self._perform_migration(iteration)
+            # Выполнить миграцию в конце эпохи
+            if (iteration + 1) % self.epoch_length == 0:
+                self._perform_migration(iteration)
 
             # Обновить лучшую особь
             self._update_best_entity()
@@ -248,11 +544,213 @@ class IslandModel:
             # Собрать статистику
             self._collect_statistics()
 
+            if self._check_convergence(iteration + 1):
+                break
+
+        self._finish_run()
+
         # Визуализация
         if show_progression_type == 'plot':
             self.plot_progression(goal=goal)
 
     
+    def _finish_run(self):
+        if self.stop_reason is None:
+            self.stop_reason = 'max_iterations'
+        self.wall_time = self.convergence.elapsed()
+
+    def island_seed(self, island_id: int) -> int:
+        """
+        Seed процесса острова, выведенный из self.seed.
+        """
+        if self.seed is None:
+            return random.getrandbits(63)
+        sequence = np.random.SeedSequence(self.seed, spawn_key=(island_id,))
+        return int(sequence.generate_state(1, dtype=np.uint64)[0] >> 1)
+
+    def _start_processes(self, max_iterations: int):
+        context = multiprocessing.get_context()
+        self._results = context.Queue()
+        self._commands = [context.Queue() for _ in range(self.num_islands)]
+        self._workers = []
+        for island_id in range(self.num_islands):
+            if self.migration == 'async':
+                # self._commands служат входящими очередями мигрантов
+                target = _async_island_worker
+                args = (island_id, self.genetic_characteristics, self.migration_manager, self.island_seed(island_id),
+                        max_iterations, self.epoch_length, self._commands, self._results)
+            else:
+                target = _island_worker
+                args = (island_id, self.genetic_characteristics, self.migration_manager, self.island_seed(island_id),
+                        self._commands[island_id], self._results)
+            worker = context.Process(target=_island_process, args=(target,) + args, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _stop_processes(self):
+        # При migration='async' self._commands - входящие очереди, None в них - команда завершиться
+        stop = ('stop', None) if self.migration == 'sync' else None
+        for commands in self._commands:
+            commands.put(stop)
+        for worker in self._workers:
+            while worker.is_alive():
+                worker.join(_RESULT_POLL_INTERVAL)
+                # После ошибки ответы островов никто не читает: освобождаем очередь,
+                # чтобы процессы не ждали ее при выходе
+                self._drain_results()
+        self._workers = []
+
+    def _drain_results(self):
+        while True:
+            try:
+                self._results.get_nowait()
+            except queue.Empty:
+                return
+
+    def _next_result(self):
+        """
+        Следующий ответ острова (island_id, ответ).
+
+        Исключение острова поднимается заново; если процесс острова завершился
+        аварийно, не отправив ответа, поднимается RuntimeError.
+        """
+        while True:
+            try:
+                island_id, reply = self._results.get(timeout=_RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                for island_id, worker in enumerate(self._workers):
+                    if worker.exitcode not in (None, 0):
+                        raise RuntimeError(f"Процесс острова {island_id} завершился с кодом {worker.exitcode}")
+                continue
+            if isinstance(reply, _IslandFailure):
+                reply.reraise(island_id)
+            return island_id, reply
+
+    def _request(self, island_ids: Iterable[int], command: str, payload=None) -> Dict[int, object]:
+        """
+        Отправить команду островам и дождаться ответа от каждого.
+        """
+        island_ids = list(island_ids)
+        for island_id in island_ids:
+            self._commands[island_id].put((command, payload))
+        replies = {}
+        for _ in island_ids:
+            island_id, reply = self._next_result()
+            replies[island_id] = reply
+        return replies
+
+    def _run_processes(self, max_iterations: int):
+        """
+        Основной цикл режима execution='process'.
+
+        При migration='sync' острова выполняют по epoch_length поколений в своих
+        процессах, после каждой эпохи главный процесс выполняет миграцию.
+        При migration='async' главный процесс только собирает результаты эпох.
+        """
+        if self.seed is not None:
+            random.seed(self.seed)
+        self._start_processes(max_iterations)
+        try:
+            if self.migration == 'async':
+                self._collect_async()
+                return
+
+            iteration = 0
+            while iteration < max_iterations:
+                epoch = min(self.epoch_length, max_iterations - iteration)
+                active = [i for i in range(self.num_islands) if self.convergence.is_active(i)]
+                self._record_epoch(self._request(active, 'run', epoch), epoch)
+                iteration += epoch
+                if self._check_convergence(iteration):
+                    break
+                if iteration < max_iterations:
+                    self._perform_process_migration()
+        finally:
+            self._stop_processes()
+
+    def _perform_process_migration(self):
+        """
+        То же, что _perform_migration, для островов в отдельных процессах.
+        """
+        if not self.migration_manager.should_migrate():
+            return
+
+        for source, target in self.migration_manager.get_migration_pairs():
+            if not self._is_migration_pair(source, target):
+                continue
+            genomes = self._request([source], 'emigrate')[source]
+            self._commands[target].put(('immigrate', genomes))
+
+    def _collect_async(self):
+        """
+        Принимать результаты эпох островов в порядке поступления до завершения всех островов.
+
+        Критерии остановки проверяются после каждой эпохи: застоявшемуся
+        острову, а при остановке модели - всем островам, во входящую очередь
+        отправляется None.
+        """
+        finished = set()
+        while len(finished) < self.num_islands:
+            island_id, reply = self._next_result()
+            if reply is None:
+                finished.add(island_id)
+                continue
+            self._record_island_epoch(island_id, reply)
+
+            history = self.island_fitness_history[island_id]
+            if self.convergence.update_island(island_id, len(history), history[-1]):
+                self._commands[island_id].put(None)
+            if self.stop_reason is None:
+                iteration = max(len(history) for history in self.island_fitness_history)
+                self.stop_reason = self.convergence.update_global(iteration, self.best_entity_overall.get_fitness())
+                if self.stop_reason is not None:
+                    for other in range(self.num_islands):
+                        if other not in finished and self.convergence.is_active(other):
+                            self._commands[other].put(None)
+
+        # Острова, завершившиеся раньше, дополняются своим последним лучшим fitness
+        length = max(len(history) for history in self.island_fitness_history)
+        for history in self.island_fitness_history:
+            history.extend([history[-1]] * (length - len(history)))
+        self._extend_best_history(self.island_fitness_history)
+
+    def _record_epoch(self, replies: Dict[int, object], epoch: int):
+        """
+        Обновить лучшую особь и статистику по ответам островов за эпоху.
+
+        Выведенные острова (без ответа) дополняют историю своим последним лучшим fitness.
+        """
+        for island_id in range(self.num_islands):
+            if island_id in replies:
+                self._record_island_epoch(island_id, replies[island_id])
+            else:
+                history = self.island_fitness_history[island_id]
+                history.extend([history[-1]] * epoch)
+        self._extend_best_history([history[-epoch:] for history in self.island_fitness_history])
+
+    def _record_island_epoch(self, island_id: int, reply):
+        history, best_genome, best_fitness = reply
+        self.island_fitness_history[island_id].extend(history)
+        if self.best_entity_overall is None or best_fitness > self.best_entity_overall.get_fitness():
+            self.best_entity_overall = Entity(
+                min_value=self.genetic_characteristics.min_vals,
+                max_weight=self.genetic_characteristics.max_weight,
+                weights=self.genetic_characteristics.weights,
+                costs=self.genetic_characteristics.costs,
+                current_state=best_genome,
+                mutation_probability=self.genetic_characteristics.mutation_probability,
+                fitness=best_fitness
+            )
+
+    def _extend_best_history(self, histories):
+        """
+        Дописать в best_fitness_history лучший fitness по всем островам для каждого поколения.
+        """
+        best_fitness = self.best_fitness_history[-1] if self.best_fitness_history else None
+        for step in zip(*histories):
+            best_fitness = max(step) if best_fitness is None else max(best_fitness, max(step))
+            self.best_fitness_history.append(best_fitness)
+
     def plot_progression(self, goal=None):
         """
         Визуализировать прогресс всех островов.
@@ -316,18 +814,50 @@ class IslandModel:
         plt.tight_layout()
         plt.show()
     
+    def get_optimality_gap(self) -> Optional[float]:
+        """
+        Относительный разрыв лучшего решения до верхней оценки self.upper_bound.
+
+        Returns:
+            (upper_bound - fitness) / upper_bound, не меньше разрыва до оптимума;
+            None, если решение еще не найдено
+        """
+        if self.best_entity_overall is None:
+            return None
+        return optimality_gap(self.best_entity_overall.get_fitness(), self.upper_bound)
+
     def get_statistics(self) -> dict:
         """
-        TODO: Вернуть статистику по работе алгоритма.
+        Статистика по работе алгоритма.
         
         Returns:
             dict с ключами:
                 - 'best_fitness': лучший fitness
                 - 'best_entity': лучшая особь
                 - 'island_best_fitness': список лучших fitness по островам
-                - 'convergence_iteration': итерация достижения лучшего результата
+                - 'convergence_iteration': итерация (с 1) достижения лучшего результата
+                - 'iterations': число выполненных поколений
+                - 'wall_time': время работы start_algorithm в секундах
+                - 'stop_reason': причина остановки ('max_iterations', 'target', 'time_limit',
+                                 'stagnation', 'islands_retired')
+                - 'retired_islands': выведенные из работы острова
+                - 'optimality_gap': разрыв до верхней оценки (get_optimality_gap)
         """
-        pass
+        best_fitness = self.best_entity_overall.get_fitness() if self.best_entity_overall is not None else None
+        convergence_iteration = None
+        if best_fitness is not None and self.best_fitness_history:
+            convergence_iteration = self.best_fitness_history.index(best_fitness) + 1
+        return {
+            'best_fitness': best_fitness,
+            'best_entity': self.best_entity_overall,
+            'island_best_fitness': [history[-1] if history else None for history in self.island_fitness_history],
+            'convergence_iteration': convergence_iteration,
+            'iterations': len(self.best_fitness_history),
+            'wall_time': self.wall_time,
+            'stop_reason': self.stop_reason,
+            'retired_islands': sorted(self.convergence.retired),
+            'optimality_gap': self.get_optimality_gap()
+        }
 
 
 
@@ -356,8 +886,7 @@ if __name__ == '__main__':
 
 
         
-    dpsolver = DPSolver(constraints=initial_conditions[0]['min_vals'],weights=initial_conditions[0]['weights'],costs=initial_conditions[0]['costs'],max_weight=initial_conditions[0]['max_weight'])
-    result_fitness_dp, result_dp = dpsolver.solve()
+    result_fitness_dp, result_dp = DPCache().solve_condition(initial_conditions[0])
 
     world = IslandModel(num_islands=4, genetic_characteristics=genetic_characteristics, migration_chance=0.01, migrants_percent=0.1, migration_pairs=2)
     world.start_algorithm(show_progression_type='plot', goal=result_fitness_dp)
\ No newline at end of file
@@ -1,19 +1,29 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from classes.Entity import Entity
+from classes.Selection import top_indices
+from math import isqrt
 import random
+import numpy as np
 
 
 class MigrationManager:
     """
     Управляет миграцией особей между островами (популяциями).
     """
+    TOPOLOGIES = ('random', 'ring', 'torus', 'star', 'full')
+    EMIGRANT_POLICIES = ('random', 'best', 'tournament', 'diversity')
+    IMMIGRANT_POLICIES = ('append', 'worst', 'random')
     
     def __init__(
         self,
         migration_chance: float,
         migrants_percent: float,
         migration_pairs: int,
-        num_islands: int
+        num_islands: int,
+        topology: str = 'random',
+        emigrant_policy: str = 'random',
+        immigrant_policy: str = 'append',
+        tournament_size: int = 2
     ):
         """
         Инициализация менеджера миграции.
@@ -22,13 +32,75 @@ class MigrationManager:
             migration_chance: Вероятность миграции
             migrants_percent: Процент особей для миграции от каждого острова
             migration_pairs: Количество пар островов для миграции
+            topology: граф соседства островов:
+                      'random' - любая пара островов,
+                      'ring' - остров i отправляет мигрантов острову i + 1,
+                      'torus' - решетка rows x cols с замыканием краев, 4 соседа,
+                      'star' - остров 0 связан со всеми остальными,
+                      'full' - каждый остров связан с каждым
+            emigrant_policy: кого отправлять:
+                      'random' - случайные особи,
+                      'best' - лучшие по fitness,
+                      'tournament' - победители турниров без повторов,
+                      'diversity' - самые удаленные от центра популяции (новый генетический материал)
+            immigrant_policy: что делать на острове-получателе:
+                      'append' - мигранты добавляются к популяции,
+                      'worst' - мигранты заменяют худших особей,
+                      'random' - мигранты заменяют случайных особей
+            tournament_size: размер турнира для emigrant_policy='tournament'
         """
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Неизвестная topology: {topology}")
+        if emigrant_policy not in self.EMIGRANT_POLICIES:
+            raise ValueError(f"Неизвестная emigrant_policy: {emigrant_policy}")
+        if immigrant_policy not in self.IMMIGRANT_POLICIES:
+            raise ValueError(f"Неизвестная immigrant_policy: {immigrant_policy}")
+
         self.migration_chance = migration_chance
         if migrants_percent > 1:
             migrants_percent = migrants_percent / 100
         self.num_migrants = migrants_percent
         self.migration_pairs = migration_pairs
         self.num_islands = num_islands
+        self.topology = topology
+        self.emigrant_policy = emigrant_policy
+        self.immigrant_policy = immigrant_policy
+        self.tournament_size = tournament_size
+        self._neighbours = [self._build_neighbours(island_id) for island_id in range(num_islands)]
+
+    def _build_neighbours(self, island_id: int) -> List[int]:
+        n = self.num_islands
+        if n < 2:
+            return []
+        if self.topology == 'ring':
+            return [(island_id + 1) % n]
+        if self.topology == 'star':
+            return list(range(1, n)) if island_id == 0 else [0]
+        if self.topology == 'torus':
+            # Наибольший делитель n, не превосходящий sqrt(n) - число строк решетки
+            rows = next(r for r in range(isqrt(n), 0, -1) if n % r == 0)
+            cols = n // rows
+            row, col = divmod(island_id, cols)
+            candidates = [
+                ((row - 1) % rows) * cols + col,
+                ((row + 1) % rows) * cols + col,
+                row * cols + (col - 1) % cols,
+                row * cols + (col + 1) % cols
+            ]
+            return sorted(set(candidates) - {island_id})
+        return [other for other in range(n) if other != island_id]
+
+    def neighbours(self, island_id: int) -> List[int]:
+        """
+        Острова, которым island_id может отправлять мигрантов в выбранной топологии.
+        """
+        return self._neighbours[island_id]
+
+    def choose_target(self, source: int) -> int:
+        """
+        Случайный сосед острова source - получатель его мигрантов.
+        """
+        return random.choice(self._neighbours[source])
 
     def should_migrate(self) -> bool:
         return random.random() < self.migration_chance
@@ -59,7 +131,76 @@ class MigrationManager:
             pairs.append((source, target))
         return pairs
 
-    
+    def get_migration_pairs(self) -> List[Tuple[int, int]]:
+        """
+        Пары (source, target) для одной миграции с учетом топологии.
+
+        Для 'random' совпадает с get_random_migration_pairs(), для остальных
+        топологий источник выбирается случайно, а получатель - среди его соседей.
+        """
+        if self.topology == 'random':
+            return self.get_random_migration_pairs()
+
+        pairs = []
+        for _ in range(self.migration_pairs):
+            source = random.randint(0, self.num_islands - 1)
+            pairs.append((source, self.choose_target(source)))
+        return pairs
+
+    def select_migrant_indices(self, population_size: int) -> List[int]:
+        """
+        Индексы особей для миграции из популяции размера population_size.
+
+        Нужен только размер популяции, поэтому особи не перебираются и не копируются.
+        """
+        num_migrants = int(self.num_migrants * population_size)
+        return random.sample(range(population_size), num_migrants)
+
+    def select_emigrant_indices(self, fitness: np.ndarray, genomes: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Индексы эмигрантов по политике emigrant_policy.
+
+        Args:
+            fitness: fitness всех особей острова
+            genomes: геномы особей строками матрицы (нужны только для 'diversity')
+
+        Returns:
+            np.ndarray[int64] различных индексов, int(migrants_percent * размер популяции) штук
+        """
+        fitness = np.asarray(fitness)
+        size = fitness.size
+        num_migrants = int(self.num_migrants * size)
+        if num_migrants == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if self.emigrant_policy == 'best':
+            return top_indices(fitness, num_migrants)
+        if self.emigrant_policy == 'tournament':
+            # Непересекающиеся турниры из одной случайной выборки: победители не повторяются
+            tournament_size = max(1, min(self.tournament_size, size // num_migrants))
+            contestants = np.array(random.sample(range(size), num_migrants * tournament_size), dtype=np.int64)
+            contestants = contestants.reshape(num_migrants, tournament_size)
+            return contestants[np.arange(num_migrants), np.argmax(fitness[contestants], axis=1)]
+        if self.emigrant_policy == 'diversity':
+            genomes = np.asarray(genomes, dtype=np.float64)
+            spread = np.sum((genomes - genomes.mean(axis=0)) ** 2, axis=1)
+            return top_indices(spread, num_migrants)
+        return np.array(self.select_migrant_indices(size), dtype=np.int64)
+
+    def select_replaced_indices(self, fitness: np.ndarray, num_immigrants: int) -> np.ndarray:
+        """
+        Индексы особей острова-получателя, которых заменят num_immigrants мигрантов.
+
+        Для 'append' никто не заменяется; иначе заменяется не больше особей, чем есть на острове.
+        """
+        fitness = np.asarray(fitness)
+        count = min(num_immigrants, fitness.size)
+        if self.immigrant_policy == 'append' or count == 0:
+            return np.empty(0, dtype=np.int64)
+        if self.immigrant_policy == 'worst':
+            return top_indices(-fitness, count)
+        return np.array(random.sample(range(fitness.size), count), dtype=np.int64)
+
     def select_migrants(
         self, 
         population_entities: List[Entity]
@@ -71,10 +212,8 @@ class MigrationManager:
             population_entities: Список всех особей в популяции
             
         Returns:
-            Список выбранных особей для миграции с их индексами
+            Список выбранных особей для миграции с их индексами (по убыванию индексов)
         """
-        num_migrants = int(self.num_migrants * len(population_entities))
-        selected_indices = random.sample(range(len(population_entities)), num_migrants)
-        
-        return sorted([(idx, population_entities[idx]) for idx in selected_indices], reverse=True)
-    
+        selected_indices = self.select_migrant_indices(len(population_entities))
+        # Сортировка только по индексу: сами Entity не сравниваются
+        return [(idx, population_entities[idx]) for idx in sorted(selected_indices, reverse=True)]
@@ -1,5 +1,6 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from classes.Entity import Entity
+from classes.Selection import SelectionStrategy, TournamentSelection, select_with_elite
 import random
 import numpy as np
 
@@ -9,10 +10,22 @@ random.seed(random.randint(0, 100))
 
 class Population:
 
-    def __init__(self, entities: List[Entity], desired_amount: int, tournament_size: int):
+    def __init__(self, entities: List[Entity], desired_amount: int, tournament_size: int, fitness: Optional[np.ndarray] = None):
         self.entities = entities
         self.desired_amount = desired_amount
         self.tournament_size = tournament_size
+        # Лучшая особь (индекс, fitness), поддерживается при добавлении и удалении особей
+        self._best_index = None
+        self._best_fitness = None
+        if fitness is not None and len(entities):
+            # fitness особей уже известен: лучшая находится одним argmax
+            self._best_index = int(np.argmax(fitness))
+            self._best_fitness = fitness[self._best_index]
+        else:
+            self._update_best(0)
+
+    def __len__(self) -> int:
+        return len(self.entities)
 
     def outbreeding(self) -> Tuple[Entity, Entity]:
         random_index = random.randrange(len(self.entities))
@@ -45,27 +58,63 @@ class Population:
         length = len(parent1.current_state)
 
         point1, point2 = sorted(random.sample(range(length), 2))
+        segment_cost, segment_weight = self._segment_difference(parent1, parent2, point1, point2)
 
-        offspring1 = np.concatenate((parent1.current_state[:point1], parent2.current_state[point1:point2], parent1.current_state[point2:]))
-        offspring2 = np.concatenate((parent2.current_state[:point1], parent1.current_state[point1:point2], parent2.current_state[point2:]))
+        new_parent1 = self._make_child(parent1, parent2, point1, point2, segment_cost, segment_weight)
+        new_parent2 = self._make_child(parent2, parent1, point1, point2, -segment_cost, -segment_weight)
+        return (new_parent1, new_parent2)
 
-        new_parent1 = Entity(
-            min_value=parent1.min_value,
-            max_weight=parent1.max_weight,
-            weights=parent1.weights,
-            costs=parent1.costs,
-            current_state=offspring1,
-            mutation_probability=parent1.mutation_probability
-        )
-        new_parent2 = Entity(
-            min_value=parent2.min_value,
-            max_weight=parent2.max_weight,
-            weights=parent2.weights,
-            costs=parent2.costs,
-            current_state=offspring2,
-            mutation_probability=parent2.mutation_probability
+    def feasible_crossover(self, parent1: Entity, parent2: Entity) -> List[Entity]:
+        """
+        Двухточечное скрещивание, возвращающее только потомков, не превышающих max_weight.
+
+        Вес потомков известен по префиксным суммам родителей до создания геномов,
+        поэтому для недопустимых потомков массивы не создаются. Каждый ген потомка
+        взят у одного из родителей на той же позиции, так что минимальные
+        количества выполняются, если они выполнены у родителей.
+        """
+        if len(parent1.current_state) != len(parent2.current_state):
+            raise ValueError("Both parents must have the same length.")
+
+        point1, point2 = sorted(random.sample(range(len(parent1.current_state)), 2))
+        segment_cost, segment_weight = self._segment_difference(parent1, parent2, point1, point2)
+
+        children = []
+        if parent1.get_current_weight() + segment_weight <= parent1.max_weight:
+            children.append(self._make_child(parent1, parent2, point1, point2, segment_cost, segment_weight))
+        if parent2.get_current_weight() - segment_weight <= parent2.max_weight:
+            children.append(self._make_child(parent2, parent1, point1, point2, -segment_cost, -segment_weight))
+        return children
+
+    @staticmethod
+    def _segment_difference(parent1: Entity, parent2: Entity, point1: int, point2: int) -> Tuple[int, int]:
+        """
+        На сколько меняются стоимость и вес parent1, если заменить его отрезок
+        [point1, point2) отрезком parent2 (для parent2 - с обратным знаком).
+        """
+        costs1, weights1 = parent1.get_prefix_sums()
+        costs2, weights2 = parent2.get_prefix_sums()
+        segment_cost = (costs2[point2] - costs2[point1]) - (costs1[point2] - costs1[point1])
+        segment_weight = (weights2[point2] - weights2[point1]) - (weights1[point2] - weights1[point1])
+        return segment_cost, segment_weight
+
+    @staticmethod
+    def _make_child(base: Entity, donor: Entity, point1: int, point2: int, segment_cost: int, segment_weight: int) -> Entity:
+        """
+        Потомок: гены base с отрезком [point1, point2) от donor, fitness и вес заданы заранее.
+        """
+        # Потомок отличается от base только обменянным отрезком
+        costs, weights = base.get_prefix_sums()
+        return Entity(
+            min_value=base.min_value,
+            max_weight=base.max_weight,
+            weights=base.weights,
+            costs=base.costs,
+            current_state=np.concatenate((base.current_state[:point1], donor.current_state[point1:point2], base.current_state[point2:])),
+            mutation_probability=base.mutation_probability,
+            fitness=costs[-1] + segment_cost,
+            current_weight=weights[-1] + segment_weight
         )
-        return (new_parent1, new_parent2)
 
     # @profile
     def tournament_winner(self) -> Entity:
@@ -81,21 +130,38 @@ class Population:
         return random.choice(winners)
 
     def tournament_population(self) -> 'Population':
+        return self.select_population(TournamentSelection(self.tournament_size))
+
+    def select_population(self, strategy: SelectionStrategy, offspring_start: int = 0, elite: int = 0) -> 'Population':
+        """
+        Новая популяция из desired_amount особей, выбранных стратегией отбора.
+
+        :param strategy: SelectionStrategy, стратегия отбора
+        :param offspring_start: int, индекс первого потомка текущего поколения
+        :param elite: int, сколько лучших особей перенести без отбора (элитизм)
+        """
         if self.desired_amount > len(self.entities):
             raise ValueError("desired_amount cannot be greater than the population size.")
 
-        new_population = []
+        fitness = np.array([entity.get_fitness() for entity in self.entities])
+        selected = select_with_elite(strategy, fitness, self.desired_amount, offspring_start, elite)
 
-        while len(new_population) < self.desired_amount:
-            winner = self.tournament_winner()
-            new_population.append(winner)
-
-        return Population(new_population, self.desired_amount, self.tournament_size)
+        return Population([self.entities[i] for i in selected], self.desired_amount, self.tournament_size, fitness[selected])
 
     def get_population_fitness(self) -> Tuple[Entity, int]:
-        max_fitness = max(entity.get_fitness() for entity in self.entities)
-        max_fitness_entity = [entity for entity in self.entities if entity.get_fitness() == max_fitness]
-        return random.choice(max_fitness_entity), max_fitness
+        if self._best_index is None:
+            raise ValueError("Population is empty.")
+        return self.entities[self._best_index], self._best_fitness
+
+    def _update_best(self, start: int):
+        """
+        Учесть в лучшей особи особей, начиная с индекса start.
+        """
+        for i in range(start, len(self.entities)):
+            fitness = self.entities[i].get_fitness()
+            if self._best_index is None or fitness > self._best_fitness:
+                self._best_index = i
+                self._best_fitness = fitness
 
     def get_distant_entity(self, first_entity: Entity, second_entity: Entity):
         if len(first_entity.current_state) != len(second_entity.current_state):
@@ -104,11 +170,52 @@ class Population:
     
     def get_entities(self):
         return self.entities
+
+    def get_fitness_array(self) -> np.ndarray:
+        return np.array([entity.get_fitness() for entity in self.entities])
+
+    def get_genomes(self) -> np.ndarray:
+        return np.array([entity.current_state for entity in self.entities]).reshape(len(self.entities), -1)
     
     def add_entities(self, entities: List[Entity]):
+        start = len(self.entities)
         self.entities.extend(entities)
+        self._update_best(start)
         
     def remove_entities(self, indeces: List[int]):
-        self.entities = [self.entities[i] for i in range(len(self.entities)) if i not in indeces]
+        # Множество вместо списка: проверка принадлежности O(1), удаление за один проход
+        removed = set(indeces)
+        self.entities = [entity for i, entity in enumerate(self.entities) if i not in removed]
+
+        if self._best_index in removed:
+            self._best_index = None
+            self._update_best(0)
+        elif self._best_index is not None:
+            self._best_index -= sum(1 for i in removed if i < self._best_index)
+
+    def pop_entities(self, indeces: List[int]) -> List[Entity]:
+        """
+        Удалить особей с индексами indeces и вернуть их (для миграции).
+
+        Удаление перестановкой с конца: место каждой удаляемой особи занимает
+        последняя из оставшихся, поэтому стоимость O(len(indeces)), а не
+        O(размер популяции). Порядок оставшихся особей меняется.
+        """
+        popped = []
+        best_removed = False
+        for index in sorted(set(indeces), reverse=True):
+            popped.append(self.entities[index])
+            last = len(self.entities) - 1
+            if index == self._best_index:
+                best_removed = True
+            elif last == self._best_index:
+                self._best_index = index
+            self.entities[index] = self.entities[last]
+            self.entities.pop()
+
+        if best_removed:
+            self._best_index = None
+            self._update_best(0)
+        return popped
 
 
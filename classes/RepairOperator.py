@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+import numpy as np
+
+
+class RepairOperator(ABC):
+    """
+    Оператор восстановления недопустимых потомков.
+
+    Вместо отбрасывания потомок, превысивший max_weight, исправляется так,
+    чтобы стать допустимым. Операторы работают с пачкой геномов на месте.
+    """
+
+    @abstractmethod
+    def repair(self, genomes: np.ndarray, fitness: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        """
+        Исправить недопустимые строки genomes на месте, синхронно обновляя fitness и weight.
+
+        :return: np.ndarray[bool], маска строк, которые были недопустимы и стали допустимыми
+        """
+
+
+class GreedyRepair(RepairOperator):
+    """
+    Жадное восстановление: из перегруженного рюкзака убираются предметы с
+    наименьшим отношением стоимости к весу, пока вес не станет допустимым.
+    Количества не опускаются ниже min_value.
+
+    Цикл идет по предметам (в порядке возрастания cost/weight), а не по
+    потомкам: на каждом шаге для всех перегруженных строк сразу вычисляется,
+    сколько единиц предмета нужно убрать.
+
+    Args:
+        min_value: минимальные количества предметов
+        weights: веса предметов
+        costs: стоимости предметов
+        max_weight: вместимость рюкзака
+    """
+
+    def __init__(self, min_value, weights, costs, max_weight):
+        self.min_value = np.asarray(min_value, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.costs = np.asarray(costs, dtype=np.int64)
+        self.max_weight = max_weight
+        # Сначала убираем самые "невыгодные" предметы
+        self.order = np.argsort(self.costs / self.weights, kind='stable')
+
+    def repair(self, genomes: np.ndarray, fitness: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        repaired = np.zeros(len(genomes), dtype=bool)
+        rows = np.flatnonzero(weight > self.max_weight)
+        if rows.size == 0:
+            return repaired
+
+        excess = weight[rows] - self.max_weight
+        for item in self.order:
+            item_weight = self.weights[item]
+            removable = np.maximum(genomes[rows, item] - self.min_value[item], 0)
+            # ceil(excess / item_weight) единиц, но не больше, чем есть сверх минимума
+            drop = np.minimum(removable, np.maximum(-(-excess // item_weight), 0))
+
+            genomes[rows, item] -= drop
+            fitness[rows] -= drop * self.costs[item]
+            weight[rows] -= drop * item_weight
+            excess -= drop * item_weight
+            if np.all(excess <= 0):
+                break
+
+        repaired[rows[excess <= 0]] = True
+        return repaired
+
+
+def make_repair_operator(name: str, min_value, weights, costs, max_weight) -> Optional[RepairOperator]:
+    """
+    Оператор восстановления по названию режима.
+
+    :param name: 'discard' - недопустимые потомки отбрасываются (оператора нет),
+                 'greedy' - GreedyRepair
+    :return: RepairOperator или None для 'discard'
+    """
+    if name == 'discard':
+        return None
+    if name == 'greedy':
+        return GreedyRepair(min_value, weights, costs, max_weight)
+    raise ValueError(f"Неизвестный режим восстановления: {name}")
@@ -0,0 +1,224 @@
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+import numpy as np
+
+
+class SelectionStrategy(ABC):
+    """
+    Стратегия отбора особей в следующее поколение.
+
+    Стратегия работает только с массивом fitness и возвращает индексы
+    выбранных особей (с повторениями), поэтому одинаково применяется к
+    Population и ArrayPopulation.
+
+    Args:
+        rng: генератор numpy, по умолчанию выводится из модуля random
+    """
+
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        # Привязываем numpy-генератор к модулю random, чтобы random.seed управлял обоими
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+    @abstractmethod
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        """
+        Выбрать amount особей.
+
+        :param fitness: np.ndarray, fitness всех особей популяции
+        :param amount: int, размер новой популяции
+        :param offspring_start: int, индекс первого потомка текущего поколения
+                                (особи до него - родители); нужен только для (μ,λ)
+        :return: np.ndarray[int64], индексы выбранных особей
+        """
+
+    def _universal_sampling(self, weights: np.ndarray, amount: int) -> np.ndarray:
+        """
+        Стохастическая универсальная выборка: amount равноотстоящих указателей
+        с одним случайным сдвигом по накопленным весам. O(n + amount log n).
+        """
+        cumulative = np.cumsum(weights, dtype=np.float64)
+        total = cumulative[-1]
+        if total <= 0:
+            return self.rng.integers(0, len(weights), size=amount)
+        pointers = (self.rng.random() + np.arange(amount)) * (total / amount)
+        indices = np.searchsorted(cumulative, pointers, side='right')
+        # Указатели идут по порядку индексов, перемешиваем, чтобы порядок особей был случайным
+        return self.rng.permutation(np.minimum(indices, len(weights) - 1))
+
+
+def top_indices(fitness: np.ndarray, amount: int) -> np.ndarray:
+    """
+    Индексы amount особей с наибольшим fitness (без полной сортировки, O(n)).
+    """
+    fitness = np.asarray(fitness)
+    if amount >= fitness.size:
+        return np.arange(fitness.size)
+    return np.argpartition(-fitness, amount - 1)[:amount]
+
+
+def select_with_elite(strategy: SelectionStrategy, fitness: np.ndarray, amount: int, offspring_start: int = 0, elite: int = 0) -> np.ndarray:
+    """
+    Отбор с элитизмом: elite лучших особей переносятся без отбора (через
+    argpartition, без сортировки), остальные amount - elite мест заполняет
+    strategy среди остальных особей. Элита исключается из кандидатов, иначе
+    стратегии без повторов ((μ+λ), (μ,λ)) выбрали бы ее второй раз.
+    """
+    if elite <= 0:
+        return strategy.select(fitness, amount, offspring_start)
+    fitness = np.asarray(fitness)
+    elite = min(elite, amount, fitness.size)
+    elite_indices = top_indices(fitness, elite)
+
+    candidates = np.ones(fitness.size, dtype=bool)
+    candidates[elite_indices] = False
+    candidates = np.flatnonzero(candidates)
+    if amount == elite or candidates.size == 0:
+        return elite_indices
+    # Индекс первого потомка среди оставшихся кандидатов
+    offspring_start = int(np.searchsorted(candidates, offspring_start))
+    return np.concatenate((elite_indices, candidates[strategy.select(fitness[candidates], amount - elite, offspring_start)]))
+
+
+class TournamentSelection(SelectionStrategy):
+    """
+    Турнирный отбор: все amount x tournament_size участников выбираются
+    одним вызовом генератора, победитель каждой строки - argmax по fitness,
+    при равенстве fitness победитель выбирается случайно.
+
+    В отличие от Population.tournament_winner, участники одного турнира
+    выбираются с возвращением: это позволяет не сортировать случайные ключи
+    по всей популяции и почти не меняет давление отбора при
+    tournament_size << размера популяции.
+
+    Args:
+        tournament_size: число участников турнира
+        rng: генератор numpy
+    """
+
+    def __init__(self, tournament_size: int, rng: Optional[np.random.Generator] = None):
+        super().__init__(rng)
+        self.tournament_size = tournament_size
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        fitness = np.asarray(fitness)
+        # Участники выбираются с возвращением, поэтому турнир может быть больше популяции
+        contestants = self.rng.integers(0, fitness.size, size=(amount, self.tournament_size))
+        contestants_fitness = fitness[contestants]
+        is_best = contestants_fitness == contestants_fitness.max(axis=1, keepdims=True)
+        # Случайный ключ среди лучших участников, -1 у остальных
+        keys = np.where(is_best, self.rng.random(contestants.shape), -1.0)
+        return contestants[np.arange(amount), np.argmax(keys, axis=1)]
+
+
+class StochasticUniversalSampling(SelectionStrategy):
+    """
+    Пропорциональный отбор (вероятность пропорциональна fitness) с одним
+    случайным сдвигом на все выборки: число копий каждой особи отличается
+    от ожидаемого меньше чем на 1. O(n + amount log n).
+    """
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        fitness = np.asarray(fitness, dtype=np.float64)
+        # Отрицательный fitness сдвигается так, чтобы худшая особь имела нулевой вес
+        return self._universal_sampling(fitness - min(fitness.min(), 0), amount)
+
+
+class LinearRankSelection(SelectionStrategy):
+    """
+    Линейный ранговый отбор: вероятность зависит только от места особи в
+    упорядочении по fitness, от (2 - pressure) / n у худшей до pressure / n
+    у лучшей. Выборка - стохастическая универсальная. O(n log n).
+
+    Args:
+        pressure: давление отбора, от 1 (равномерный выбор) до 2
+        rng: генератор numpy
+    """
+
+    def __init__(self, pressure: float = 1.5, rng: Optional[np.random.Generator] = None):
+        super().__init__(rng)
+        if not 1 <= pressure <= 2:
+            raise ValueError("pressure должен быть в диапазоне [1, 2]")
+        self.pressure = pressure
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        fitness = np.asarray(fitness)
+        n = fitness.size
+        if n == 1:
+            return np.zeros(amount, dtype=np.int64)
+
+        ranks = np.empty(n, dtype=np.float64)
+        ranks[np.argsort(fitness, kind='stable')] = np.arange(n)
+        weights = (2 - self.pressure) + 2 * (self.pressure - 1) * ranks / (n - 1)
+        return self._universal_sampling(weights, amount)
+
+
+class TruncationSelection(SelectionStrategy):
+    """
+    Усеченный отбор: равномерный выбор с возвращением среди доли proportion
+    лучших особей. Лучшие находятся через argpartition, O(n).
+
+    Args:
+        proportion: доля лучших особей, допущенных к отбору
+        rng: генератор numpy
+    """
+
+    def __init__(self, proportion: float = 0.5, rng: Optional[np.random.Generator] = None):
+        super().__init__(rng)
+        if not 0 < proportion <= 1:
+            raise ValueError("proportion должен быть в диапазоне (0, 1]")
+        self.proportion = proportion
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        candidates = top_indices(fitness, max(1, int(np.ceil(self.proportion * len(fitness)))))
+        return candidates[self.rng.integers(0, len(candidates), size=amount)]
+
+
+class PlusSelection(SelectionStrategy):
+    """
+    Элитарная замена (μ+λ): в новую популяцию без повторений попадают
+    amount лучших среди родителей и потомков вместе. O(n).
+    """
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        return top_indices(fitness, amount)
+
+
+class CommaSelection(SelectionStrategy):
+    """
+    Замена (μ,λ): новая популяция - amount лучших потомков, родители
+    отбрасываются. Если потомков меньше amount, недостающие места
+    занимают лучшие родители. O(n).
+    """
+
+    def select(self, fitness: np.ndarray, amount: int, offspring_start: int = 0) -> np.ndarray:
+        fitness = np.asarray(fitness)
+        offspring = offspring_start + top_indices(fitness[offspring_start:], amount)
+        if len(offspring) >= amount:
+            return offspring
+        parents = top_indices(fitness[:offspring_start], amount - len(offspring))
+        return np.concatenate((offspring, parents))
+
+
+def make_selection_strategy(name: str, tournament_size: int, params: Optional[dict] = None, rng: Optional[np.random.Generator] = None) -> SelectionStrategy:
+    """
+    Стратегия отбора по названию.
+
+    :param name: 'tournament', 'sus', 'rank', 'truncation', 'plus' - (μ+λ) или 'comma' - (μ,λ)
+    :param tournament_size: int, размер турнира для 'tournament'
+    :param params: dict, дополнительные параметры конструктора (pressure, proportion)
+    :param rng: генератор numpy
+    """
+    params = params or {}
+    if name == 'tournament':
+        return TournamentSelection(tournament_size, rng=rng, **params)
+    strategies = {
+        'sus': StochasticUniversalSampling,
+        'rank': LinearRankSelection,
+        'truncation': TruncationSelection,
+        'plus': PlusSelection,
+        'comma': CommaSelection
+    }
+    if name not in strategies:
+        raise ValueError(f"Неизвестная стратегия отбора: {name}")
+    return strategies[name](rng=rng, **params)
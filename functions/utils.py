@@ -9,6 +9,32 @@ def load_json(file_path):
     
     
     
+def log_entry_to_row(log_entry):
+    """
+    Преобразует запись лога GridSearch в строку DataFrame.
+
+    :param log_entry: dict, запись лога
+    :return: dict, параметры, итоговый счет, результаты тестов и время
+    """
+    # Создаем базовую строку с параметрами
+    row = log_entry['parameters'].copy()
+
+    # Добавляем итоговый счет оптимизации
+    if 'final_optimization_score' in log_entry:
+        row['final_optimization_score'] = log_entry['final_optimization_score']
+
+    # Добавляем результаты тестов
+    for key, value in log_entry.items():
+        if key.startswith('test case'):
+            row[key] = value
+
+    row['ga_time'] = log_entry['ga_time']
+    row['dp_time'] = log_entry['dp_time']
+    if 'optimality_gap' in log_entry:
+        row['optimality_gap'] = log_entry['optimality_gap']
+    return row
+
+
 def load_logs_from_json(filepath):
     """
     Загружает логи из JSON файла и преобразует их в pandas DataFrame.
@@ -25,25 +51,7 @@ def load_logs_from_json(filepath):
             return pd.DataFrame()
         
         # Создаем список для хранения строк DataFrame
-        rows = []
-        
-        for log_entry in logs_data:
-            # Создаем базовую строку с параметрами
-            row = log_entry['parameters'].copy()
-            
-            # Добавляем итоговый счет оптимизации
-            if 'final_optimization_score' in log_entry:
-                row['final_optimization_score'] = log_entry['final_optimization_score']
-            
-            # Добавляем результаты тестов
-            for key, value in log_entry.items():
-                if key.startswith('test case'):
-                    row[key] = value
-            
-            row['ga_time'] = log_entry['ga_time']
-            row['dp_time'] = log_entry['dp_time']
-            
-            rows.append(row)
+        rows = [log_entry_to_row(log_entry) for log_entry in logs_data]
         
         df = pd.DataFrame(rows)
         print(f"Успешно загружено {len(df)} записей из {filepath}")
@@ -57,4 +65,60 @@ def load_logs_from_json(filepath):
         return pd.DataFrame()
     except Exception as e:
         print(f"Неожиданная ошибка: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+def iter_logs_from_jsonl(filepath):
+    """
+    Построчно читает JSON Lines лог GridSearch.
+
+    Строки, которые не удается разобрать (например, оборванная при падении
+    последняя запись), пропускаются.
+
+    :param filepath: str, путь к .jsonl файлу
+    :return: generator, записи лога по одной
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def load_logs_from_jsonl(filepath, chunksize=10000):
+    """
+    Загружает JSON Lines лог в pandas DataFrame по частям.
+
+    В памяти одновременно держится не больше chunksize разобранных записей,
+    готовые части склеиваются в конце.
+
+    :param filepath: str, путь к .jsonl файлу
+    :param chunksize: int, число записей в одной части
+    :return: pd.DataFrame, DataFrame с данными логов
+    """
+    try:
+        chunks = []
+        rows = []
+        for log_entry in iter_logs_from_jsonl(filepath):
+            rows.append(log_entry_to_row(log_entry))
+            if len(rows) >= chunksize:
+                chunks.append(pd.DataFrame(rows))
+                rows = []
+        if rows:
+            chunks.append(pd.DataFrame(rows))
+
+        if not chunks:
+            print("Файл с логами пуст")
+            return pd.DataFrame()
+
+        df = pd.concat(chunks, ignore_index=True)
+        print(f"Успешно загружено {len(df)} записей из {filepath}")
+        return df
+
+    except FileNotFoundError:
+        print(f"Файл {filepath} не найден")
+        return pd.DataFrame()
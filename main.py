@@ -1,6 +1,7 @@
 
 from classes.GeneticA import GeneticCharacteristics, GeneticAlgorithm
 from classes.DPSolver import DPSolver
+from classes.DPCache import DPCache
 from classes.GridSearch import GridSearch
 import json
 
@@ -26,7 +27,8 @@ if __name__ == "__main__":
             'desired_population_size': [5],
             'change_to_mutation': [0.1, 0.2],
             'tournament_size': [5]
-        }
+        },
+        dp_cache=DPCache("./results/dp_cache")
     )
     best_params = grid_search.find_best_parameters("./results/best_params.json")
     grid_search.save_logs_to_file("./results/logs.json")
@@ -0,0 +1,247 @@
+import unittest
+import random
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.ArrayPopulation import ArrayPopulation
+from classes.Entity import Entity
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestArrayPopulation(unittest.TestCase):
+    """Тесты для класса ArrayPopulation"""
+
+    def setUp(self):
+        random.seed(42)
+        self.min_vals = np.array([1, 0, 2, 0])
+        self.weights = np.array([3, 5, 2, 4])
+        self.costs = np.array([10, 20, 7, 12])
+        self.max_weight = 40
+        self.genomes = np.array([
+            [1, 0, 2, 0],
+            [2, 1, 3, 1],
+            [1, 3, 2, 2],
+            [4, 2, 5, 0],
+            [1, 1, 6, 3],
+        ])
+        self.population = ArrayPopulation(
+            genomes=self.genomes,
+            min_value=self.min_vals,
+            max_weight=self.max_weight,
+            weights=self.weights,
+            costs=self.costs,
+            mutation_probability=0.0,
+            desired_amount=3,
+            tournament_size=2
+        )
+
+    def test_fitness_and_weight_arrays(self):
+        """Параллельные массивы fitness и weight совпадают с np.dot"""
+        np.testing.assert_array_equal(self.population.fitness, self.genomes @ self.costs)
+        np.testing.assert_array_equal(self.population.weight, self.genomes @ self.weights)
+        self.assertEqual(len(self.population), 5)
+
+    def test_outbreeding_returns_furthest_row(self):
+        """Outbreeding возвращает индекс самой удаленной строки"""
+        for _ in range(20):
+            first, second = self.population.outbreeding()
+            distances = np.sum((self.genomes - self.genomes[first]) ** 2, axis=1)
+            distances[first] = -1
+            self.assertNotEqual(first, second)
+            self.assertEqual(distances[second], distances.max())
+
+    def test_two_point_crossover_keeps_genes(self):
+        """Потомки состоят из генов родителей на тех же позициях"""
+        children = self.population.two_point_crossover(1, 3)
+        self.assertEqual(children.shape, (2, 4))
+        for position in range(4):
+            self.assertEqual(sorted(children[:, position]), sorted(self.genomes[[1, 3], position]))
+
+    def test_outbreeding_batch(self):
+        """Пакетный outbreeding совпадает с поиском самой удаленной строки"""
+        pairs = self.population.outbreeding_batch(50)
+        self.assertEqual(pairs.shape, (50, 2))
+        for first, second in pairs:
+            distances = np.sum((self.genomes - self.genomes[first]) ** 2, axis=1)
+            distances[first] = -1
+            self.assertEqual(distances[second], distances.max())
+
+    def test_two_point_crossover_batch(self):
+        """Пакетное скрещивание: каждый ген потомков взят у родителей своей пары"""
+        pairs = np.array([[0, 3], [1, 4], [2, 2]])
+        children = self.population.two_point_crossover_batch(pairs)
+        self.assertEqual(children.shape, (6, 4))
+        for i, (first, second) in enumerate(pairs):
+            parents = self.genomes[[first, second]]
+            np.testing.assert_array_equal(children[2 * i] + children[2 * i + 1], parents.sum(axis=0))
+
+    def test_generate_offspring(self):
+        """Пакетная генерация добавляет ровно нужное число допустимых потомков"""
+        self.population.generate_offspring(37)
+        self.assertEqual(len(self.population), 42)
+        self.assertTrue(np.all(self.population.check_validity(self.population.genomes)))
+        np.testing.assert_array_equal(self.population.fitness, self.population.genomes @ self.costs)
+        np.testing.assert_array_equal(self.population.weight, self.population.genomes @ self.weights)
+
+    def test_distance_cache_consistency(self):
+        """Кэш расстояний совпадает с прямым расчетом после добавления, отбора и удаления"""
+        population = ArrayPopulation(
+            genomes=self.genomes,
+            min_value=self.min_vals,
+            max_weight=self.max_weight,
+            weights=self.weights,
+            costs=self.costs,
+            mutation_probability=0.0,
+            desired_amount=6,
+            tournament_size=2,
+            distance_cache=True
+        )
+
+        def assert_cache_matches(population):
+            genomes = population.genomes
+            expected = np.sum((genomes[:, None, :] - genomes[None, :, :]) ** 2, axis=2)
+            for i in range(len(population)):
+                np.testing.assert_array_equal(population.get_distances(i), expected[i])
+
+        assert_cache_matches(population)
+        population.generate_offspring(20)
+        assert_cache_matches(population)
+        population = population.tournament_population()
+        self.assertTrue(population.distance_cache)
+        assert_cache_matches(population)
+        population.remove_entities([0, 3, 5])
+        assert_cache_matches(population)
+        population.add_genomes(self.genomes[:2])
+        assert_cache_matches(population)
+
+        for _ in range(20):
+            first, second = population.outbreeding()
+            self.assertEqual(population.get_distances(first)[second], np.delete(population.get_distances(first), first).max())
+
+    def test_mutate_keeps_cache_and_constraints(self):
+        """Мутация меняет один ген и синхронно обновляет fitness и weight"""
+        genomes = np.repeat(self.genomes[:3], 200, axis=0)
+        fitness, weight = self.population.evaluate(genomes)
+        before = genomes.copy()
+
+        self.population.mutate(genomes, fitness, weight)
+
+        changed = np.sum(genomes != before, axis=1)
+        self.assertTrue(np.all(changed <= 1))
+        self.assertTrue(np.any(changed == 1))
+        np.testing.assert_array_equal(fitness, genomes @ self.costs)
+        np.testing.assert_array_equal(weight, genomes @ self.weights)
+        self.assertTrue(np.all(self.population.check_validity(genomes, weight)))
+
+    def test_check_validity(self):
+        """Проверка ограничений по весу и минимальным значениям"""
+        genomes = np.array([[1, 0, 2, 0], [0, 0, 2, 0], [10, 10, 2, 0]])
+        np.testing.assert_array_equal(self.population.check_validity(genomes), [True, False, False])
+
+    def test_tournament_population(self):
+        """Турнир возвращает новую популяцию из строк исходной"""
+        new_population = self.population.tournament_population()
+        self.assertEqual(len(new_population), 3)
+        rows = {tuple(row) for row in self.genomes}
+        for row in new_population.genomes:
+            self.assertIn(tuple(row), rows)
+        np.testing.assert_array_equal(new_population.fitness, new_population.genomes @ self.costs)
+
+    def test_entity_view_and_removal(self):
+        """Entity-представления и удаление по индексам"""
+        entities = self.population.get_entities()
+        self.assertEqual(len(entities), 5)
+        self.assertIsInstance(entities[2], Entity)
+        self.assertEqual(entities[2].get_fitness(), self.genomes[2] @ self.costs)
+
+        self.population.remove_entities([4, 0])
+        np.testing.assert_array_equal(self.population.genomes, self.genomes[[1, 2, 3]])
+
+        self.population.add_entities(entities[:2])
+        self.assertEqual(len(self.population), 5)
+        np.testing.assert_array_equal(self.population.genomes[3:], self.genomes[:2])
+
+    def test_running_best(self):
+        """Лучшая строка обновляется при добавлении, удалении и отборе"""
+        def assert_best(population):
+            entity, fitness = population.get_population_fitness()
+            self.assertEqual(fitness, population.fitness.max())
+            self.assertEqual(entity.get_fitness(), fitness)
+
+        assert_best(self.population)
+        best = int(np.argmax(self.population.fitness))
+        self.population.remove_entities([best])
+        assert_best(self.population)
+        self.population.add_genomes(np.array([[1, 6, 2, 0]]))
+        assert_best(self.population)
+        self.population.remove_entities([0, 1])
+        assert_best(self.population)
+        assert_best(self.population.tournament_population())
+
+    def test_pop_genomes(self):
+        """Удаление перестановкой с конца: мигранты возвращаются, массивы и кэш расстояний согласованы"""
+        population = ArrayPopulation(
+            genomes=np.concatenate((self.genomes, self.genomes[::-1] + 1)),
+            min_value=self.min_vals,
+            max_weight=self.max_weight,
+            weights=self.weights,
+            costs=self.costs,
+            mutation_probability=0.0,
+            desired_amount=3,
+            tournament_size=2,
+            distance_cache=True
+        )
+        rows = population.genomes.copy()
+
+        removed = [7, 1, 9, 3]
+        np.testing.assert_array_equal(population.pop_genomes(removed), rows[sorted(removed)])
+        self.assertEqual(len(population), 6)
+        kept = sorted(map(tuple, np.delete(rows, removed, axis=0)))
+        self.assertEqual(sorted(map(tuple, population.genomes)), kept)
+
+        genomes = population.genomes
+        np.testing.assert_array_equal(population.fitness, genomes @ self.costs)
+        np.testing.assert_array_equal(population.weight, genomes @ self.weights)
+        expected = np.sum((genomes[:, None, :] - genomes[None, :, :]) ** 2, axis=2)
+        for i in range(len(population)):
+            np.testing.assert_array_equal(population.get_distances(i), expected[i])
+
+        for _ in range(3):
+            entity, fitness = population.get_population_fitness()
+            self.assertEqual(fitness, population.fitness.max())
+            self.assertEqual(entity.get_fitness(), fitness)
+            population.pop_genomes([population._best_index, 0])
+
+
+class TestGeneticAlgorithmArrayBackend(GeneticAlgorithmTestCase):
+    """Генетический алгоритм с матричной популяцией"""
+
+    def test_genetic_algorithm_array_backend(self):
+        """Генетический алгоритм работает с матричной популяцией"""
+        for offspring_mode, outbreeding_mode in (('sequential', 'scan'), ('batch', 'scan'), ('sequential', 'cached')):
+            algorithm = self.make_algorithm(
+                desired_population_size=15,
+                population_backend='array',
+                offspring_mode=offspring_mode,
+                outbreeding_mode=outbreeding_mode
+            )
+            for _ in range(30):
+                algorithm.next_iteration()
+
+            best_entity, best_fitness = algorithm.get_best_entity()
+            self.assertTrue(best_entity.check_validity())
+            self.assertEqual(best_fitness, np.dot(best_entity.current_state, algorithm.genetic_characteristics.costs))
+            self.assertEqual(len(algorithm.get_population_entities()), 15)
+
+    def test_entity_backend_rejects_array_modes(self):
+        """Пакетные потомки и кэш расстояний требуют population_backend='array'"""
+        for kwargs in (dict(offspring_mode='batch'), dict(outbreeding_mode='cached'), dict(offspring_mode='pairs')):
+            with self.assertRaises(ValueError):
+                self.make_characteristics(population_backend='entity', **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
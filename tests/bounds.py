@@ -0,0 +1,115 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.Bounds import KnapsackBounds, optimality_gap
+from classes.DPSolver import DPSolver
+from classes.GridSearch import evaluate_condition
+from tests.helpers import GeneticAlgorithmTestCase, KnapsackInstancesTestCase
+
+
+class TestKnapsackBounds(KnapsackInstancesTestCase):
+    """Тесты для класса KnapsackBounds"""
+
+    instances_seed = 13
+    num_instances = 20
+
+    def test_bounds_enclose_optimum(self):
+        """Жадное решение допустимо, оптимум DP лежит между оценками"""
+        for min_vals, weights, costs, max_weight in self.conditions:
+            bounds = KnapsackBounds(min_vals, weights, costs, max_weight)
+            fitness, quantities = bounds.greedy_solution()
+            self.check_solution(fitness, quantities, min_vals, weights, costs, max_weight)
+
+            optimum, _ = DPSolver(min_vals, weights, costs, max_weight, engine='numpy').solve()
+            lower, upper = bounds.bounds()
+            self.assertEqual(lower, fitness)
+            self.assertLessEqual(lower, optimum)
+            self.assertGreaterEqual(upper, optimum)
+
+    def test_bounded_counts(self):
+        """Оценки с max_counts охватывают оптимум полного перебора"""
+        for min_vals, weights, costs, max_weight in self.conditions[:8]:
+            max_counts = [m + random.randint(0, 4) for m in min_vals]
+            optimum = self.brute_force_optimum(min_vals, weights, costs, max_weight, max_counts)
+
+            bounds = KnapsackBounds(min_vals, weights, costs, max_weight, max_counts=max_counts)
+            fitness, quantities = bounds.greedy_solution()
+            self.check_solution(fitness, quantities, min_vals, weights, costs, max_weight, max_counts)
+            self.assertLessEqual(fitness, optimum)
+            self.assertGreaterEqual(bounds.upper_bound(), optimum)
+
+    def test_exact_when_divisible(self):
+        """Если лучший предмет заполняет рюкзак целиком, оценки совпадают"""
+        bounds = KnapsackBounds([1, 0], [2, 5], [3, 20], 22)
+        self.assertEqual(bounds.bounds(), (83, 83))
+        self.assertEqual(bounds.greedy_solution()[1], [1, 4])
+        self.assertEqual(optimality_gap(83, 83), 0.0)
+        self.assertAlmostEqual(optimality_gap(75, 100), 0.25)
+
+    def test_invalid_configuration(self):
+        """Некорректные конфигурации вызывают ValueError"""
+        with self.assertRaises(ValueError):
+            KnapsackBounds([5, 5], [10, 10], [1, 1], 15)
+        with self.assertRaises(ValueError):
+            KnapsackBounds([0, 0], [1, 1, 1], [1, 1], 10)
+        with self.assertRaises(ValueError):
+            KnapsackBounds([2, 0], [1, 1], [1, 1], 10, max_counts=[1, 3])
+
+
+class TestBoundUsage(GeneticAlgorithmTestCase):
+    """Остановка ГА на верхней оценке и разрыв до нее в GridSearch"""
+
+    def setUp(self):
+        super().setUp()
+        # Лучший предмет делит свободную вместимость нацело, поэтому оценка достижима
+        self.condition = {
+            'min_vals': [1, 0, 0],
+            'weights': [4, 3, 7],
+            'costs': [5, 9, 10],
+            'max_weight': 34
+        }
+        self.characteristics.update(self.condition)
+
+    def test_stop_at_bound(self):
+        """ГА с жадной особью останавливается, достигнув верхней оценки"""
+        genetic_algorithm = self.make_algorithm(seed_solution='greedy', stop_at_bound=True)
+        fitness, _, usage = genetic_algorithm.start_algorithm()
+        self.assertEqual(usage['stop_reason'], 'bound')
+        self.assertEqual(fitness, genetic_algorithm.upper_bound)
+        self.assertEqual(genetic_algorithm.current_iteration, 1)
+
+        self.assertIsNone(self.make_algorithm().upper_bound)
+
+    def test_grid_search_gap(self):
+        """evaluate_condition сообщает разрыв до верхней оценки, reference='bound' обходится без DP"""
+        combination = {
+            'population_size': 10,
+            'max_iterations': 5,
+            'epsilon': 0,
+            'max_attempts': 100,
+            'size_to_generate': 10,
+            'change_to_mutation': 0.2,
+            'tournament_size': 3,
+            'desired_population_size': 10
+        }
+        upper_bound = KnapsackBounds(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], self.condition['max_weight']).upper_bound()
+
+        result = evaluate_condition(combination, self.condition, seed=1, reference='bound')
+        self.assertEqual(result['dp_fitness'], upper_bound)
+        self.assertEqual(result['upper_bound'], upper_bound)
+        self.assertAlmostEqual(result['optimality_gap'], (upper_bound - result['ga_fitness']) / upper_bound)
+        self.assertGreaterEqual(result['optimality_gap'], 0)
+
+        result = evaluate_condition(combination, self.condition, seed=1)
+        self.assertLessEqual(result['dp_fitness'], upper_bound)
+
+        with self.assertRaises(ValueError):
+            evaluate_condition(combination, self.condition, reference='lp')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.Convergence import ConvergenceMonitor
+
+
+class TestConvergenceMonitor(unittest.TestCase):
+    """Тесты для класса ConvergenceMonitor"""
+
+    def test_island_retirement(self):
+        """Остров выводится после island_window поколений без улучшения больше epsilon"""
+        monitor = ConvergenceMonitor(num_islands=2, island_window=3, epsilon=1)
+        monitor.start()
+        self.assertFalse(monitor.update_island(0, 1, 10))
+        self.assertFalse(monitor.update_island(0, 2, 10.5))
+        self.assertFalse(monitor.update_island(0, 3, 11))
+        self.assertTrue(monitor.update_island(0, 4, 11))
+        self.assertFalse(monitor.update_island(0, 5, 20))
+        self.assertFalse(monitor.is_active(0))
+
+        self.assertFalse(monitor.update_island(1, 1, 10))
+        self.assertIsNone(monitor.update_global(1, 20))
+        self.assertTrue(monitor.update_island(1, 4, 10))
+        self.assertEqual(monitor.update_global(4, 20), 'islands_retired')
+
+    def test_global_criteria(self):
+        """Остановка по стагнации, целевому значению и времени"""
+        monitor = ConvergenceMonitor(num_islands=1, global_window=5)
+        monitor.start()
+        self.assertIsNone(monitor.update_global(1, 10))
+        self.assertIsNone(monitor.update_global(3, 12))
+        self.assertIsNone(monitor.update_global(7, 12))
+        self.assertEqual(monitor.update_global(8, 12), 'stagnation')
+        self.assertEqual(monitor.improved_iteration, 3)
+
+        monitor = ConvergenceMonitor(num_islands=1, target=50)
+        monitor.start()
+        self.assertIsNone(monitor.update_global(1, 49))
+        self.assertEqual(monitor.update_global(2, 50), 'target')
+
+        monitor = ConvergenceMonitor(num_islands=1, time_limit=0.01)
+        monitor.start()
+        time.sleep(0.02)
+        self.assertEqual(monitor.update_global(1, 10), 'time_limit')
+
+    def test_invalid_configuration(self):
+        """Неположительные окна и время вызывают ValueError"""
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(num_islands=2, island_window=0)
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(num_islands=2, global_window=-1)
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(num_islands=2, time_limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,174 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+import time
+from unittest.mock import patch
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.DPSolver import DPSolver
+from classes.DPCache import DPCache
+from tests.helpers import KnapsackInstancesTestCase
+
+
+class TestDPSolver(KnapsackInstancesTestCase):
+    """Тесты для класса DPSolver"""
+
+    def test_numpy_engine_matches_python(self):
+        """Векторный движок дает тот же оптимум, что и исходный"""
+        for min_vals, weights, costs, max_weight in self.conditions:
+            expected, _ = DPSolver(min_vals, weights, costs, max_weight).solve()
+            fitness, quantities = DPSolver(min_vals, weights, costs, max_weight, engine='numpy').solve()
+            self.assertEqual(fitness, expected)
+            self.check_solution(fitness, quantities, min_vals, weights, costs, max_weight)
+
+    def test_compact_engine_matches_python(self):
+        """Компактный движок дает тот же оптимум, что и исходный"""
+        for min_vals, weights, costs, max_weight in self.conditions:
+            expected, _ = DPSolver(min_vals, weights, costs, max_weight).solve()
+            fitness, quantities = DPSolver(min_vals, weights, costs, max_weight, engine='compact').solve()
+            self.assertEqual(fitness, expected)
+            self.check_solution(fitness, quantities, min_vals, weights, costs, max_weight)
+
+    def test_bounded_matches_brute_force(self):
+        """Ограниченный рюкзак совпадает с полным перебором"""
+        for min_vals, weights, costs, max_weight in self.conditions[:8]:
+            max_counts = [m + random.randint(0, 4) for m in min_vals]
+
+            expected = self.brute_force_optimum(min_vals, weights, costs, max_weight, max_counts)
+
+            for engine in ('numpy', 'compact'):
+                fitness, quantities = DPSolver(min_vals, weights, costs, max_weight, engine=engine, max_counts=max_counts).solve()
+                self.assertEqual(fitness, expected)
+                self.check_solution(fitness, quantities, min_vals, weights, costs, max_weight, max_counts)
+
+    def test_peak_memory(self):
+        """Пиковая память измеряется и у компактного движка меньше"""
+        min_vals, weights, costs = [1, 2, 0, 3], [3, 7, 11, 5], [10, 25, 38, 17]
+        max_weight = 60000
+
+        peaks = {}
+        for engine in ('numpy', 'compact'):
+            solver = DPSolver(min_vals, weights, costs, max_weight, engine=engine, track_memory=True)
+            self.assertIsNone(solver.peak_memory)
+            solver.solve()
+            self.assertGreater(solver.peak_memory, 0)
+            peaks[engine] = solver.peak_memory
+
+        self.assertLess(peaks['compact'], peaks['numpy'])
+        solver = DPSolver(min_vals, weights, costs, max_weight)
+        self.assertLess(solver.estimate_memory('compact'), solver.estimate_memory('numpy'))
+
+    def test_invalid_configuration(self):
+        """Некорректные конфигурации вызывают ValueError"""
+        with self.assertRaises(ValueError):
+            DPSolver([5, 5], [10, 10], [1, 1], 15, engine='numpy').solve()
+        with self.assertRaises(ValueError):
+            DPSolver([0, 0], [1, 1], [1, 1], 10, max_counts=[1, 1]).solve()
+        with self.assertRaises(ValueError):
+            DPSolver([0, 0], [1, 1], [1, 1], 10, engine='unknown').solve()
+
+
+class TestDPCache(unittest.TestCase):
+    """Тесты для дискового кэша DPCache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.condition = {
+            'min_vals': [1, 0, 2],
+            'weights': [3, 5, 4],
+            'costs': [10, 18, 13],
+            'max_weight': 70
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_fingerprint(self):
+        """Ключ не зависит от типа контейнера и меняется вместе с условиями"""
+        key = DPCache.fingerprint(**self.condition)
+        self.assertEqual(key, DPCache.fingerprint(np.array([1, 0, 2]), (3, 5, 4), [10, 18, 13], np.int64(70)))
+        self.assertNotEqual(key, DPCache.fingerprint([1, 0, 2], [3, 5, 4], [10, 18, 13], 71))
+        self.assertNotEqual(key, DPCache.fingerprint(max_counts=[5, 5, 5], **self.condition))
+
+    def test_hit_after_miss(self):
+        """Повторный запрос берется из кэша, в том числе новым экземпляром"""
+        expected = DPSolver(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], self.condition['max_weight']).solve()
+
+        cache = DPCache(self.directory.name)
+        self.assertEqual(cache.solve_condition(self.condition)[0], expected[0])
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        other = DPCache(self.directory.name)
+        fitness, quantities = other.solve_condition(self.condition)
+        self.assertEqual(fitness, expected[0])
+        self.assertEqual(sum(q * c for q, c in zip(quantities, self.condition['costs'])), fitness)
+        self.assertEqual((other.hits, other.misses), (1, 0))
+
+    def test_eviction(self):
+        """При превышении размера удаляются самые старые записи"""
+        cache = DPCache(self.directory.name, max_size_bytes=150)
+        for max_weight in (40, 50, 60, 70):
+            cache.solve(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], max_weight)
+            time.sleep(0.01)
+
+        files = [name for name in os.listdir(self.directory.name) if name.endswith('.json')]
+        total_size = sum(os.path.getsize(os.path.join(self.directory.name, name)) for name in files)
+        self.assertLessEqual(total_size, 150)
+        self.assertLess(len(files), 4)
+        self.assertIsNotNone(cache.get(DPCache.fingerprint(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], 70)))
+        self.assertIsNone(cache.get(DPCache.fingerprint(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], 40)))
+
+    def test_entry_removed_after_read(self):
+        """Запись, вытесненная другим процессом сразу после чтения, остается попаданием"""
+        cache = DPCache(self.directory.name)
+        expected = cache.solve_condition(self.condition)
+        key = DPCache.fingerprint(**self.condition)
+
+        def evicted_utime(path, *args, **kwargs):
+            os.remove(path)
+            raise FileNotFoundError(path)
+
+        with patch('classes.DPCache.os.utime', side_effect=evicted_utime):
+            self.assertEqual(cache.get(key), expected)
+        self.assertIsNone(cache.get(key))
+
+    def test_invalid_entry_is_miss(self):
+        """Поврежденная или чужая запись считается промахом, удаляется и пересчитывается"""
+        cache = DPCache(self.directory.name)
+        expected = DPSolver(self.condition['min_vals'], self.condition['weights'], self.condition['costs'], self.condition['max_weight']).solve()
+        path = os.path.join(self.directory.name, DPCache.fingerprint(**self.condition) + '.json')
+
+        for content in ('{"fitness": 5}', '[1, 2]', '{"fitness": 5, "quantities": 3}', '{"fitness": "x", "quantities": []}', '{"fitn'):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.assertIsNone(cache.get(DPCache.fingerprint(**self.condition)))
+            self.assertFalse(os.path.exists(path))
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self.assertEqual(cache.solve_condition(self.condition)[0], expected[0])
+            self.assertEqual(cache.get(DPCache.fingerprint(**self.condition))[0], expected[0])
+
+    def test_temporary_files_cleanup(self):
+        """Неудачная запись не оставляет .tmp файлов, брошенные .tmp удаляются при вытеснении"""
+        cache = DPCache(self.directory.name)
+        with patch('classes.DPCache.json.dump', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                cache.put('key', 1, [1])
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+        stale, fresh = (os.path.join(self.directory.name, name) for name in ('stale.tmp', 'fresh.tmp'))
+        for path in (stale, fresh):
+            open(path, 'w').close()
+        os.utime(stale, (0, 0))
+        cache.solve_condition(self.condition)
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,7 +1,10 @@
 # test_entity_unittest.py
 import unittest
 import random
+import numpy as np
 from classes.Entity import Entity
+from classes.Population import Population
+from tests.helpers import make_entity
 
 class TestEntity(unittest.TestCase):
     """Тесты для класса Entity"""
@@ -72,5 +75,40 @@ class TestEntity(unittest.TestCase):
             for c, m in zip(e_stress.current_state, e_stress.min_value):
                 self.assertGreaterEqual(c, m)
 
+
+class TestEntityIncrementalUpdates(unittest.TestCase):
+    """Тесты инкрементального пересчета fitness и веса"""
+
+    def setUp(self):
+        random.seed(42)
+        self.params = dict(
+            min_value=[0, 1, 2, 0, 1],
+            max_weight=40,
+            weights=[2, 3, 4, 1, 5],
+            costs=[1, 2, 3, 4, 5]
+        )
+
+    def test_mutate_updates_cache(self):
+        """Кэш fitness и веса после мутаций совпадает с полным пересчетом"""
+        entity = make_entity([0, 1, 2, 0, 1], **self.params)
+        entity.get_fitness()
+        for _ in range(2000):
+            entity.mutate()
+            self.assertEqual(entity.get_fitness(), np.dot(entity.current_state, entity.costs))
+            self.assertEqual(entity.get_current_weight(), np.dot(entity.current_state, entity.weights))
+            self.assertTrue(entity.check_validity())
+
+    def test_crossover_children_are_evaluated(self):
+        """Fitness и вес потомков известны сразу и совпадают с полным пересчетом"""
+        population = Population([], desired_amount=2, tournament_size=2)
+        parent1 = make_entity([3, 1, 2, 4, 1], **self.params)
+        parent2 = make_entity([0, 5, 3, 0, 2], **self.params)
+        for _ in range(50):
+            for child in population.two_point_crossover(parent1, parent2):
+                self.assertIsNotNone(child._fitness)
+                self.assertEqual(child._fitness, np.dot(child.current_state, child.costs))
+                self.assertEqual(child._current_weight, np.dot(child.current_state, child.weights))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,129 @@
+import unittest
+import sys
+import os
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestRefillBudget(GeneticAlgorithmTestCase):
+    """Тесты ограниченного пополнения популяции"""
+
+    def test_budget_and_fallback(self):
+        """Скрещиваний не больше бюджета, недостающие особи добавляет fallback"""
+        configurations = [
+            dict(population_backend='entity', refill_fallback='random'),
+            dict(population_backend='entity', refill_fallback='repair'),
+            dict(population_backend='array', offspring_mode='sequential', refill_fallback='random'),
+            dict(population_backend='array', offspring_mode='batch', refill_fallback='random'),
+            dict(population_backend='array', offspring_mode='batch', refill_fallback='repair'),
+        ]
+        for configuration in configurations:
+            algorithm = self.make_algorithm(desired_population_size=15, refill_budget=3, **configuration)
+            for _ in range(10):
+                algorithm.next_iteration()
+
+            for stats in algorithm.refill_history:
+                if configuration['refill_fallback'] == 'random':
+                    self.assertLessEqual(stats['attempts'], 3)
+                self.assertEqual(stats['invalid'], stats['children'] - stats['feasible'])
+                self.assertGreaterEqual(stats['time'], 0)
+                # Популяция дополняется до population_size + 5 особей
+                missing = 25 - (20 if stats is algorithm.refill_history[0] else 15)
+                # Последнее скрещивание может добавить на одного потомка больше
+                self.assertIn(stats['accepted'] + stats['fallback'], (missing, missing + 1))
+            self.assertTrue(any(stats['fallback'] > 0 for stats in algorithm.refill_history))
+            self.assertTrue(all(entity.check_validity() for entity in algorithm.get_population_entities()))
+
+    def test_unknown_fallback(self):
+        """Неизвестная стратегия fallback вызывает ValueError"""
+        with self.assertRaises(ValueError):
+            self.make_algorithm(refill_budget=3, refill_fallback='unknown')
+
+
+class TestGeneticAlgorithmBudgets(GeneticAlgorithmTestCase):
+    """Бюджеты времени и вычислений fitness в GeneticAlgorithm"""
+
+    def make_algorithm(self, **kwargs):
+        # Бюджеты должны исчерпаться раньше max_iterations
+        return super().make_algorithm(max_iterations=10 ** 6, **kwargs)
+
+    def test_evaluation_budget(self):
+        """Остановка по числу вычислений fitness с учетом последнего поколения"""
+        genetic_algorithm = self.make_algorithm(max_evaluations=500)
+        fitness, best_entity, usage = genetic_algorithm.start_algorithm()
+
+        self.assertEqual(usage, genetic_algorithm.budget_usage)
+        self.assertEqual(usage['stop_reason'], 'max_evaluations')
+        self.assertGreaterEqual(usage['evaluations'], 500)
+        self.assertLess(usage['evaluations'] - genetic_algorithm.refill_stats['evaluations'], 500)
+        self.assertEqual(usage['evaluations'], 20 + sum(stats['evaluations'] for stats in genetic_algorithm.refill_history))
+        self.assertEqual(usage['iterations'], genetic_algorithm.current_iteration)
+        self.assertEqual(fitness, best_entity.get_fitness())
+        self.assertTrue(best_entity.check_validity())
+
+    def test_time_budget(self):
+        """Остановка по времени возвращает лучшее найденное решение"""
+        genetic_algorithm = self.make_algorithm(time_limit=0.05)
+        started = time.perf_counter()
+        fitness, best_entity, usage = genetic_algorithm.start_algorithm()
+
+        self.assertEqual(usage['stop_reason'], 'time_limit')
+        self.assertGreaterEqual(usage['elapsed'], 0.05)
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertGreater(genetic_algorithm.current_iteration, 0)
+        self.assertEqual(fitness, best_entity.get_fitness())
+
+    def test_first_budget_wins(self):
+        """При обоих бюджетах остановка по первому исчерпанному"""
+        genetic_algorithm = self.make_algorithm(time_limit=60, max_evaluations=200)
+        result = genetic_algorithm.start_algorithm()
+        self.assertEqual(result.budget_usage['stop_reason'], 'max_evaluations')
+        self.assertLess(result.budget_usage['elapsed'], 60)
+
+        genetic_algorithm = self.make_algorithm()
+        genetic_algorithm.genetic_characteristics.max_iterations = 3
+        self.assertEqual(genetic_algorithm.start_algorithm().budget_usage['stop_reason'], 'max_iterations')
+
+
+class TestAnytimeImprovements(GeneticAlgorithmTestCase):
+    """Генератор улучшений GeneticAlgorithm.iter_improvements"""
+
+    def test_improvement_events(self):
+        """События идут по возрастанию fitness, последнее совпадает с результатом start_algorithm"""
+        genetic_algorithm = self.make_algorithm()
+        events = list(genetic_algorithm.iter_improvements())
+        costs = genetic_algorithm.genetic_characteristics.costs
+
+        self.assertGreater(len(events), 1)
+        self.assertEqual(events[0].iteration, 1)
+        for previous, event in zip(events, events[1:]):
+            self.assertGreater(event.iteration, previous.iteration)
+            self.assertGreater(event.fitness, previous.fitness)
+            self.assertGreaterEqual(event.elapsed, previous.elapsed)
+        for event in events:
+            self.assertEqual(event.fitness, event.genome @ costs)
+        self.assertEqual(genetic_algorithm.stop_reason, 'max_iterations')
+
+        fitness, best_entity, _ = self.make_algorithm().start_algorithm()
+        self.assertEqual(events[-1].fitness, fitness)
+        np.testing.assert_array_equal(events[-1].genome, best_entity.current_state)
+
+    def test_cancel(self):
+        """Закрытие генератора останавливает алгоритм и фиксирует бюджет"""
+        genetic_algorithm = self.make_algorithm()
+        for event in genetic_algorithm.iter_improvements():
+            # Первое же решение считается достаточно хорошим
+            break
+
+        self.assertEqual(genetic_algorithm.stop_reason, 'cancelled')
+        self.assertEqual(genetic_algorithm.budget_usage['iterations'], event.iteration)
+        self.assertEqual(genetic_algorithm.best_entity.get_fitness(), event.fitness)
+        self.assertLess(genetic_algorithm.current_iteration, 60)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
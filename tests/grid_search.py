@@ -9,6 +9,8 @@ import tempfile
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from classes.GridSearch import GridSearch
+from classes.DPCache import DPCache
+from functions.utils import load_logs_from_jsonl
 
 
 class TestGridSearch(unittest.TestCase):
@@ -42,7 +44,16 @@ class TestGridSearch(unittest.TestCase):
             'desired_population_size': [10, 15]
         }
         
-        self.grid_search = GridSearch(self.task_conditions, self.param_grid)
+        # Кэш по умолчанию пишется во временный каталог, а не в results/dp_cache
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dp_cache = DPCache(directory.name)
+        patcher = patch('classes.GridSearch.DPCache', return_value=self.dp_cache)
+        self.default_dp_cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Тесты с моком DPSolver работают без кэша
+        self.grid_search = GridSearch(self.task_conditions, self.param_grid, dp_cache=False)
 
     def test_init(self):
         """Тест инициализации GridSearch"""
@@ -97,7 +108,7 @@ class TestGridSearch(unittest.TestCase):
         mock_dp_solver.return_value = mock_dp_instance
         
         mock_ga_instance = MagicMock()
-        mock_ga_instance.start_algorithm.return_value = (95.0, MagicMock())
+        mock_ga_instance.start_algorithm.return_value = (95.0, MagicMock(), {'iterations': 50, 'evaluations': 500})
         mock_genetic_algorithm.return_value = mock_ga_instance
         
         combination = {
@@ -124,6 +135,47 @@ class TestGridSearch(unittest.TestCase):
         self.assertEqual(log_entry['parameters'], combination)
         self.assertAlmostEqual(log_entry['final_optimization_score'], expected_score, places=2)
 
+    @patch('classes.GridSearch.GeneticCharacteristics')
+    @patch('classes.GridSearch.GeneticAlgorithm')
+    @patch('classes.GridSearch.DPSolver')
+    def test_evaluate_combination_uses_dp_cache(self, mock_dp_solver, mock_genetic_algorithm, mock_characteristics):
+        """Тест: при наличии кэша точное решение берется из него"""
+        mock_ga_instance = MagicMock()
+        mock_ga_instance.start_algorithm.return_value = (95.0, MagicMock(), {'iterations': 50, 'evaluations': 500})
+        mock_genetic_algorithm.return_value = mock_ga_instance
+
+        dp_cache = MagicMock()
+        dp_cache.solve_condition.return_value = (100.0, [1, 1, 1])
+        grid_search = GridSearch(self.task_conditions, self.param_grid, dp_cache=dp_cache)
+
+        combination = next(grid_search.generate_combinations())
+        with patch('builtins.print'):
+            grid_search.evaluate_combination(combination)
+
+        mock_dp_solver.assert_not_called()
+        self.assertEqual(dp_cache.solve_condition.call_count, len(self.task_conditions))
+        self.assertEqual(grid_search.logs[0]['test case 1'], 5.0)
+
+    def test_default_dp_cache(self):
+        """Тест: по умолчанию DP считается один раз на условие, dp_cache=False отключает кэш"""
+        param_grid = {
+            'population_size': [6, 8],
+            'max_iterations': [3],
+            'epsilon': [0],
+            'max_attempts': [50],
+            'size_to_generate': [6],
+            'change_to_mutation': [0.2],
+            'tournament_size': [2],
+            'desired_population_size': [4]
+        }
+        grid_search = GridSearch(self.task_conditions, param_grid, seed=5)
+        self.assertIs(grid_search.dp_cache, self.dp_cache)
+        with patch('builtins.print'):
+            grid_search.find_best_parameters()
+        self.assertEqual((self.dp_cache.misses, self.dp_cache.hits), (2, 2))
+
+        self.assertIsNone(GridSearch(self.task_conditions, param_grid, dp_cache=False).dp_cache)
+
     @patch('classes.GridSearch.GeneticAlgorithm')
     @patch('classes.GridSearch.DPSolver')
     def test_find_best_parameters(self, mock_dp_solver, mock_genetic_algorithm):
@@ -135,7 +187,7 @@ class TestGridSearch(unittest.TestCase):
         
         # Создаем мок, который возвращает разные значения для разных вызовов
         mock_ga_instance = MagicMock()
-        mock_ga_instance.start_algorithm.side_effect = [(90.0, MagicMock()), (95.0, MagicMock())]
+        mock_ga_instance.start_algorithm.side_effect = [(90.0, MagicMock(), {'iterations': 50, 'evaluations': 500}), (95.0, MagicMock(), {'iterations': 50, 'evaluations': 500})]
         mock_genetic_algorithm.return_value = mock_ga_instance
         
         # Используем упрощенную сетку параметров для быстрого тестирования
@@ -150,7 +202,7 @@ class TestGridSearch(unittest.TestCase):
             'desired_population_size': [10]
         }
         
-        simple_grid_search = GridSearch(self.task_conditions, simple_param_grid)
+        simple_grid_search = GridSearch(self.task_conditions, simple_param_grid, dp_cache=False)
         
         with patch('builtins.print'):  # Подавляем вывод print
             best_score, best_combination = simple_grid_search.find_best_parameters()
@@ -160,6 +212,175 @@ class TestGridSearch(unittest.TestCase):
         self.assertIsInstance(best_score, float)
         self.assertIn('population_size', best_combination)
 
+    def test_parallel_matches_serial(self):
+        """Тест: параллельный перебор с тем же seed дает те же результаты и порядок логов"""
+        param_grid = {
+            'population_size': [6, 8],
+            'max_iterations': [5],
+            'epsilon': [0],
+            'max_attempts': [50],
+            'size_to_generate': [6],
+            'change_to_mutation': [0.2],
+            'tournament_size': [2],
+            'desired_population_size': [4]
+        }
+
+        runs = []
+        for n_workers in (1, 2):
+            grid_search = GridSearch(self.task_conditions, param_grid, n_workers=n_workers, seed=123)
+            with patch('builtins.print'):
+                best_score, best_combination = grid_search.find_best_parameters()
+            runs.append((best_score, best_combination, grid_search.logs))
+
+        (serial_score, serial_combination, serial_logs), (parallel_score, parallel_combination, parallel_logs) = runs
+        self.assertEqual(serial_score, parallel_score)
+        self.assertEqual(serial_combination, parallel_combination)
+        self.assertEqual([log['parameters'] for log in serial_logs], [log['parameters'] for log in parallel_logs])
+        for serial_log, parallel_log in zip(serial_logs, parallel_logs):
+            for key in ('test case 1', 'test case 2', 'final_optimization_score'):
+                self.assertEqual(serial_log[key], parallel_log[key])
+
+    def test_successive_halving(self):
+        """Тест: последовательное деление находит лучшую комбинацию за меньший бюджет"""
+        param_grid = {
+            'population_size': [10, 20, 30],
+            'max_iterations': [90],
+            'epsilon': [0],
+            'max_attempts': [100],
+            'size_to_generate': [15],
+            'change_to_mutation': [0.1, 0.2, 0.3],
+            'tournament_size': [3],
+            'desired_population_size': [10]
+        }
+
+        def fake_evaluate_condition(combination, condition, dp_cache=None, seed=None, reference='dp'):
+            # Разница с DP минимальна у population_size=20, change_to_mutation=0.2
+            gap = abs(combination['population_size'] - 20) + 100 * abs(combination['change_to_mutation'] - 0.2)
+            return {'dp_fitness': 100.0, 'ga_fitness': 100.0 - gap, 'dp_time': 0.0, 'ga_time': 0.0,
+                    'ga_iterations': combination['max_iterations']}
+
+        for resource in ('iterations', 'conditions'):
+            grid_search = GridSearch(self.task_conditions, param_grid)
+            with patch('classes.GridSearch.evaluate_condition', side_effect=fake_evaluate_condition), patch('builtins.print'):
+                best_score, best_combination = grid_search.successive_halving(eta=3, resource=resource)
+
+            self.assertEqual(best_combination['population_size'], 20)
+            self.assertAlmostEqual(best_combination['change_to_mutation'], 0.2)
+            self.assertEqual(best_combination['max_iterations'], 90)
+
+            report = grid_search.search_report
+            self.assertEqual([rung['candidates'] for rung in report['rungs']], [9, 3, 1])
+            self.assertEqual(report['exhaustive_ga_iterations'], 9 * 90 * 2)
+            self.assertLess(report['ga_iteration_budget'], report['exhaustive_ga_iterations'])
+            self.assertEqual(report['savings'], report['exhaustive_ga_iterations'] / report['ga_iteration_budget'])
+            self.assertEqual(report['ga_iterations'], sum(log['ga_iterations'] for log in grid_search.logs))
+            if resource == 'iterations':
+                self.assertEqual(report['ga_iteration_budget'], (9 * 10 + 3 * 30 + 1 * 90) * 2)
+
+        # log(125, 5) = 3.0000000000000004: число раундов не завышается ошибкой округления
+        param_grid['population_size'] = [10, 15, 20, 25, 30]
+        param_grid['change_to_mutation'] = [0.1, 0.15, 0.2, 0.25, 0.3]
+        param_grid['tournament_size'] = [2, 3, 4, 5, 6]
+        grid_search = GridSearch(self.task_conditions, param_grid)
+        with patch('classes.GridSearch.evaluate_condition', side_effect=fake_evaluate_condition), patch('builtins.print'):
+            grid_search.successive_halving(eta=5, resource='conditions')
+        self.assertEqual([rung['candidates'] for rung in grid_search.search_report['rungs']], [125, 25, 5, 1])
+
+    def test_streaming_log_and_resume(self):
+        """Тест: JSON Lines лог пишется по комбинациям, resume пропускает оцененные"""
+        param_grid = {
+            'population_size': [10, 20, 30],
+            'max_iterations': [50],
+            'epsilon': [0],
+            'max_attempts': [100],
+            'size_to_generate': [15],
+            'change_to_mutation': [0.1],
+            'tournament_size': [3],
+            'desired_population_size': [10]
+        }
+
+        def fake_evaluate_condition(combination, condition, dp_cache=None, seed=None, reference='dp'):
+            return {'dp_fitness': 100.0, 'ga_fitness': 100.0 - combination['population_size'] / 10,
+                    'dp_time': 0.0, 'ga_time': 0.0, 'ga_iterations': combination['max_iterations']}
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = os.path.join(directory, 'logs', 'search.jsonl')
+
+            grid_search = GridSearch(self.task_conditions, param_grid, log_file=log_file)
+            with patch('classes.GridSearch.evaluate_condition', side_effect=fake_evaluate_condition), patch('builtins.print'):
+                expected = grid_search.find_best_parameters()
+
+            with open(log_file, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), 3)
+
+            # Имитируем падение: последняя запись оборвана на середине
+            with open(log_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines[:2])
+                f.write(lines[2][:len(lines[2]) // 2])
+
+            resumed = GridSearch(self.task_conditions, param_grid, log_file=log_file, resume=True)
+            self.assertEqual(len(resumed.logs), 2)
+            with patch('classes.GridSearch.evaluate_condition', side_effect=fake_evaluate_condition) as mock_evaluate, patch('builtins.print'):
+                self.assertEqual(resumed.find_best_parameters(), expected)
+            self.assertEqual(mock_evaluate.call_count, len(self.task_conditions))
+            self.assertEqual(len(resumed.logs), 3)
+
+            with patch('builtins.print'):
+                logs_df = load_logs_from_jsonl(log_file, chunksize=1)
+            self.assertEqual(len(logs_df), 3)
+            self.assertEqual(sorted(logs_df['population_size']), [10, 20, 30])
+            self.assertIn('test case 2', logs_df.columns)
+
+    def test_parallel_streaming_log(self):
+        """Тест: параллельный перебор пишет комбинацию в лог сразу после ее условий, resume=False очищает лог"""
+        param_grid = {
+            'population_size': [6, 8, 10],
+            'max_iterations': [5],
+            'epsilon': [0],
+            'max_attempts': [50],
+            'size_to_generate': [6],
+            'change_to_mutation': [0.2],
+            'tournament_size': [2],
+            'desired_population_size': [4]
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = os.path.join(directory, 'search.jsonl')
+            with open(log_file, 'w', encoding='utf-8') as f:
+                f.write('{"parameters": {"population_size": 0}}\n')
+
+            grid_search = GridSearch(self.task_conditions, param_grid, n_workers=2, seed=7, log_file=log_file)
+            self.assertEqual(os.path.getsize(log_file), 0)
+
+            with patch('builtins.print'):
+                evaluated = grid_search._evaluate(enumerate(grid_search.generate_combinations()))
+                combination, _ = next(evaluated)
+                with open(log_file, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+                # Первая комбинация записана до того, как прочитаны результаты остальных
+                self.assertEqual(len(lines), 1)
+                self.assertEqual(json.loads(lines[0])['parameters'], combination)
+                self.assertEqual(len(list(evaluated)), 2)
+
+            with open(log_file, 'r', encoding='utf-8') as f:
+                logged = [json.loads(line)['parameters']['population_size'] for line in f]
+            self.assertEqual(logged, [6, 8, 10])
+
+            resumed = GridSearch(self.task_conditions, param_grid, n_workers=2, seed=7, log_file=log_file, resume=True)
+            with patch('classes.GridSearch.ProcessPoolExecutor') as mock_executor, patch('builtins.print'):
+                best_score, best_combination = resumed.find_best_parameters()
+            mock_executor.assert_not_called()
+            self.assertEqual(len(resumed.logs), 3)
+            self.assertIn(best_combination['population_size'], [6, 8, 10])
+
+    def test_task_seed(self):
+        """Тест: seed задачи детерминирован и различается между задачами"""
+        grid_search = GridSearch(self.task_conditions, self.param_grid, seed=42)
+        self.assertEqual(grid_search.task_seed(3, 1), GridSearch(self.task_conditions, self.param_grid, seed=42).task_seed(3, 1))
+        self.assertNotEqual(grid_search.task_seed(3, 1), grid_search.task_seed(1, 3))
+        self.assertIsNone(GridSearch(self.task_conditions, self.param_grid).task_seed(0, 0))
+
     def test_get_logs_empty(self):
         """Тест получения логов когда они пустые"""
         logs_df = self.grid_search.get_logs()
@@ -0,0 +1,100 @@
+import unittest
+import random
+import sys
+import os
+from itertools import product
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.Entity import Entity
+from classes.GeneticA import GeneticCharacteristics, GeneticAlgorithm
+
+
+def make_entity(state, weights, costs, max_weight=100, min_value=None, mutation_probability=0.0) -> Entity:
+    """
+    Особь с заданным геномом; min_value по умолчанию нулевые, мутации выключены.
+    """
+    return Entity(
+        min_value=np.zeros(len(state), dtype=int) if min_value is None else np.array(min_value),
+        max_weight=max_weight,
+        weights=np.array(weights),
+        costs=np.array(costs),
+        current_state=np.array(state),
+        mutation_probability=mutation_probability
+    )
+
+
+class GeneticAlgorithmTestCase(unittest.TestCase):
+    """Общая задача и характеристики для тестов, запускающих GeneticAlgorithm"""
+
+    seed = 8
+
+    def setUp(self):
+        self.characteristics = dict(
+            population_size=20,
+            min_vals=[1, 0, 2, 0, 1, 0, 0],
+            weights=[3, 5, 2, 4, 7, 6, 9],
+            costs=[10, 20, 7, 12, 25, 19, 33],
+            max_weight=60,
+            max_iterations=60,
+            epsilon=-1,
+            max_attempts=100,
+            size_to_generate=20,
+            mutation_probability=0.2,
+            tournament_size=3,
+            desired_population_size=20
+        )
+
+    def make_characteristics(self, **kwargs) -> GeneticCharacteristics:
+        """
+        Характеристики общей задачи; kwargs заменяют значения по умолчанию.
+        """
+        return GeneticCharacteristics(**{**self.characteristics, **kwargs})
+
+    def make_algorithm(self, **kwargs) -> GeneticAlgorithm:
+        """
+        ГА на общей задаче; kwargs заменяют характеристики по умолчанию.
+        Генераторы инициализируются заново, поэтому одинаковые вызовы дают одинаковые прогоны.
+        """
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        return GeneticAlgorithm(self.make_characteristics(**kwargs))
+
+
+class KnapsackInstancesTestCase(unittest.TestCase):
+    """
+    Случайные небольшие задачи о рюкзаке с минимальными количествами и
+    проверки решений для тестов точных и приближенных решателей.
+    """
+
+    instances_seed = 7
+    num_instances = 15
+
+    def setUp(self):
+        random.seed(self.instances_seed)
+        self.conditions = []
+        for _ in range(self.num_instances):
+            n = random.randint(2, 6)
+            min_vals = [random.randint(0, 3) for _ in range(n)]
+            weights = [random.randint(1, 15) for _ in range(n)]
+            costs = [random.randint(1, 40) for _ in range(n)]
+            max_weight = sum(m * w for m, w in zip(min_vals, weights)) + random.randint(0, 120)
+            self.conditions.append((min_vals, weights, costs, max_weight))
+
+    def check_solution(self, fitness, quantities, min_vals, weights, costs, max_weight, max_counts=None):
+        self.assertEqual(fitness, sum(q * c for q, c in zip(quantities, costs)))
+        self.assertLessEqual(sum(q * w for q, w in zip(quantities, weights)), max_weight)
+        for i, quantity in enumerate(quantities):
+            self.assertGreaterEqual(quantity, min_vals[i])
+            if max_counts is not None:
+                self.assertLessEqual(quantity, max_counts[i])
+
+    @staticmethod
+    def brute_force_optimum(min_vals, weights, costs, max_weight, max_counts):
+        """Оптимум ограниченного рюкзака полным перебором количеств"""
+        return max(
+            sum(q * c for q, c in zip(quantities, costs))
+            for quantities in product(*[range(m, M + 1) for m, M in zip(min_vals, max_counts)])
+            if sum(q * w for q, w in zip(quantities, weights)) <= max_weight
+        )
@@ -0,0 +1,83 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.Initializer import PopulationInitializer
+from classes.DPSolver import DPSolver
+from classes.DPCache import DPCache
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestPopulationInitializer(unittest.TestCase):
+    """Тесты для пакетной генерации начальной популяции"""
+
+    def setUp(self):
+        random.seed(31)
+        self.min_vals = np.array([1, 0, 2, 0, 3])
+        self.weights = np.array([3, 5, 2, 4, 7])
+        self.costs = np.array([10, 20, 7, 12, 15])
+        self.max_weight = 120
+
+    def make_initializer(self, method):
+        return PopulationInitializer(self.min_vals, self.weights, self.costs, self.max_weight, method=method)
+
+    def test_generate_is_valid_and_full(self):
+        """Особи допустимы, различны и заполнены до вместимости"""
+        for method in PopulationInitializer.METHODS:
+            genomes = self.make_initializer(method).generate(500)
+            self.assertEqual(genomes.shape, (500, 5))
+            weight = genomes @ self.weights
+            self.assertTrue(np.all(weight <= self.max_weight))
+            self.assertTrue(np.all(genomes >= self.min_vals))
+            # Ни один предмет больше не помещается
+            self.assertTrue(np.all(self.max_weight - weight < self.weights.min()))
+            self.assertGreater(len({tuple(row) for row in genomes}), 100)
+
+    def test_invalid_configuration(self):
+        """Некорректные условия вызывают ValueError"""
+        with self.assertRaises(ValueError):
+            PopulationInitializer([5, 5], [10, 10], [1, 1], 15)
+        with self.assertRaises(ValueError):
+            PopulationInitializer(self.min_vals, self.weights, self.costs, self.max_weight, method='uniform')
+
+    def test_large_population(self):
+        """Популяция 10^5 генерируется без посчетного цикла по особям"""
+        genomes = self.make_initializer('multinomial').generate(10 ** 5)
+        self.assertTrue(np.all(genomes @ self.weights <= self.max_weight))
+
+
+class TestGeneticAlgorithmInitialization(GeneticAlgorithmTestCase):
+    """Генетический алгоритм с пакетной инициализацией"""
+
+    def test_genetic_algorithm_initialization(self):
+        """Генетический алгоритм с пакетной инициализацией и затравочным решением"""
+        characteristics = self.make_characteristics()
+        expected, _ = DPSolver(characteristics.min_vals, characteristics.weights, characteristics.costs, characteristics.max_weight).solve()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        dp_cache = DPCache(directory.name)
+        for population_backend in ('entity', 'array'):
+            for initialization in ('sequential', 'multinomial', 'greedy'):
+                for seed_solution in (None, 'greedy', 'dp'):
+                    algorithm = self.make_algorithm(
+                        population_backend=population_backend,
+                        initialization=initialization,
+                        seed_solution=seed_solution,
+                        dp_cache=dp_cache
+                    )
+                    entities = algorithm.get_population_entities()
+                    self.assertEqual(len(entities), 20)
+                    self.assertTrue(all(entity.check_validity() for entity in entities))
+                    if seed_solution == 'dp':
+                        self.assertEqual(algorithm.population.get_population_fitness()[1], expected)
+        # Точное решение считается один раз, остальные прогоны берут его из кэша
+        self.assertEqual((dp_cache.misses, dp_cache.hits), (1, 5))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,190 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.IslandModel import IslandModel
+from classes.DPCache import DPCache
+from classes.DPSolver import DPSolver
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestIslandModel(GeneticAlgorithmTestCase):
+    """Тесты для класса IslandModel"""
+
+    def setUp(self):
+        super().setUp()
+        random.seed(11)
+        # Небольшие острова; epsilon=0, чтобы стагнацией считалось отсутствие любого роста
+        self.characteristics.update(population_size=12, size_to_generate=12, desired_population_size=10, epsilon=0, max_iterations=12)
+
+    def make_model(self, **kwargs):
+        return IslandModel(
+            num_islands=3,
+            genetic_characteristics=self.make_characteristics(population_backend=kwargs.pop('population_backend', 'entity')),
+            migration_chance=1.0,
+            migrants_percent=0.2,
+            migration_pairs=2,
+            **kwargs
+        )
+
+    def check_result(self, model):
+        best_entity = model.best_entity_overall
+        self.assertTrue(best_entity.check_validity())
+        self.assertEqual(best_entity.get_fitness(), np.dot(best_entity.current_state, model.genetic_characteristics.costs))
+        self.assertEqual(len(model.best_fitness_history), self.characteristics['max_iterations'])
+        self.assertEqual(model.best_fitness_history[-1], best_entity.get_fitness())
+        self.assertEqual(model.best_fitness_history, sorted(model.best_fitness_history))
+        self.assertGreaterEqual(model.upper_bound, best_entity.get_fitness())
+        self.assertAlmostEqual(model.get_optimality_gap(), (model.upper_bound - best_entity.get_fitness()) / model.upper_bound)
+        for history in model.island_fitness_history:
+            self.assertEqual(len(history), self.characteristics['max_iterations'])
+            self.assertLessEqual(max(history), best_entity.get_fitness())
+
+    def test_serial_epochs(self):
+        """Последовательный режим с миграцией раз в эпоху"""
+        model = self.make_model(epoch_length=4)
+        model.start_algorithm()
+        self.check_result(model)
+
+    def test_process_execution(self):
+        """Острова в отдельных процессах, мигранты передаются массивами геномов"""
+        for population_backend in ('entity', 'array'):
+            model = self.make_model(execution='process', epoch_length=5, seed=3, population_backend=population_backend)
+            self.assertEqual(model.islands, [])
+            model.start_algorithm()
+            self.check_result(model)
+
+    def test_process_execution_is_reproducible(self):
+        """При заданном seed результат не зависит от планирования процессов"""
+        first = self.make_model(execution='process', epoch_length=3, seed=5)
+        first.start_algorithm()
+        second = self.make_model(execution='process', epoch_length=3, seed=5)
+        second.start_algorithm()
+        self.assertEqual(first.island_fitness_history, second.island_fitness_history)
+
+    def test_async_migration(self):
+        """Асинхронная миграция по топологиям без синхронизации островов"""
+        for topology in ('ring', 'torus', 'star', 'full'):
+            model = self.make_model(execution='process', migration='async', topology=topology, epoch_length=2, seed=7)
+            model.start_algorithm()
+            self.check_result(model)
+
+    def test_migration_policies(self):
+        """Лучшие эмигранты заменяют худших особей, размер популяции получателя не растет"""
+        model = self.make_model(emigrant_policy='best', immigrant_policy='worst')
+        model.migration_manager.get_migration_pairs = lambda: [(0, 1)]
+        source, target = model.islands[0].population, model.islands[1].population
+        sizes = len(source), len(target)
+        source_best = source.get_population_fitness()[1]
+        target_worst = min(target.get_fitness_array())
+
+        model._perform_migration(0)
+        self.assertEqual((len(source), len(target)), (sizes[0] - int(0.2 * sizes[0]), sizes[1]))
+        self.assertGreaterEqual(target.get_population_fitness()[1], source_best)
+        self.assertGreaterEqual(min(target.get_fitness_array()), target_worst)
+
+        for population_backend in ('entity', 'array'):
+            model = self.make_model(emigrant_policy='tournament', immigrant_policy='worst', epoch_length=3, population_backend=population_backend)
+            model.start_algorithm()
+            self.check_result(model)
+
+        model = self.make_model(execution='process', emigrant_policy='diversity', immigrant_policy='random', epoch_length=4, seed=2)
+        model.start_algorithm()
+        self.check_result(model)
+
+    def check_early_stop(self, model, reason):
+        statistics = model.get_statistics()
+        self.assertEqual(statistics['stop_reason'], reason)
+        self.assertLess(statistics['iterations'], self.characteristics['max_iterations'])
+        self.assertEqual(statistics['iterations'], len(model.best_fitness_history))
+        self.assertEqual(statistics['best_fitness'], model.best_fitness_history[-1])
+        self.assertEqual(model.best_fitness_history[statistics['convergence_iteration'] - 1], statistics['best_fitness'])
+        self.assertGreater(statistics['wall_time'], 0)
+        for history in model.island_fitness_history:
+            self.assertEqual(len(history), statistics['iterations'])
+        return statistics
+
+    def test_convergence_stopping(self):
+        """Остановка по глобальной стагнации, цели и выводу островов"""
+        self.characteristics['max_iterations'] = 200
+        model = self.make_model(global_stagnation=5)
+        model.start_algorithm()
+        statistics = self.check_early_stop(model, 'stagnation')
+        self.assertEqual(statistics['iterations'] - model.convergence.improved_iteration, 5)
+
+        model = self.make_model(target=1)
+        model.start_algorithm()
+        self.check_early_stop(model, 'target')
+        self.assertEqual(model.get_statistics()['iterations'], 1)
+
+        model = self.make_model(island_stagnation=4, execution='process', epoch_length=2, seed=4)
+        model.start_algorithm()
+        statistics = self.check_early_stop(model, 'islands_retired')
+        self.assertEqual(statistics['retired_islands'], [0, 1, 2])
+
+        self.characteristics['max_iterations'] = 100000
+        model = self.make_model(time_limit=0.2, execution='process', migration='async', seed=4)
+        model.start_algorithm()
+        self.check_early_stop(model, 'time_limit')
+
+    def test_dp_target_uses_cache(self):
+        """target='dp' берет оптимум из DPCache и считает DP только при промахе"""
+        characteristics = self.make_characteristics()
+        optimum, _ = DPSolver(characteristics.min_vals, characteristics.weights, characteristics.costs, characteristics.max_weight).solve()
+        with tempfile.TemporaryDirectory() as directory:
+            dp_cache = DPCache(directory)
+            self.assertEqual(self.make_model(target='dp', dp_cache=dp_cache).target, optimum)
+            self.assertEqual(self.make_model(target='dp', dp_cache=dp_cache).target, optimum)
+            self.assertEqual((dp_cache.misses, dp_cache.hits), (1, 1))
+
+    def test_statistics_without_early_stop(self):
+        """Без критериев остановки выполняются все поколения"""
+        self.assertEqual(self.make_model(target='bound').target, self.make_model().upper_bound)
+        model = self.make_model()
+        model.start_algorithm()
+        self.check_result(model)
+        statistics = model.get_statistics()
+        self.assertEqual(statistics['stop_reason'], 'max_iterations')
+        self.assertEqual(statistics['island_best_fitness'], [history[-1] for history in model.island_fitness_history])
+        self.assertIs(statistics['best_entity'], model.best_entity_overall)
+
+    def test_failing_island_process(self):
+        """Исключение в процессе острова поднимается в главном процессе, как в последовательном режиме"""
+        characteristics = self.make_characteristics()
+        # Популяция после пополнения меньше desired_population_size: отбор вызывает ValueError
+        characteristics.desired_population_size = characteristics.population_size + 6
+
+        for kwargs in ({}, {'execution': 'process', 'seed': 1}, {'execution': 'process', 'migration': 'async', 'seed': 1}):
+            model = IslandModel(
+                num_islands=2,
+                genetic_characteristics=characteristics,
+                migration_chance=1.0,
+                migrants_percent=0.2,
+                migration_pairs=1,
+                **kwargs
+            )
+            with self.assertRaises(ValueError):
+                model.start_algorithm()
+            self.assertEqual(getattr(model, '_workers', []), [])
+
+    def test_invalid_configuration(self):
+        """Некорректный режим выполнения вызывает ValueError"""
+        with self.assertRaises(ValueError):
+            self.make_model(execution='threads')
+        with self.assertRaises(ValueError):
+            self.make_model(epoch_length=0)
+        with self.assertRaises(ValueError):
+            self.make_model(migration='async')
+        with self.assertRaises(ValueError):
+            self.make_model(target='optimum')
+        with self.assertRaises(ValueError):
+            self.make_model(global_stagnation=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
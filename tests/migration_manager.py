@@ -0,0 +1,126 @@
+import unittest
+import random
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.MigrationManager import MigrationManager
+
+
+class TestMigrationManager(unittest.TestCase):
+    """Тесты для класса MigrationManager"""
+
+    def setUp(self):
+        random.seed(3)
+
+    def make_manager(self, topology, num_islands=6):
+        return MigrationManager(
+            migration_chance=1.0,
+            migrants_percent=0.2,
+            migration_pairs=20,
+            num_islands=num_islands,
+            topology=topology
+        )
+
+    def test_topologies(self):
+        """Соседи островов в каждой топологии"""
+        self.assertEqual([self.make_manager('ring').neighbours(i) for i in range(6)], [[1], [2], [3], [4], [5], [0]])
+
+        star = self.make_manager('star')
+        self.assertEqual(star.neighbours(0), [1, 2, 3, 4, 5])
+        self.assertEqual(star.neighbours(4), [0])
+
+        self.assertEqual(self.make_manager('full').neighbours(2), [0, 1, 3, 4, 5])
+
+        # Решетка 2 x 3: по вертикали единственный сосед, по горизонтали два
+        torus = self.make_manager('torus')
+        self.assertEqual(torus.neighbours(0), [1, 2, 3])
+        self.assertEqual(torus.neighbours(4), [1, 3, 5])
+        self.assertEqual(self.make_manager('torus', num_islands=9).neighbours(4), [1, 3, 5, 7])
+
+    def test_migration_pairs_follow_topology(self):
+        """Пары миграции соединяют только соседей"""
+        for topology in MigrationManager.TOPOLOGIES:
+            manager = self.make_manager(topology)
+            pairs = manager.get_migration_pairs()
+            self.assertEqual(len(pairs), 20)
+            for source, target in pairs:
+                self.assertIn(target, manager.neighbours(source))
+
+    def test_select_migrants(self):
+        """Мигранты выбираются по индексам, Entity не сравниваются между собой"""
+        class Incomparable:
+            def __lt__(self, other):
+                raise TypeError("Entity не должны сравниваться")
+            __gt__ = __lt__
+
+        manager = self.make_manager('ring')
+        indices = manager.select_migrant_indices(50)
+        self.assertEqual(len(indices), 10)
+        self.assertEqual(len(set(indices)), 10)
+        self.assertTrue(all(0 <= index < 50 for index in indices))
+
+        entities = [Incomparable() for _ in range(50)]
+        migrants = manager.select_migrants(entities)
+        self.assertEqual([index for index, _ in migrants], sorted((index for index, _ in migrants), reverse=True))
+        for index, entity in migrants:
+            self.assertIs(entity, entities[index])
+
+    def make_policy_manager(self, emigrant_policy='random', immigrant_policy='append'):
+        return MigrationManager(
+            migration_chance=1.0,
+            migrants_percent=0.25,
+            migration_pairs=1,
+            num_islands=2,
+            emigrant_policy=emigrant_policy,
+            immigrant_policy=immigrant_policy,
+            tournament_size=3
+        )
+
+    def test_emigrant_policies(self):
+        """Эмигранты выбираются по массиву fitness без повторов"""
+        fitness = np.array([5, 40, 12, 7, 33, 1, 25, 18, 9, 30, 2, 14])
+
+        best = self.make_policy_manager('best').select_emigrant_indices(fitness)
+        self.assertEqual(sorted(fitness[best]), [30, 33, 40])
+
+        # Победитель каждого из трех непересекающихся турниров - лучший в своем турнире
+        for _ in range(20):
+            winners = self.make_policy_manager('tournament').select_emigrant_indices(fitness)
+            self.assertEqual(len(set(winners.tolist())), 3)
+            self.assertNotIn(5, winners)
+            self.assertGreaterEqual(np.sort(fitness[winners])[0], np.sort(fitness)[2])
+
+        genomes = np.zeros((12, 3), dtype=np.int64)
+        genomes[[2, 7, 10]] = [[9, 0, 0], [0, 8, 0], [0, 0, 10]]
+        diverse = self.make_policy_manager('diversity').select_emigrant_indices(fitness, genomes)
+        self.assertEqual(sorted(diverse.tolist()), [2, 7, 10])
+
+        randomly = self.make_policy_manager().select_emigrant_indices(fitness)
+        self.assertEqual(len(set(randomly.tolist())), 3)
+
+    def test_immigrant_policies(self):
+        """Мигранты заменяют худших или случайных особей, 'append' ничего не заменяет"""
+        fitness = np.array([5, 40, 12, 7, 33, 1])
+
+        self.assertEqual(self.make_policy_manager().select_replaced_indices(fitness, 2).size, 0)
+        worst = self.make_policy_manager(immigrant_policy='worst').select_replaced_indices(fitness, 2)
+        self.assertEqual(sorted(worst.tolist()), [0, 5])
+        replaced = self.make_policy_manager(immigrant_policy='random').select_replaced_indices(fitness, 10)
+        self.assertEqual(sorted(replaced.tolist()), list(range(6)))
+
+        with self.assertRaises(ValueError):
+            self.make_policy_manager(emigrant_policy='oldest')
+        with self.assertRaises(ValueError):
+            self.make_policy_manager(immigrant_policy='best')
+
+    def test_unknown_topology(self):
+        """Неизвестная топология вызывает ValueError"""
+        with self.assertRaises(ValueError):
+            self.make_manager('hypercube')
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
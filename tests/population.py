@@ -1,5 +1,9 @@
 import unittest
+import random
+import numpy as np
 from functions.population import run_outbreeding_k_times, two_point_crossover, tournament_population, get_fitness
+from classes.Population import Population
+from tests.helpers import make_entity
 
 class TestPopulationFunctions(unittest.TestCase):
     def test_run_outbreeding_k_times(self):
@@ -74,5 +78,78 @@ class TestPopulationFunctions(unittest.TestCase):
         for individual in new_population:
             self.assertIn(individual, population)
 
+
+class TestPopulationCrossover(unittest.TestCase):
+    """Тесты скрещивания с заранее вычисленными fitness и весом"""
+
+    params = dict(weights=[1, 2, 3, 4, 5, 6], costs=[6, 5, 4, 3, 2, 1], max_weight=30)
+
+    def test_feasible_crossover(self):
+        """Возвращаются только допустимые потомки с верными fitness и весом"""
+        random.seed(1)
+        population = Population([], desired_amount=2, tournament_size=2)
+        parent1 = make_entity([6, 5, 1, 0, 0, 0], **self.params)
+        parent2 = make_entity([0, 0, 0, 1, 1, 3], **self.params)
+
+        sizes = set()
+        for _ in range(200):
+            children = population.feasible_crossover(parent1, parent2)
+            sizes.add(len(children))
+            for child in children:
+                self.assertEqual(child.get_fitness(), np.dot(child.current_state, child.costs))
+                self.assertEqual(child.get_current_weight(), np.dot(child.current_state, child.weights))
+                self.assertTrue(child.check_validity())
+        self.assertTrue({0, 1} & sizes)
+        self.assertIn(2, sizes)
+
+
+
+class TestPopulationBest(unittest.TestCase):
+    """Тесты поддержки лучшей особи без пересканирования популяции"""
+
+    params = dict(weights=[1, 1], costs=[3, 1])
+
+    def test_running_best(self):
+        """Лучшая особь обновляется при добавлении и удалении"""
+        entities = [make_entity(state, **self.params) for state in ([1, 0], [2, 1], [0, 5], [3, 0])]
+        population = Population(entities, desired_amount=2, tournament_size=2)
+        self.assertEqual(population.get_population_fitness(), (entities[3], 9))
+
+        population.remove_entities([0])
+        self.assertEqual(population.get_population_fitness(), (entities[3], 9))
+        self.assertIs(population.entities[population._best_index], entities[3])
+
+        population.remove_entities([2])
+        self.assertEqual(population.get_population_fitness(), (entities[1], 7))
+
+        best = make_entity([10, 0], **self.params)
+        population.add_entities([make_entity([0, 1], **self.params), best])
+        self.assertEqual(population.get_population_fitness(), (best, 30))
+
+        population.remove_entities([0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            population.get_population_fitness()
+
+    def test_pop_entities(self):
+        """Удаление перестановкой с конца возвращает мигрантов и сохраняет лучшую особь"""
+        entities = [make_entity([i, 0], **self.params) for i in (4, 1, 9, 2, 7, 3)]
+        population = Population(list(entities), desired_amount=2, tournament_size=2)
+
+        popped = population.pop_entities([0, 4])
+        self.assertEqual([entity.current_state[0] for entity in popped], [7, 4])
+        self.assertEqual(len(population), 4)
+        self.assertEqual({entity.current_state[0] for entity in population.entities}, {1, 9, 2, 3})
+        self.assertEqual(population.get_population_fitness(), (entities[2], 27))
+
+        # Лучшая особь последняя и переезжает на место удаленной
+        population.add_entities([make_entity([12, 0], **self.params)])
+        population.pop_entities([1])
+        self.assertEqual(population._best_index, 1)
+        self.assertEqual(population.get_population_fitness()[1], 36)
+
+        population.pop_entities([1])
+        self.assertEqual(population.get_population_fitness(), (entities[2], 27))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,88 @@
+import unittest
+import random
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.RepairOperator import RepairOperator, GreedyRepair, make_repair_operator
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestGreedyRepair(unittest.TestCase):
+    """Тесты для оператора восстановления GreedyRepair"""
+
+    def setUp(self):
+        random.seed(5)
+        self.min_vals = np.array([1, 0, 2, 0])
+        self.weights = np.array([3, 5, 2, 4])
+        self.costs = np.array([10, 20, 7, 2])
+        self.max_weight = 40
+        self.operator = GreedyRepair(self.min_vals, self.weights, self.costs, self.max_weight)
+
+    def test_repair_restores_feasibility(self):
+        """Перегруженные строки становятся допустимыми, допустимые не меняются"""
+        genomes = np.random.default_rng(0).integers(0, 8, size=(300, 4)) + self.min_vals
+        fitness, weight = genomes @ self.costs, genomes @ self.weights
+        before = genomes.copy()
+
+        repaired = self.operator.repair(genomes, fitness, weight)
+
+        overweight = before @ self.weights > self.max_weight
+        np.testing.assert_array_equal(repaired, overweight)
+        np.testing.assert_array_equal(genomes[~overweight], before[~overweight])
+        self.assertTrue(np.all(genomes @ self.weights <= self.max_weight))
+        self.assertTrue(np.all(genomes >= self.min_vals))
+        self.assertTrue(np.all(genomes <= before))
+        np.testing.assert_array_equal(fitness, genomes @ self.costs)
+        np.testing.assert_array_equal(weight, genomes @ self.weights)
+
+    def test_drops_worst_ratio_first(self):
+        """Первыми убираются предметы с наименьшим отношением стоимости к весу"""
+        genomes = np.array([[1, 3, 2, 6]])
+        fitness, weight = genomes @ self.costs, genomes @ self.weights
+        self.operator.repair(genomes, fitness, weight)
+        np.testing.assert_array_equal(genomes, [[1, 3, 2, 4]])
+
+    def test_make_repair_operator(self):
+        """Создание оператора по названию режима"""
+        self.assertIsNone(make_repair_operator('discard', self.min_vals, self.weights, self.costs, self.max_weight))
+        self.assertIsInstance(make_repair_operator('greedy', self.min_vals, self.weights, self.costs, self.max_weight), GreedyRepair)
+        with self.assertRaises(ValueError):
+            make_repair_operator('unknown', self.min_vals, self.weights, self.costs, self.max_weight)
+        # Базовый класс абстрактный
+        with self.assertRaises(TypeError):
+            RepairOperator()
+
+
+class TestGeneticAlgorithmRepair(GeneticAlgorithmTestCase):
+    """Генетический алгоритм с восстановлением потомков"""
+
+    def test_genetic_algorithm_with_repair(self):
+        """Генетический алгоритм с восстановлением потомков и счетчиками пополнения"""
+        for population_backend, offspring_mode in (('entity', 'sequential'), ('array', 'sequential'), ('array', 'batch')):
+            algorithm = self.make_algorithm(
+                max_iterations=20,
+                desired_population_size=15,
+                population_backend=population_backend,
+                offspring_mode=offspring_mode,
+                repair='greedy'
+            )
+            for _ in range(20):
+                algorithm.next_iteration()
+
+            best_entity, best_fitness = algorithm.get_best_entity()
+            self.assertTrue(best_entity.check_validity())
+            self.assertEqual(best_fitness, np.dot(best_entity.current_state, algorithm.genetic_characteristics.costs))
+            self.assertTrue(all(entity.check_validity() for entity in algorithm.get_population_entities()))
+
+            self.assertEqual(len(algorithm.refill_history), 20)
+            stats = algorithm.refill_stats
+            self.assertGreaterEqual(stats['accepted'], 25 - 15)
+            self.assertLessEqual(stats['feasible'], stats['children'])
+            self.assertAlmostEqual(stats['acceptance_rate'], stats['feasible'] / stats['children'])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+import unittest
+import random
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from classes.Selection import (
+    SelectionStrategy, TournamentSelection, StochasticUniversalSampling, LinearRankSelection,
+    TruncationSelection, PlusSelection, CommaSelection, make_selection_strategy, select_with_elite
+)
+from tests.helpers import GeneticAlgorithmTestCase
+
+
+class TestTournamentSelection(unittest.TestCase):
+    """Тесты для векторного турнирного отбора"""
+
+    def setUp(self):
+        random.seed(17)
+        self.rng = np.random.default_rng(17)
+
+    def test_select_shape_and_pressure(self):
+        """Возвращается массив индексов, отбор смещен к лучшим особям"""
+        fitness = self.rng.integers(0, 1000, size=500)
+        winners = TournamentSelection(4, self.rng).select(fitness, 300)
+        self.assertEqual(winners.shape, (300,))
+        self.assertTrue(np.issubdtype(winners.dtype, np.integer))
+        self.assertTrue(np.all((winners >= 0) & (winners < 500)))
+        self.assertGreater(fitness[winners].mean(), fitness.mean())
+
+    def test_tournament_size_one_is_uniform(self):
+        """Турнир из одного участника - равномерный выбор"""
+        fitness = np.arange(10)
+        winners = TournamentSelection(1, self.rng).select(fitness, 20000)
+        counts = np.bincount(winners, minlength=10)
+        self.assertTrue(np.all(np.abs(counts - 2000) < 300))
+
+    def test_random_tie_breaking(self):
+        """При равных fitness победитель выбирается случайно"""
+        fitness = np.array([7, 7, 7, 7])
+        winners = TournamentSelection(4, self.rng).select(fitness, 8000)
+        counts = np.bincount(winners, minlength=4)
+        self.assertTrue(np.all(np.abs(counts - 2000) < 250))
+
+    def test_tournament_larger_than_population(self):
+        """Турнир больше популяции допустим: участники выбираются с возвращением"""
+        winners = TournamentSelection(6, self.rng).select(np.arange(5), 3)
+        self.assertEqual(winners.shape, (3,))
+        self.assertTrue(np.all((winners >= 0) & (winners < 5)))
+
+        # Элита исключена из кандидатов, и их остается меньше, чем участников турнира
+        fitness = np.array([1, 9, 3, 8, 7])
+        selected = select_with_elite(TournamentSelection(4, self.rng), fitness, 5, elite=2)
+        self.assertEqual(selected.shape, (5,))
+        self.assertEqual(set(selected[:2].tolist()), {1, 3})
+        self.assertTrue(set(selected[2:].tolist()) <= {0, 2, 4})
+
+    def test_large_population(self):
+        """Отбор из популяции 10^5 выполняется одним векторным проходом"""
+        fitness = self.rng.integers(0, 10 ** 6, size=10 ** 5)
+        winners = TournamentSelection(5, self.rng).select(fitness, 10 ** 5)
+        self.assertEqual(len(winners), 10 ** 5)
+
+
+
+class TestSelectionStrategies(unittest.TestCase):
+    """Тесты для SUS, рангового, усеченного и элитарного отбора"""
+
+    def setUp(self):
+        random.seed(23)
+        self.rng = np.random.default_rng(23)
+        self.fitness = np.array([10, 0, 30, 20, 40, 0, 50, 30])
+
+    def test_stochastic_universal_sampling(self):
+        """Число копий каждой особи отличается от ожидаемого меньше чем на 1"""
+        amount = 36
+        expected = self.fitness / self.fitness.sum() * amount
+        for _ in range(50):
+            counts = np.bincount(StochasticUniversalSampling(self.rng).select(self.fitness, amount), minlength=len(self.fitness))
+            self.assertEqual(counts.sum(), amount)
+            self.assertTrue(np.all(np.abs(counts - expected) < 1))
+
+    def test_linear_rank_selection(self):
+        """Давление 1 - равномерный выбор, при давлении 2 худшая особь не выбирается"""
+        fitness = np.arange(8) * 3
+        counts = np.bincount(LinearRankSelection(1.0, self.rng).select(fitness, 800), minlength=8)
+        self.assertTrue(np.all(np.abs(counts - 100) <= 1))
+
+        counts = np.bincount(LinearRankSelection(2.0, self.rng).select(fitness, 800), minlength=8)
+        self.assertEqual(counts[0], 0)
+        self.assertTrue(np.all(np.diff(counts) > 0))
+
+        with self.assertRaises(ValueError):
+            LinearRankSelection(2.5)
+
+    def test_truncation_selection(self):
+        """Выбираются только лучшие proportion особей"""
+        selected = TruncationSelection(0.25, self.rng).select(self.fitness, 100)
+        self.assertEqual(set(selected.tolist()), {4, 6})
+
+    def test_plus_and_comma_selection(self):
+        """(μ+λ) берет лучших из всех, (μ,λ) - лучших потомков"""
+        self.assertEqual(set(PlusSelection(self.rng).select(self.fitness, 2).tolist()), {4, 6})
+        self.assertEqual(set(CommaSelection(self.rng).select(self.fitness, 2, offspring_start=4).tolist()), {4, 6})
+        # Потомков меньше, чем мест: добавляются лучшие родители
+        self.assertEqual(set(CommaSelection(self.rng).select(self.fitness, 5, offspring_start=5).tolist()), {5, 6, 7, 4, 2})
+
+    def test_make_selection_strategy(self):
+        """Создание стратегии по названию"""
+        self.assertIsInstance(make_selection_strategy('tournament', 3), TournamentSelection)
+        strategy = make_selection_strategy('truncation', 3, {'proportion': 0.3})
+        self.assertEqual(strategy.proportion, 0.3)
+        with self.assertRaises(ValueError):
+            make_selection_strategy('roulette', 3)
+        # Базовый класс абстрактный
+        with self.assertRaises(TypeError):
+            SelectionStrategy(self.rng)
+
+    def test_elitism(self):
+        """Лучшие особи переносятся в следующее поколение без отбора"""
+        fitness = self.rng.integers(0, 1000, size=50)
+        selected = select_with_elite(TruncationSelection(1.0, self.rng), fitness, 20, elite=3)
+        self.assertEqual(len(selected), 20)
+        self.assertEqual(set(fitness[selected[:3]]), set(np.sort(fitness)[-3:]))
+
+        # Элита не выбирается стратегиями без повторов второй раз
+        fitness = np.array([1, 9, 3, 8, 7, 2, 6])
+        selected = select_with_elite(PlusSelection(self.rng), fitness, 4, elite=2)
+        self.assertEqual(sorted(selected.tolist()), [1, 3, 4, 6])
+        selected = select_with_elite(CommaSelection(self.rng), fitness, 4, offspring_start=3, elite=2)
+        self.assertEqual(len(set(selected.tolist())), 4)
+        self.assertEqual(set(selected[:2].tolist()), {1, 3})
+        self.assertEqual(set(selected[2:].tolist()), {4, 6})
+        self.assertEqual(sorted(select_with_elite(PlusSelection(self.rng), fitness, 7, elite=3).tolist()), list(range(7)))
+
+
+class TestGeneticAlgorithmSelection(GeneticAlgorithmTestCase):
+    """Генетический алгоритм со стратегиями отбора"""
+
+    def test_genetic_algorithm_strategies(self):
+        """Генетический алгоритм работает с каждой стратегией отбора"""
+        for population_backend in ('entity', 'array'):
+            for selection in ('tournament', 'sus', 'rank', 'truncation', 'plus', 'comma'):
+                algorithm = self.make_algorithm(desired_population_size=15, population_backend=population_backend, selection=selection)
+                for _ in range(15):
+                    algorithm.next_iteration()
+                best_entity, best_fitness = algorithm.get_best_entity()
+                self.assertTrue(best_entity.check_validity())
+                self.assertEqual(len(algorithm.get_population_entities()), 15)
+
+    def test_elitism(self):
+        """С элитизмом лучший fitness популяции не убывает даже при (μ,λ)"""
+        for population_backend in ('entity', 'array'):
+            algorithm = self.make_algorithm(population_backend=population_backend, selection='comma', elitism=2)
+            history = []
+            for _ in range(20):
+                algorithm.next_iteration()
+                history.append(algorithm.population.get_population_fitness()[1])
+            self.assertEqual(history, sorted(history))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)